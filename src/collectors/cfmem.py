@@ -9,6 +9,7 @@ import base64
 from bs4 import BeautifulSoup
 from src.core.base_collector import BaseCollector
 from src.config.settings import MIN_NODE_LENGTH
+from src.utils.node_scanner import get_node_scanner
 
 
 class CfmemCollector(BaseCollector):
@@ -145,20 +146,9 @@ class CfmemCollector(BaseCollector):
 
     def extract_direct_nodes(self, content):
         """重写直接节点提取方法，只提取V2Ray节点"""
-        nodes = []
+        # 使用所有节点协议
+        from src.config.websites import NODE_SCHEMES
 
-        # 只使用V2Ray节点模式
-        # 使用所有节点模式
-        from src.config.websites import NODE_PATTERNS
-
-        for pattern in NODE_PATTERNS:
-            try:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    node = match.strip()
-                    if node and len(node) >= MIN_NODE_LENGTH:
-                        nodes.append(node)
-            except Exception as e:
-                self.logger.warning(f"节点匹配失败: {pattern} - {str(e)}")
+        nodes = get_node_scanner(NODE_SCHEMES).scan(content, MIN_NODE_LENGTH)
 
         return list(set(nodes))  # 去重
@@ -203,7 +203,6 @@ class ClashGithubCollector(BaseCollector):
                 try:
                     sub_nodes = self.get_nodes_from_subscription(link)
                     nodes.extend(sub_nodes)
-                    time.sleep(self.delay)
                 except Exception as e:
                     self.logger.warning(f"从订阅链接获取节点失败: {link} - {str(e)}")
 
@@ -8,6 +8,7 @@ import re
 import base64
 from bs4 import BeautifulSoup
 from src.core.base_collector import BaseCollector
+from src.utils.node_scanner import get_node_scanner
 
 
 class ClashNodeCCCollector(BaseCollector):
@@ -221,18 +222,11 @@ class ClashNodeCCCollector(BaseCollector):
         """重写直接节点提取方法"""
         nodes = []
 
-        # 使用标准节点模式
-        from src.config.websites import NODE_PATTERNS
+        # 使用标准节点协议
+        from src.config.websites import NODE_SCHEMES
 
-        for pattern in NODE_PATTERNS:
-            try:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    node = match.strip()
-                    if node and len(node) >= 50:  # 节点长度通常大于50
-                        nodes.append(node)
-            except Exception as e:
-                self.logger.warning(f"节点匹配失败: {pattern} - {str(e)}")
+        # 节点长度通常大于50
+        nodes.extend(get_node_scanner(NODE_SCHEMES).scan(content, 50))
 
         # 从代码块中提取
         code_patterns = [
@@ -9,6 +9,7 @@ import base64
 from datetime import datetime
 from bs4 import BeautifulSoup
 from src.core.base_collector import BaseCollector
+from src.utils.node_scanner import get_node_scanner
 from src.config.websites import UNIVERSAL_SELECTORS
 
 
@@ -128,77 +129,11 @@ class DatiyaCollector(BaseCollector):
         parser = get_subscription_parser()
         return parser.parse_subscription_url(subscription_url, self.session)
 
-    def _extract_datiya_yaml_nodes(self, content):
-        """从Datiya的YAML格式提取节点"""
-        nodes = []
-        try:
-            import yaml
-
-            yaml_data = yaml.safe_load(content)
-
-            if "proxies" in yaml_data:
-                proxies = yaml_data["proxies"]
-                for proxy in proxies:
-                    try:
-                        node = self._convert_clash_proxy_to_node(proxy)
-                        if node and len(node) >= 50:
-                            nodes.append(node)
-                    except Exception as e:
-                        self.logger.debug(f"代理转换失败: {str(e)}")
-
-            self.logger.info(f"从Datiya YAML解析获取到 {len(nodes)} 个节点")
-
-        except Exception as e:
-            self.logger.error(f"YAML解析失败: {str(e)}")
-            try:
-                import re
-
-                proxy_pattern = r"  - \{([^}]+)\}"
-                matches = re.findall(proxy_pattern, content)
-
-                for match in matches:
-                    try:
-                        kv_pattern = r"([a-zA-Z-]+):\s*([^,}]+)"
-                        kv_pairs = re.findall(kv_pattern, match)
-                        proxy = dict(kv_pairs)
-
-                        if "port" in proxy:
-                            proxy["port"] = int(proxy["port"])
-                        if "skip-cert-verify" in proxy:
-                            proxy["skip-cert-verify"] = (
-                                proxy["skip-cert-verify"].lower() == "true"
-                            )
-                        if "tls" in proxy:
-                            proxy["tls"] = proxy["tls"].lower() == "true"
-
-                        node = self._convert_clash_proxy_to_node(proxy)
-                        if node and len(node) >= 50:
-                            nodes.append(node)
-                    except Exception as e:
-                        self.logger.debug(f"YAML fallback解析失败: {str(e)}")
-
-                self.logger.info(f"从YAML fallback解析获取到 {len(nodes)} 个节点")
-
-            except Exception as fallback_e:
-                self.logger.error(f"YAML fallback解析也失败: {str(fallback_e)}")
-
-        return nodes
-
     def extract_direct_nodes(self, content):
         """从文章内容提取直接节点"""
-        nodes = []
+        from src.config.websites import NODE_SCHEMES
 
-        from src.config.websites import NODE_PATTERNS
-
-        for pattern in NODE_PATTERNS:
-            try:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    node = match.strip()
-                    if len(node) >= 50:
-                        nodes.append(node)
-            except Exception as e:
-                self.logger.warning(f"节点匹配失败: {pattern} - {str(e)}")
+        nodes = get_node_scanner(NODE_SCHEMES).scan(content, 50)
 
         return list(set(nodes))
 
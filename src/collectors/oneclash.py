@@ -4,12 +4,12 @@
 OneClash 爬虫
 """
 
+import asyncio
 import re
-import time
 import random
 from datetime import datetime
 from bs4 import BeautifulSoup
-from src.core.base_collector import BaseCollector
+from src.core.async_base_collector import AsyncBaseCollector
 from src.config.websites import (
     SUBSCRIPTION_PATTERNS,
     SUBSCRIPTION_KEYWORDS,
@@ -17,34 +17,34 @@ from src.config.websites import (
 )
 
 
-class OneClashCollector(BaseCollector):
+class OneClashCollector(AsyncBaseCollector):
     """OneClash 专用爬虫"""
 
     def __init__(self, site_config):
         super().__init__(site_config)
-        # 添加额外的请求头以绕过反爬虫
-        self.session.headers.update(
-            {
-                "Referer": "https://oneclash.cc/",
-                "Origin": "https://oneclash.cc",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "same-origin",
-                "Sec-Fetch-User": "?1",
-            }
-        )
+        # 添加额外的请求头以绕过反爬虫（同步会话和异步会话都使用）
+        extra_headers = {
+            "Referer": "https://oneclash.cc/",
+            "Origin": "https://oneclash.cc",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "same-origin",
+            "Sec-Fetch-User": "?1",
+        }
+        self.session.headers.update(extra_headers)
+        self.async_request_handler.headers.update(extra_headers)
 
-    def _make_request(self, url, method="GET", **kwargs):
-        """重写请求方法，添加随机延迟"""
+    async def _make_request_async(self, url):
+        """重写异步请求方法，添加随机延迟（不阻塞事件循环）"""
         # 添加随机延迟以模拟人类行为
-        time.sleep(random.uniform(1, 2))
+        await asyncio.sleep(random.uniform(1, 2))
 
         # 调用父类方法
-        return super()._make_request(url, method, **kwargs)
+        return await super()._make_request_async(url)
 
-    def _get_latest_article_url(self):
-        """获取最新文章URL - 实现抽象方法"""
-        return self.get_latest_article_url()
+    async def _get_latest_article_url(self):
+        """获取最新文章URL - 实现抽象方法（异步）"""
+        return await self.get_latest_article_url()
 
     def find_subscription_links(self, content):
         """查找订阅链接"""
@@ -36,6 +36,14 @@ __all__ = [
     "GIT_NAME",
     "CONNECTION_TIMEOUT",
     "MAX_WORKERS",
+    "CONCURRENT_COLLECTION",
+    "SUBSCRIPTION_CONCURRENCY",
+    "SUBSCRIPTION_PER_HOST_LIMIT",
+    "STREAMING_PIPELINE",
+    "BROWSER_POOL_SIZE",
+    "BROWSER_LOAD_PROFILE",
+    "V2RAYSE_CAPTURE_MODE",
+    "V2RAYSE_API_TIMEOUT",
     "REQUEST_TIMEOUT",
     "REQUEST_DELAY",
     "REQUEST_RETRY",
@@ -60,15 +68,30 @@ __all__ = [
     "API_HOST",
     "API_PORT",
     "DEBUG",
+    "DEBUG_ARTIFACTS",
+    "DEBUG_ARTIFACT_RUNS",
+    "DEBUG_DIR",
     "BATCH_SIZE",
     "CACHE_TTL",
+    "HTTP_CACHE_ENABLED",
+    "HTTP_CACHE_DIR",
+    "HTTP_CACHE_MAX_AGE",
+    "PARSE_CACHE_PERSIST",
+    "PARSE_CACHE_FILE",
+    "BROWSER_STATE_ENABLED",
+    "BROWSER_STATE_DIR",
+    "BROWSER_STATE_TTL",
     "WEBSITES",
     "SUBSCRIPTION_PATTERNS",
+    "NODE_SCHEMES",
     "NODE_PATTERNS",
     "BROWSER_ONLY_SITES",
+    "DEFAULT_RATE_LIMIT",
+    "HOST_RATE_LIMITS",
     "EXCLUDED_SUBSCRIPTION_PATTERNS",
     "SUBSCRIPTION_KEYWORDS",
     "CODE_BLOCK_SELECTORS",
+    "ARTICLE_READY_SELECTORS",
     "BASE64_PATTERNS",
     "TIME_SELECTORS",
     "UNIVERSAL_SELECTORS",
@@ -17,6 +17,14 @@ GIT_NAME = "GitHub Action"
 # 测试配置
 CONNECTION_TIMEOUT = 5  # 连接超时时间（秒）
 MAX_WORKERS = 10  # 最大并发测试线程数
+CONCURRENT_COLLECTION = os.getenv("CONCURRENT_COLLECTION", "True").lower() == "true"  # 阶段1并发收集
+SUBSCRIPTION_CONCURRENCY = int(os.getenv("SUBSCRIPTION_CONCURRENCY", str(MAX_WORKERS)))  # 阶段2订阅并发数
+SUBSCRIPTION_PER_HOST_LIMIT = int(os.getenv("SUBSCRIPTION_PER_HOST_LIMIT", "2"))  # 单主机并发上限
+STREAMING_PIPELINE = os.getenv("STREAMING_PIPELINE", "True").lower() == "true"  # 阶段1/2流水线执行
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "3"))  # 共享浏览器同时打开的页面数
+BROWSER_LOAD_PROFILE = os.getenv("BROWSER_LOAD_PROFILE", "lean")  # 浏览器页面加载方案: lean / full
+V2RAYSE_CAPTURE_MODE = os.getenv("V2RAYSE_CAPTURE_MODE", "api")  # V2RaySE节点获取方式: api（拦截接口响应，失败时回退页面操作） / ui
+V2RAYSE_API_TIMEOUT = int(os.getenv("V2RAYSE_API_TIMEOUT", "30"))  # 等待V2RaySE节点接口响应的超时时间（秒）
 
 # 请求配置
 REQUEST_TIMEOUT = 60  # 请求超时时间（秒）
@@ -59,7 +67,18 @@ API_PORT = 8080
 
 # 调试配置
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+DEBUG_ARTIFACTS = os.getenv("DEBUG_ARTIFACTS", "full" if DEBUG else "off")  # 调试文件级别: off / html / full（含截图）
+DEBUG_ARTIFACT_RUNS = int(os.getenv("DEBUG_ARTIFACT_RUNS", "5"))  # 保留最近几次运行的调试文件
+DEBUG_DIR = os.path.join(DATA_DIR, "debug")  # 调试文件目录
 
 # 性能配置
 BATCH_SIZE = 100  # 批处理大小
 CACHE_TTL = 3600  # 缓存时间（秒）
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "True").lower() == "true"  # HTTP条件请求缓存
+HTTP_CACHE_DIR = os.path.join(DATA_DIR, "cache", "http")  # HTTP缓存目录
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", str(7 * 24 * 3600)))  # 本次未使用且超过该时间（秒）的HTTP缓存条目在运行结束时删除
+PARSE_CACHE_PERSIST = os.getenv("PARSE_CACHE_PERSIST", "False").lower() == "true"  # 持久化订阅解析缓存
+PARSE_CACHE_FILE = os.path.join(DATA_DIR, "cache", "parse_cache.json")  # 订阅解析缓存文件
+BROWSER_STATE_ENABLED = os.getenv("BROWSER_STATE_ENABLED", "True").lower() == "true"  # 按网站保存浏览器Cookie等存储状态
+BROWSER_STATE_DIR = os.path.join(DATA_DIR, "cache", "browser_state")  # 浏览器存储状态目录
+BROWSER_STATE_TTL = int(os.getenv("BROWSER_STATE_TTL", "86400"))  # 浏览器存储状态有效期（秒）
@@ -309,6 +309,19 @@ WEBSITES = {
     },
 }
 
+# 单主机访问频率限制（令牌桶）
+# - rate: 每秒补充的令牌数（<=0 表示不限速率）
+# - burst: 令牌桶容量，允许的突发请求数
+# - min_interval: 同一主机两次请求之间的最小间隔（秒）
+# DEFAULT_RATE_LIMIT 只用于上面各网站首页所在的主机（文章页面），
+# 网站配置中可通过 "rate_limit" 覆盖；其他主机不限速（并发由 SUBSCRIPTION_PER_HOST_LIMIT 控制）
+DEFAULT_RATE_LIMIT = {"rate": 0.5, "burst": 2, "min_interval": 1.0}
+
+# 不属于某个网站首页的公共主机（订阅文件托管）的访问频率限制
+HOST_RATE_LIMITS = {
+    "raw.githubusercontent.com": {"rate": 2.0, "burst": 5, "min_interval": 0.2},
+}
+
 # 通用选择器（当特定网站选择器失败时使用）
 UNIVERSAL_SELECTORS = [
     "article:first-child a",
@@ -383,16 +396,11 @@ EXCLUDED_SUBSCRIPTION_PATTERNS = [
     r"https?://[^/]+/[^/]+/[^/]+/[^/]+/[^/]+/[^/]+/",
 ]
 
-# 节点协议模式
-NODE_PATTERNS = [
-    r"(vmess://[^\s\n\r]+)",
-    r"(vless://[^\s\n\r]+)",
-    r"(trojan://[^\s\n\r]+)",
-    r"(hysteria2://[^\s\n\r]+)",
-    r"(hysteria://[^\s\n\r]+)",
-    r"(ss://[^\s\n\r]+)",
-    r"(ssr://[^\s\n\r]+)",
-]
+# 页面节点协议（提取时使用 src.utils.node_scanner 单次扫描）
+NODE_SCHEMES = ["vmess", "vless", "trojan", "hysteria2", "hysteria", "ss", "ssr"]
+
+# 节点协议模式（每个协议一个正则，保留给仍按模式逐个匹配的代码）
+NODE_PATTERNS = [rf"({scheme}://[^\s\n\r]+)" for scheme in NODE_SCHEMES]
 
 # 代码块选择器
 CODE_BLOCK_SELECTORS = [
@@ -402,6 +410,17 @@ CODE_BLOCK_SELECTORS = [
     r'<input[^>]*value="([^"]*(?:vmess|vless|trojan|hysteria|ss://)[^"]*)"',
 ]
 
+# 文章页面就绪选择器（浏览器访问时，出现任一元素即认为正文已加载）
+# 网站配置中可通过 "article_selectors" 覆盖；首页就绪使用网站配置的 "selectors"
+ARTICLE_READY_SELECTORS = [
+    "article",
+    ".entry-content",
+    ".post-content",
+    ".post-body",
+    "pre",
+    "code",
+]
+
 # Base64模式
 BASE64_PATTERNS = [
     r"([A-Za-z0-9+/]{50,}={0,2})",
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+异步爬虫基类
+在 BaseCollector 的解析能力之上提供基于 aiohttp 的异步插件契约，
+CollectorManager 可以在同一个事件循环中调度异步收集器和同步收集器
+"""
+
+import asyncio
+import inspect
+from typing import Any, Dict, Optional
+
+from bs4 import BeautifulSoup
+
+from src.config.websites import BROWSER_ONLY_SITES
+from src.core.base_collector import BaseCollector
+from src.core.handlers import AsyncRequestHandler
+from src.core.http_client import HttpClientRegistry
+
+
+def is_async_collector(collector) -> bool:
+    """判断收集器是否实现了异步插件契约（collect_links 为协程函数）"""
+    return inspect.iscoroutinefunction(getattr(collector, "collect_links", None))
+
+
+class AsyncBaseCollector(BaseCollector):
+    """
+    异步爬虫抽象类
+
+    子类的 collect_links 和 get_latest_article_url 为协程；
+    文章查找、订阅链接匹配等纯解析逻辑沿用 BaseCollector 的同步实现，
+    浏览器访问在线程中执行，不阻塞事件循环。
+    """
+
+    def __init__(self, site_config, http_client: Optional[HttpClientRegistry] = None):
+        super().__init__(site_config, http_client)
+
+        # 与同步会话保持相同的请求头和代理设置
+        proxy = self.session.proxies.get("https") or self.session.proxies.get("http")
+        self.async_request_handler = AsyncRequestHandler(
+            self.http_client,
+            self.timeout,
+            self.retry_count,
+            self.logger,
+            proxy=proxy,
+            headers=dict(self.session.headers),
+            scheduler=self.request_handler.scheduler,
+        )
+
+    def _is_browser_only(self) -> bool:
+        """是否只能通过浏览器访问"""
+        site_key = self.site_config.get("collector_key", self.site_config.get("name"))
+        return site_key in BROWSER_ONLY_SITES
+
+    async def _make_request_async(self, url: str) -> str:
+        """带重试机制的异步请求，返回响应文本"""
+        return await self.async_request_handler.fetch_text(url)
+
+    async def get_latest_article_url(self, target_date=None):
+        """获取文章URL，支持指定日期（异步）"""
+        try:
+            if self._is_browser_only():
+                self.logger.info(f"使用浏览器直接访问 (BROWSER_ONLY_SITES): {self.base_url}")
+                return await asyncio.to_thread(self._fetch_with_playwright, target_date)
+
+            self.logger.info(f"访问网站: {self.base_url}")
+            content = await self._make_request_async(self.base_url)
+            soup = BeautifulSoup(content, "html.parser")
+            article_url = self._find_article_from_soup(soup, target_date)
+
+            if not article_url:
+                self.logger.warning(f"{self.site_name}: 使用浏览器自动化重试")
+                article_url = await asyncio.to_thread(self._fetch_with_playwright, target_date)
+
+            if not article_url:
+                self.logger.warning(f"{self.site_name}: 未找到最新文章")
+                return None
+
+            return article_url
+
+        except Exception as e:
+            self.logger.error(f"{self.site_name}: 获取文章URL失败 - {str(e)}")
+            return None
+
+    async def collect_links(self) -> Dict[str, Any]:
+        """
+        阶段1：只收集文章链接和订阅链接，不解析节点（异步）
+
+        Returns:
+            包含文章URL和订阅链接的字典，结构与 BaseCollector.collect_links 相同
+        """
+        if not self.enabled:
+            self.logger.info(f"{self.site_name} 已禁用，跳过链接收集")
+            return {}
+
+        try:
+            self.logger.info(f"开始收集 {self.site_name} 的链接")
+
+            article_url = await self.get_latest_article_url()
+            if not article_url:
+                self.logger.warning(f"{self.site_name}: 未找到最新文章")
+                return {}
+
+            self.last_article_url = article_url
+
+            # 检查是否为特殊标记（直接订阅链接）
+            if article_url.endswith("#direct_subscription"):
+                subscription_url = article_url.replace("#direct_subscription", "")
+                self.logger.info(f"检测到直接订阅链接: {subscription_url}")
+                return {
+                    "article_url": article_url,
+                    "subscription_links": [subscription_url],
+                    "raw_data": "",
+                }
+
+            if self._is_browser_only():
+                self.logger.info(f"使用浏览器访问文章页面: {article_url}")
+                content = await asyncio.to_thread(self._fetch_article_with_browser, article_url)
+            else:
+                content = await self._make_request_async(article_url)
+
+            self.raw_data = content
+
+            subscription_links = self.find_subscription_links(content)
+            self.subscription_links = subscription_links
+
+            self.logger.info(f"{self.site_name}: 找到 {len(subscription_links)} 个订阅链接")
+
+            return {
+                "article_url": article_url,
+                "subscription_links": subscription_links,
+                "raw_data": content,
+            }
+
+        except Exception as e:
+            self.logger.error(f"{self.site_name}: 链接收集失败 - {str(e)}")
+            return {}
+        finally:
+            await self.async_request_handler.close()
+
+    def collect(self):
+        """收集节点的主方法（同步入口，供旧的单阶段流程调用）"""
+        return asyncio.run(self._collect_async())
+
+    async def _collect_async(self):
+        """异步完成文章发现，节点提取沿用同步实现"""
+        if not self.enabled:
+            self.logger.info(f"{self.site_name} 已禁用，跳过收集")
+            return []
+
+        try:
+            self.logger.info(f"开始收集 {self.site_name} 的节点")
+
+            article_url = await self.get_latest_article_url()
+            if not article_url:
+                self.logger.warning(f"{self.site_name}: 未找到最新文章")
+                return []
+
+            self.last_article_url = article_url
+
+            nodes = await asyncio.to_thread(self.extract_nodes_from_article, article_url)
+            self.save_raw_data(article_url)
+
+            self.logger.info(f"{self.site_name}: 收集到 {len(nodes)} 个节点")
+            return nodes
+
+        except Exception as e:
+            self.logger.error(f"{self.site_name}: 收集失败 - {str(e)}")
+            return []
+        finally:
+            await self.async_request_handler.close()
@@ -18,12 +18,18 @@ import urllib3
 # 禁用SSL警告
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-from playwright.sync_api import sync_playwright
-
 from src.config.settings import *
 from src.config.websites import *
 from src.utils.logger import get_logger
 from src.core.protocol_converter import get_converter
+from src.core.http_client import HttpClientRegistry, get_http_client
+from src.core.http_cache import get_http_cache
+from src.core.politeness import get_politeness_scheduler
+from src.core.browser_pool import get_browser_pool, get_load_profile
+from src.core.browser_state import state_key_for
+from src.core.debug_artifacts import get_debug_artifacts
+from src.core.decode_engine import DecodeHooks
+from src.utils.node_scanner import get_node_scanner
 from src.core.exceptions import (
     CollectorDisabledError,
     ArticleLinkNotFoundError,
@@ -38,7 +44,7 @@ from src.core.exceptions import (
 class BaseCollector(ABC):
     """基础爬虫抽象类"""
 
-    def __init__(self, site_config):
+    def __init__(self, site_config, http_client: Optional[HttpClientRegistry] = None):
         self.site_config = site_config
         self.site_name = site_config["name"]
         self.base_url = site_config["url"]
@@ -48,8 +54,9 @@ class BaseCollector(ABC):
         # 设置日志
         self.logger = get_logger(f"collector.{self.site_name}")
 
-        # 创建会话
-        self.session = requests.Session()
+        # 创建会话（挂载共享连接池，请求头和代理仍由本收集器独立管理）
+        self.http_client = http_client or get_http_client()
+        self.session = self.http_client.create_session()
 
         # 添加更真实的请求头以绕过反爬虫
         # 在GitHub Actions环境中使用随机真实的User-Agent和更完整的请求头
@@ -170,13 +177,22 @@ class BaseCollector(ABC):
         from src.core.handlers import RequestHandler, ArticleFinder, SubscriptionExtractor
 
         self.request_handler = RequestHandler(
-            self.session, self.timeout, self.retry_count, self.logger
+            self.session,
+            self.timeout,
+            self.retry_count,
+            self.logger,
+            http_cache=get_http_cache(),
+            scheduler=get_politeness_scheduler(),
         )
         self.article_finder = ArticleFinder(
             self.base_url, self.site_name, self.logger, self.site_config
         )
         self.subscription_extractor = SubscriptionExtractor(
-            self.logger, self.site_config, self.converter, MIN_NODE_LENGTH
+            self.logger,
+            self.site_config,
+            self.converter,
+            MIN_NODE_LENGTH,
+            hooks=self.get_decode_hooks(),
         )
 
     def _make_request(self, url, method="GET", **kwargs):
@@ -270,36 +286,7 @@ class BaseCollector(ABC):
             if site_key in BROWSER_ONLY_SITES:
                 # 直接使用浏览器访问（跳过代理尝试）
                 self.logger.info(f"使用浏览器访问文章页面: {article_url}")
-
-                # 临时禁用代理
-                original_proxies = self.session.proxies
-                self.session.proxies = {"http": None, "https": None}
-
-                try:
-                    with sync_playwright() as p:
-                        browser = p.chromium.launch(
-                            headless=True,
-                            args=["--no-sandbox", "--disable-dev-shm-usage"],
-                        )
-                        context = browser.new_context(
-                            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                            viewport={"width": 1920, "height": 1080},
-                            locale="zh-CN",
-                        )
-                        page = context.new_page()
-                        # 使用 domcontentloaded 避免 networkidle 超时
-                        page.goto(
-                            article_url, wait_until="domcontentloaded", timeout=90000
-                        )
-                        # 等待额外时间让JS执行
-                        page.wait_for_timeout(5000)
-                        content = page.content()
-                        browser.close()
-
-                    self.logger.info(f"浏览器访问成功，获取到 {len(content)} 字节内容")
-                finally:
-                    # 恢复代理设置
-                    self.session.proxies = original_proxies
+                content = self._fetch_article_with_browser(article_url)
             else:
                 response = self._make_request(article_url)
                 content = response.text
@@ -421,25 +408,8 @@ class BaseCollector(ABC):
         from src.config.websites import BROWSER_ONLY_SITES
 
         site_key = self.site_config.get("collector_key", self.site_config.get("name"))
-        if site_key in BROWSER_ONLY_SITES:
-            import os
-            from datetime import datetime as dt
-
-            debug_dir = os.path.join(os.getcwd(), "data", "debug")
-            os.makedirs(debug_dir, exist_ok=True)
-            debug_file = os.path.join(
-                debug_dir,
-                f"debug_{self.site_name}_{dt.now().strftime('%Y%m%d_%H%M%S')}.html",
-            )
-            try:
-                html_content = str(soup)
-                with open(debug_file, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                self.logger.info(
-                    f"💾 保存调试HTML到: {debug_file} ({len(html_content)} bytes)"
-                )
-            except Exception as e:
-                self.logger.warning(f"保存调试HTML失败: {str(e)}")
+        if site_key in BROWSER_ONLY_SITES and get_debug_artifacts().enabled("html"):
+            get_debug_artifacts().save("html", f"{self.site_name}_links.html", str(soup))
 
         extracted_count = 0
         exclusion_reasons = {}  # 统计排除原因
@@ -665,22 +635,13 @@ class BaseCollector(ABC):
         return None
 
     def _fetch_with_playwright(self, target_date=None):
-        """使用Playwright浏览器自动化获取页面内容（禁用代理）"""
+        """使用Playwright浏览器自动化获取页面内容（共享浏览器池，不使用 requests 会话的代理设置）"""
         try:
-            self.logger.info(f"启动浏览器访问: {self.base_url} (禁用代理)")
-
-            # 临时禁用代理
-            original_proxies = self.session.proxies
-            self.session.proxies = {"http": None, "https": None}
-            self.logger.debug("临时禁用代理")
+            self.logger.info(f"启动浏览器访问: {self.base_url}")
 
             # 使用浏览器获取内容
             content = self._fetch_page_content_with_browser()
 
-            # 恢复代理设置
-            self.session.proxies = original_proxies
-            self.logger.debug("恢复代理设置")
-
             self.logger.info(f"浏览器获取到 {len(content)} 字节内容")
 
             # 保存调试HTML
@@ -699,11 +660,32 @@ class BaseCollector(ABC):
 
         except Exception as e:
             self.logger.error(f"Playwright访问失败: {str(e)}")
-            # 恢复代理设置（即使失败也要恢复）
-            if "original_proxies" in dir():
-                self.session.proxies = original_proxies
             return None
 
+    def _fetch_article_with_browser(self, article_url: str) -> str:
+        """
+        使用共享浏览器池获取文章页面内容（浏览器不使用 requests 会话的代理设置）
+
+        Args:
+            article_url: 文章URL
+
+        Returns:
+            文章页面HTML内容
+        """
+        # 使用 domcontentloaded 避免 networkidle 超时，正文元素出现即读取
+        content = get_browser_pool().fetch_content(
+            article_url,
+            wait_until="domcontentloaded",
+            timeout=90000,
+            settle_ms=5000,
+            ready_selectors=self.site_config.get("article_selectors", ARTICLE_READY_SELECTORS),
+            profile=get_load_profile(self.site_config),
+            state_key=state_key_for(self.site_config),
+        )
+
+        self.logger.info(f"浏览器访问成功，获取到 {len(content)} 字节内容")
+        return content
+
     def _fetch_page_content_with_browser(self) -> str:
         """
         使用浏览器获取页面内容
@@ -711,47 +693,25 @@ class BaseCollector(ABC):
         Returns:
             页面HTML内容
         """
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=True, args=["--no-sandbox", "--disable-dev-shm-usage"]
-            )
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                viewport={"width": 1920, "height": 1080},
-                locale="zh-CN",
-            )
-            page = context.new_page()
-            # 使用 domcontentloaded 避免 networkidle 超时
-            page.goto(self.base_url, wait_until="domcontentloaded", timeout=30000)
-            # 等待额外时间让JS执行
-            page.wait_for_timeout(3000)
-            content = page.content()
-            browser.close()
-
-        return content
+        # 使用 domcontentloaded 避免 networkidle 超时，文章链接出现即读取
+        return get_browser_pool().fetch_content(
+            self.base_url,
+            wait_until="domcontentloaded",
+            timeout=30000,
+            settle_ms=3000,
+            ready_selectors=self.site_config.get("selectors"),
+            profile=get_load_profile(self.site_config),
+            state_key=state_key_for(self.site_config),
+        )
 
     def _save_debug_html(self, content: str):
         """
-        保存调试HTML到文件
+        保存调试HTML（按 DEBUG_ARTIFACTS 级别，后台写入）
 
         Args:
             content: HTML内容
         """
-        import os
-        from datetime import datetime as dt
-
-        debug_dir = os.path.join(os.getcwd(), "data", "debug")
-        os.makedirs(debug_dir, exist_ok=True)
-        debug_file = os.path.join(
-            debug_dir,
-            f"debug_{self.site_name}_{dt.now().strftime('%Y%m%d_%H%M%S')}.html",
-        )
-        try:
-            with open(debug_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            self.logger.info(f"💾 保存调试HTML到: {debug_file} ({len(content)} bytes)")
-        except Exception as e:
-            self.logger.warning(f"保存调试HTML失败: {str(e)}")
+        get_debug_artifacts().save("html", f"{self.site_name}_browser.html", content)
 
     def extract_nodes_from_article(self, article_url):
         """从文章中提取节点"""
@@ -773,7 +733,6 @@ class BaseCollector(ABC):
                 self.logger.info(f"找到订阅链接: {link}")
                 sub_nodes = self.get_nodes_from_subscription(link)
                 nodes.extend(sub_nodes)
-                time.sleep(self.delay)  # 避免请求过快
 
             # 直接从页面提取节点
             direct_nodes = self.extract_direct_nodes(content)
@@ -851,160 +810,23 @@ class BaseCollector(ABC):
             self.logger.info(f"获取订阅内容: {subscription_url}")
             response = self._make_request(subscription_url)
 
-            content = response.text.strip()
-
-            # 检查内容是否为空
-            if not content:
-                self.logger.warning(f"订阅链接返回空内容: {subscription_url}")
-                return []
-
-            if len(content) < 10:  # 太短不可能是有效节点
-                self.logger.warning(
-                    f"订阅链接内容过短 ({len(content)} 字符): {subscription_url}"
-                )
-                return []
-
-            # 尝试多种解析方式
-            all_nodes = []
-
-            # 方式1: 直接从原始内容提取
-            nodes = self._extract_nodes_from_text(content)
-            if nodes:
-                self.logger.info(f"直接解析获取到 {len(nodes)} 个节点")
-                all_nodes.extend(nodes)
-
-            # 方式2: 尝试Base64解码
-            all_nodes.extend(self._try_base64_decode(content))
-
-            # 方式3: 尝试URL解码
-            all_nodes.extend(self._try_url_decode(content))
-
-            # 方式4: 逐行分割后提取（处理某些特殊格式）
-            all_nodes.extend(self._try_line_by_line_parse(content))
-
-            # 方式5: 尝试解析 YAML/JSON 格式（Clash配置）
-            yaml_nodes = self._extract_yaml_json_nodes(content)
-            if yaml_nodes:
-                self.logger.info(f"YAML/JSON格式解析获取到 {len(yaml_nodes)} 个节点")
-                all_nodes.extend(yaml_nodes)
-
-            # 去重和过滤
-            unique_nodes = self._deduplicate_and_filter_nodes(all_nodes)
-
-            self.logger.info(
-                f"从订阅链接获取到 {len(unique_nodes)} 个节点 (原始: {len(all_nodes)})"
+            # 直接交给解码引擎处理原始字节，避免 response.text 对整个正文做编码检测
+            return self.subscription_extractor.parse_subscription_content(
+                response.content.strip()
             )
-            return unique_nodes
 
         except Exception as e:
             self.logger.error(f"获取订阅链接失败: {str(e)}")
             return []
 
-    def _try_base64_decode(self, content: str) -> List[str]:
+    def get_decode_hooks(self) -> DecodeHooks:
         """
-        尝试Base64解码内容
-
-        Args:
-            content: 原始内容
+        订阅解码钩子，需要特殊解码逻辑的收集器重写此方法
 
         Returns:
-            解析到的节点列表
+            解码钩子
         """
-        nodes = []
-        try:
-            import base64
-
-            # 补齐base64 padding
-            padded_content = content + "=" * (-len(content) % 4)
-            decoded_content = base64.b64decode(padded_content).decode(
-                "utf-8", errors="ignore"
-            )
-            nodes = self._extract_nodes_from_text(decoded_content)
-            if nodes:
-                self.logger.info(f"Base64解码后获取到 {len(nodes)} 个节点")
-                return nodes
-
-            # 尝试双重Base64解码（某些订阅链接使用双重编码）
-            decoded_bytes = base64.b64decode(padded_content)
-            double_padded = decoded_bytes + b"=" * (-len(decoded_bytes) % 4)
-            double_decoded = base64.b64decode(double_padded).decode(
-                "utf-8", errors="ignore"
-            )
-            nodes = self._extract_nodes_from_text(double_decoded)
-            if nodes:
-                self.logger.info(f"双重Base64解码后获取到 {len(nodes)} 个节点")
-
-        except Exception as e:
-            self.logger.debug(f"Base64解码失败: {str(e)}")
-
-        return nodes
-
-    def _try_url_decode(self, content: str) -> List[str]:
-        """
-        尝试URL解码内容
-
-        Args:
-            content: 原始内容
-
-        Returns:
-            解析到的节点列表
-        """
-        nodes = []
-        try:
-            from urllib.parse import unquote
-
-            url_decoded = unquote(content)
-            if url_decoded != content:  # 确实发生了解码
-                nodes = self._extract_nodes_from_text(url_decoded)
-                if nodes:
-                    self.logger.info(f"URL解码后获取到 {len(nodes)} 个节点")
-        except Exception as e:
-            self.logger.debug(f"URL解码失败: {str(e)}")
-
-        return nodes
-
-    def _try_line_by_line_parse(self, content: str) -> List[str]:
-        """
-        逐行解析内容（处理某些特殊格式）
-
-        Args:
-            content: 原始内容
-
-        Returns:
-            解析到的节点列表
-        """
-        nodes = []
-        lines = content.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 10:
-                continue
-
-            # 尝试从单行提取节点
-            nodes.extend(self._extract_nodes_from_text(line))
-
-            # 尝试Base64解码单行
-            try:
-                import base64
-
-                padded_line = line + "=" * (-len(line) % 4)
-                decoded_line = base64.b64decode(padded_line).decode(
-                    "utf-8", errors="ignore"
-                )
-                nodes.extend(self._extract_nodes_from_text(decoded_line))
-
-                # 尝试双重Base64解码
-                decoded_bytes = base64.b64decode(padded_line)
-                double_padded = decoded_bytes + b"=" * (-len(decoded_bytes) % 4)
-                double_decoded = base64.b64decode(double_padded).decode(
-                    "utf-8", errors="ignore"
-                )
-                nodes.extend(self._extract_nodes_from_text(double_decoded))
-            except Exception:
-                pass
-
-        return nodes
+        return DecodeHooks(convert_proxy=self._convert_clash_proxy_to_node)
 
     def _deduplicate_and_filter_nodes(self, nodes: List[str]) -> List[str]:
         """
@@ -1026,177 +848,6 @@ class BaseCollector(ABC):
 
         return unique_nodes
 
-    def _extract_nodes_from_text(self, text):
-        """从文本中提取节点"""
-        nodes = []
-        for pattern in NODE_PATTERNS:
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    node = match.strip()
-                    if node and len(node) >= MIN_NODE_LENGTH:
-                        nodes.append(node)
-            except Exception as e:
-                self.logger.warning(f"节点模式匹配失败: {pattern} - {str(e)}")
-        return nodes
-
-    def _extract_yaml_json_nodes(self, content):
-        """从 YAML/JSON 格式提取节点（Clash配置格式）"""
-        nodes = []
-        try:
-            # 首先尝试作为完整JSON解析
-            json_nodes = self._parse_json_format(content)
-            if json_nodes:
-                return json_nodes
-
-            # 尝试作为YAML解析
-            yaml_nodes = self._parse_yaml_format(content)
-            if yaml_nodes:
-                return yaml_nodes
-
-            # 回退方案：从文本中提取行内JSON对象
-            inline_json_nodes = self._parse_inline_json(content)
-            if inline_json_nodes:
-                return inline_json_nodes
-
-        except ImportError as e:
-            self.logger.warning(f"模块导入失败: {str(e)}")
-        except Exception as e:
-            self.logger.warning(f"YAML/JSON 解析失败: {str(e)}")
-
-        return nodes
-
-    def _parse_json_format(self, content: str) -> List[str]:
-        """解析JSON格式内容"""
-        nodes = []
-        try:
-            import json
-
-            data = json.loads(content.strip())
-            proxies_list = None
-
-            if isinstance(data, list):
-                proxies_list = data
-                self.logger.info(f"识别为JSON数组格式，包含 {len(proxies_list)} 个代理")
-            elif isinstance(data, dict) and "proxies" in data:
-                proxies_list = data["proxies"]
-                self.logger.info(f"识别为JSON对象格式，包含 {len(proxies_list)} 个代理")
-
-            if proxies_list:
-                for proxy in proxies_list:
-                    try:
-                        node = self._convert_clash_proxy_to_node(proxy)
-                        if node and len(node) >= MIN_NODE_LENGTH:
-                            nodes.append(node)
-                    except Exception as e:
-                        self.logger.debug(f"JSON代理转换失败: {str(e)}")
-
-        except json.JSONDecodeError:
-            pass
-
-        return nodes
-
-    def _parse_yaml_format(self, content: str) -> List[str]:
-        """解析YAML格式内容"""
-        nodes = []
-        try:
-            import yaml
-
-            self.logger.info("开始尝试YAML解析...")
-            yaml_data = yaml.safe_load(content.strip())
-            self.logger.info(f"YAML解析成功，数据类型: {type(yaml_data)}")
-
-            if isinstance(yaml_data, dict) and "proxies" in yaml_data:
-                return self._process_yaml_proxies(yaml_data["proxies"], "Clash配置格式")
-
-            elif isinstance(yaml_data, list):
-                return self._process_yaml_proxies(yaml_data, "代理列表格式")
-
-            else:
-                self.logger.info(f"YAML数据格式不支持: {type(yaml_data)}")
-
-        except Exception as e:
-            pass
-
-        return nodes
-
-    def _process_yaml_proxies(self, proxies_list: List, format_name: str) -> List[str]:
-        """处理YAML代理列表"""
-        nodes = []
-        self.logger.info(f"识别为{format_name}，包含 {len(proxies_list)} 个代理")
-
-        for i, proxy in enumerate(proxies_list):
-            try:
-                node = self._convert_clash_proxy_to_node(proxy)
-                if node and len(node) >= MIN_NODE_LENGTH:
-                    nodes.append(node)
-                else:
-                    self.logger.warning(f"YAML代理 {i + 1} 转换结果太短或为空")
-            except Exception as e:
-                self.logger.warning(f"YAML代理 {i + 1} 转换失败: {str(e)}")
-
-        self.logger.info(f"YAML解析完成，共转换 {len(nodes)} 个节点")
-        return nodes
-
-    def _parse_inline_json(self, content: str) -> List[str]:
-        """从YAML文本中提取行内JSON对象"""
-        nodes = []
-
-        if "proxies:" not in content and "proxies" not in content:
-            return nodes
-
-        try:
-            import json
-
-            lines = content.split("\n")
-            json_objects = self._extract_json_objects_from_lines(lines)
-
-            self.logger.info(f"从YAML文本中找到 {len(json_objects)} 个行内JSON对象")
-
-            success_count = 0
-            error_count = 0
-
-            for json_str in json_objects:
-                try:
-                    proxy = json.loads(json_str)
-                    node = self._convert_clash_proxy_to_node(proxy)
-                    if node and len(node) >= MIN_NODE_LENGTH:
-                        nodes.append(node)
-                        success_count += 1
-                    else:
-                        error_count += 1
-                except json.JSONDecodeError as e:
-                    error_count += 1
-                    if error_count <= 3:
-                        self.logger.warning(f"行内JSON解析失败: {str(e)[:100]}")
-                except Exception as e:
-                    error_count += 1
-
-            self.logger.info(f"YAML行内JSON解析完成: {success_count} 成功, {error_count} 失败")
-
-        except Exception as e:
-            self.logger.warning(f"行内JSON解析失败: {str(e)}")
-
-        return nodes
-
-    def _extract_json_objects_from_lines(self, lines: List[str]) -> List[str]:
-        """从行列表中提取JSON对象"""
-        json_objects = []
-
-        for line in lines:
-            line = line.strip()
-            # 查找行内的 JSON 对象（支持嵌套）
-            json_matches = re.findall(r"-\s*(\{[^}]*\{[^}]*\}[^}]*\})", line)
-            if not json_matches:
-                json_match = re.search(r"-\s*(\{.+\})", line)
-                if json_match:
-                    json_matches.append(json_match.group(1))
-
-            for json_str in json_matches:
-                json_objects.append(json_str)
-
-        return json_objects
-
     def _convert_clash_proxy_to_node(self, proxy):
         """将 Clash proxy 对象转换为 V2Ray 节点 URI 格式"""
         return self.converter.convert(proxy)
@@ -1280,16 +931,8 @@ class BaseCollector(ABC):
         """直接从页面内容提取节点"""
         nodes = []
 
-        # 使用标准节点模式
-        for pattern in NODE_PATTERNS:
-            try:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    node = match.strip()
-                    if len(node) >= MIN_NODE_LENGTH:
-                        nodes.append(node)
-            except Exception as e:
-                self.logger.warning(f"节点模式匹配失败: {pattern} - {str(e)}")
+        # 使用标准节点协议
+        nodes.extend(get_node_scanner(NODE_SCHEMES).scan(content, MIN_NODE_LENGTH))
 
         # 从代码块中提取
         for selector in CODE_BLOCK_SELECTORS:
@@ -1326,17 +969,7 @@ class BaseCollector(ABC):
 
     def parse_node_text(self, text):
         """解析文本中的节点信息"""
-        nodes = []
-
-        for pattern in NODE_PATTERNS:
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    node = match.strip()
-                    if node and len(node) >= MIN_NODE_LENGTH:
-                        nodes.append(node)
-            except Exception as e:
-                self.logger.warning(f"节点解析失败: {pattern} - {str(e)}")
+        nodes = get_node_scanner(NODE_SCHEMES).scan(text, MIN_NODE_LENGTH)
 
         # 修复被错误标记为ss://的VMess节点
         nodes = self._fix_misidentified_nodes(nodes)
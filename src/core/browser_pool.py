@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共享浏览器池
+整个运行期间只启动一个无头 Chromium，各网站使用相互隔离的浏览器上下文。
+
+Playwright 的同步API只能在创建它的线程中使用，而收集器运行在线程池中，
+因此浏览器由一个专用线程上的事件循环（异步API）持有，其他线程通过
+fetch_content 提交页面加载任务，多个页面可以同时加载。
+"""
+
+import asyncio
+import atexit
+import functools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from src.core.browser_state import BrowserStateStore, get_browser_state_store, is_challenge_page
+from src.core.config_manager import get_config
+from src.utils.logger import get_logger
+
+# 默认浏览器启动参数
+DEFAULT_LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage"]
+
+# 默认浏览器上下文参数（视口由加载方案决定）
+DEFAULT_CONTEXT_OPTIONS = {
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "locale": "zh-CN",
+}
+
+
+@dataclass(frozen=True)
+class PageLoadProfile:
+    """页面加载方案"""
+
+    name: str
+    viewport: Dict[str, int]
+    # 直接中止的资源类型（Playwright request.resource_type）
+    blocked_resource_types: FrozenSet[str] = frozenset()
+    # URL中包含这些关键字的请求直接中止（统计、广告）
+    blocked_url_keywords: Tuple[str, ...] = ()
+    # 等待就绪选择器的超时（毫秒），0表示不使用选择器，改为固定等待
+    ready_timeout: int = 0
+
+    @property
+    def blocks_requests(self) -> bool:
+        return bool(self.blocked_resource_types or self.blocked_url_keywords)
+
+
+LOAD_PROFILES = {
+    # 精简加载：小视口，不加载图片/字体/媒体和统计广告脚本，正文元素出现即就绪
+    "lean": PageLoadProfile(
+        name="lean",
+        viewport={"width": 800, "height": 600},
+        blocked_resource_types=frozenset({"image", "media", "font"}),
+        blocked_url_keywords=(
+            "google-analytics.com",
+            "googletagmanager.com",
+            "googlesyndication.com",
+            "doubleclick.net",
+            "adservice.google",
+            "hm.baidu.com",
+            "cnzz.com",
+            "clarity.ms",
+            "facebook.net",
+        ),
+        ready_timeout=15000,
+    ),
+    # 完整加载：与旧行为一致，加载全部资源并固定等待
+    "full": PageLoadProfile(
+        name="full",
+        viewport={"width": 1920, "height": 1080},
+    ),
+}
+
+
+def get_load_profile(site_config: Optional[Dict[str, Any]] = None) -> PageLoadProfile:
+    """
+    获取页面加载方案（网站配置中的 load_profile 优先于 BROWSER_LOAD_PROFILE）
+
+    Args:
+        site_config: 网站配置
+
+    Returns:
+        页面加载方案，未知名称时使用 lean
+    """
+    name = (site_config or {}).get("load_profile") or get_config().base.BROWSER_LOAD_PROFILE
+    return LOAD_PROFILES.get(name, LOAD_PROFILES["lean"])
+
+
+class BrowserPool:
+    """共享浏览器池"""
+
+    def __init__(
+        self,
+        max_pages: int = 3,
+        browser_factory: Optional[Callable[[], Awaitable[Any]]] = None,
+        state_store: Optional[BrowserStateStore] = None,
+    ):
+        """
+        初始化浏览器池
+
+        Args:
+            max_pages: 同时打开的页面数上限
+            browser_factory: 创建浏览器的协程函数，默认启动无头 Chromium
+            state_store: 按网站保存的浏览器存储状态，为None时每次使用全新上下文
+        """
+        self.max_pages = max(1, max_pages)
+        self.logger = get_logger("browser_pool")
+        self._browser_factory = browser_factory or self._launch_chromium
+        self.state_store = state_store
+        self._playwright = None
+        self._browser = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._start_lock = threading.Lock()
+        self.launch_count = 0
+        self.page_count = 0
+        self.blocked_count = 0
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """启动浏览器线程和事件循环（只启动一次）"""
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    self._semaphore = asyncio.Semaphore(self.max_pages)
+                    self._browser_lock = asyncio.Lock()
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(
+                    target=run_loop, name="browser_pool", daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    async def _launch_chromium(self):
+        """启动无头 Chromium"""
+        from playwright.async_api import async_playwright
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch(
+            headless=True, args=DEFAULT_LAUNCH_ARGS
+        )
+
+    async def _get_browser(self):
+        """获取共享浏览器，未启动或已断开时重新启动"""
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                self.logger.info("🌐 启动共享浏览器")
+                self._browser = await self._browser_factory()
+                self.launch_count += 1
+            return self._browser
+
+    async def _fetch(
+        self,
+        url: str,
+        wait_until: str,
+        timeout: int,
+        settle_ms: int,
+        context_options: Dict[str, Any],
+        ready_selectors: Optional[List[str]],
+        profile: PageLoadProfile,
+        state_key: Optional[str],
+    ) -> str:
+        async with self._semaphore:
+            browser = await self._get_browser()
+            load = functools.partial(
+                self._load_page,
+                browser,
+                url,
+                wait_until,
+                timeout,
+                settle_ms,
+                dict(context_options, viewport=profile.viewport),
+                ready_selectors,
+                profile,
+                state_key,
+            )
+
+            state = None
+            if self.state_store is not None and state_key:
+                state = self.state_store.load(state_key)
+            if state is not None:
+                content = await load(state)
+                if not is_challenge_page(content):
+                    self.logger.debug(f"🍪 复用浏览器状态: {state_key}")
+                    return content
+                # 保存的Cookie已不能通过验证，删除后使用全新上下文重试
+                self.state_store.invalidate(state_key)
+
+            return await load(None)
+
+    async def _load_page(
+        self,
+        browser,
+        url: str,
+        wait_until: str,
+        timeout: int,
+        settle_ms: int,
+        context_options: Dict[str, Any],
+        ready_selectors: Optional[List[str]],
+        profile: PageLoadProfile,
+        state_key: Optional[str],
+        storage_state: Optional[Dict[str, Any]],
+    ) -> str:
+        """在新的浏览器上下文中加载页面，通过验证后保存存储状态"""
+        if storage_state is not None:
+            context_options = dict(context_options, storage_state=storage_state)
+        context = await browser.new_context(**context_options)
+        try:
+            if profile.blocks_requests:
+                await context.route("**/*", self._make_route_handler(profile))
+
+            page = await context.new_page()
+            start = time.time()
+            await page.goto(url, wait_until=wait_until, timeout=timeout)
+            await self._wait_until_ready(page, url, settle_ms, ready_selectors, profile)
+            self.page_count += 1
+            content = await page.content()
+            self.logger.debug(
+                f"🌐 页面加载完成 ({profile.name}): {url} {time.time() - start:.1f}秒"
+            )
+
+            if self.state_store is not None and state_key and not is_challenge_page(content):
+                self.state_store.save(state_key, await context.storage_state())
+            return content
+        finally:
+            await context.close()
+
+    def _make_route_handler(self, profile: PageLoadProfile):
+        """创建中止非必要资源的路由处理函数"""
+
+        async def handle(route):
+            request = route.request
+            if request.resource_type in profile.blocked_resource_types or any(
+                keyword in request.url for keyword in profile.blocked_url_keywords
+            ):
+                self.blocked_count += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        return handle
+
+    async def _wait_until_ready(
+        self,
+        page,
+        url: str,
+        settle_ms: int,
+        ready_selectors: Optional[List[str]],
+        profile: PageLoadProfile,
+    ) -> None:
+        """等待页面就绪：出现任一就绪选择器，或无选择器时固定等待"""
+        if ready_selectors and profile.ready_timeout:
+            try:
+                await page.wait_for_selector(
+                    ", ".join(ready_selectors),
+                    state="attached",
+                    timeout=profile.ready_timeout,
+                )
+                return
+            except Exception as e:
+                if "Timeout" in type(e).__name__:
+                    self.logger.debug(f"等待就绪元素超时，直接读取页面: {url}")
+                    return
+                # 选择器无效等情况退回固定等待
+                self.logger.debug(f"就绪选择器不可用，改为固定等待: {str(e)}")
+
+        if settle_ms:
+            # 等待额外时间让JS执行
+            await page.wait_for_timeout(settle_ms)
+
+    def fetch_content(
+        self,
+        url: str,
+        wait_until: str = "domcontentloaded",
+        timeout: int = 30000,
+        settle_ms: int = 3000,
+        context_options: Optional[Dict[str, Any]] = None,
+        ready_selectors: Optional[List[str]] = None,
+        profile: Optional[PageLoadProfile] = None,
+        state_key: Optional[str] = None,
+    ) -> str:
+        """
+        在独立的浏览器上下文中加载页面并返回HTML（可在任意线程调用）
+
+        Args:
+            url: 页面URL
+            wait_until: 页面加载完成条件
+            timeout: 页面加载超时（毫秒）
+            settle_ms: 无就绪选择器时加载完成后额外等待的时间（毫秒）
+            context_options: 浏览器上下文参数，默认使用 DEFAULT_CONTEXT_OPTIONS
+            ready_selectors: 就绪选择器，出现任一即认为页面已就绪
+            profile: 页面加载方案，默认按 BROWSER_LOAD_PROFILE 选择
+            state_key: 网站键，指定时复用并保存该网站的浏览器存储状态
+
+        Returns:
+            页面HTML内容
+        """
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(
+            self._fetch(
+                url,
+                wait_until,
+                timeout,
+                settle_ms,
+                context_options or DEFAULT_CONTEXT_OPTIONS,
+                ready_selectors,
+                profile or get_load_profile(),
+                state_key,
+            ),
+            loop,
+        )
+        return future.result()
+
+    def close(self) -> None:
+        """关闭浏览器并停止浏览器线程"""
+        with self._start_lock:
+            loop = self._loop
+            if loop is None:
+                return
+
+            async def shutdown():
+                if self._browser is not None:
+                    await self._browser.close()
+                if self._playwright is not None:
+                    await self._playwright.stop()
+
+            try:
+                asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=30)
+            except Exception as e:
+                self.logger.warning(f"关闭共享浏览器失败: {str(e)}")
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                self._thread.join(timeout=10)
+                loop.close()
+                self._loop = None
+                self._thread = None
+                self._browser = None
+                self._playwright = None
+
+            if self.launch_count:
+                self.logger.info(
+                    f"🌐 共享浏览器已关闭: 启动 {self.launch_count} 次, "
+                    f"加载 {self.page_count} 个页面, 拦截 {self.blocked_count} 个非必要请求"
+                )
+            if self.state_store is not None and self.launch_count:
+                stats = self.state_store.get_stats()
+                self.logger.info(
+                    f"🍪 浏览器状态: 复用 {stats['reused']} 次, 失效 {stats['invalidated']} 次, "
+                    f"过期 {stats['expired']} 次, 保存 {stats['saved']} 次"
+                )
+
+
+# 全局单例实例
+_browser_pool = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """获取浏览器池单例实例"""
+    global _browser_pool
+    if _browser_pool is None:
+        with _browser_pool_lock:
+            if _browser_pool is None:
+                _browser_pool = BrowserPool(
+                    get_config().base.BROWSER_POOL_SIZE,
+                    state_store=get_browser_state_store(),
+                )
+                atexit.register(_browser_pool.close)
+    return _browser_pool
+
+
+def shutdown_browser_pool() -> None:
+    """关闭浏览器池（运行结束时调用），之后再次使用会重新启动"""
+    if _browser_pool is not None:
+        _browser_pool.close()
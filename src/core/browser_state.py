@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+浏览器存储状态缓存
+按网站保存浏览器上下文的存储状态（Cookie、localStorage），
+下次运行时复用 Cloudflare 等反爬验证通过后下发的 Cookie，跳过验证页面
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.core.config_manager import get_config
+from src.utils.logger import get_logger
+
+# 反爬验证页面的特征，命中时说明保存的状态已失效
+CHALLENGE_MARKERS = (
+    "challenge-platform",
+    "cf-browser-verification",
+    "cf_chl_opt",
+    "<title>Just a moment...</title>",
+    "Checking your browser before accessing",
+)
+
+
+def is_challenge_page(content: str) -> bool:
+    """
+    判断页面是否为反爬验证页面
+
+    Args:
+        content: 页面HTML内容
+
+    Returns:
+        是否为验证页面
+    """
+    return any(marker in content for marker in CHALLENGE_MARKERS)
+
+
+def state_key_for(site_config: Dict[str, Any]) -> Optional[str]:
+    """获取网站的存储状态键（收集器关键字，没有时使用网站名称）"""
+    return site_config.get("collector_key") or site_config.get("name")
+
+
+class BrowserStateStore:
+    """按网站保存的浏览器存储状态"""
+
+    def __init__(self, state_dir: Path, ttl: int):
+        """
+        初始化存储状态缓存
+
+        Args:
+            state_dir: 状态文件目录
+            ttl: 有效期（秒），超过有效期的状态不再使用
+        """
+        self.state_dir = Path(state_dir)
+        self.ttl = ttl
+        self.logger = get_logger("browser_state")
+        self._lock = threading.Lock()
+        self.stats = {"reused": 0, "expired": 0, "saved": 0, "invalidated": 0}
+
+    def _path(self, key: str) -> Path:
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        return self.state_dir / f"{safe_key}.json"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        读取网站的存储状态
+
+        Args:
+            key: 网站键
+
+        Returns:
+            Playwright storage_state 字典，不存在或已过期时返回None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"读取浏览器状态失败: {key} - {str(e)}")
+            return None
+
+        if time.time() - saved.get("saved_at", 0) > self.ttl:
+            self._count("expired")
+            self.logger.debug(f"浏览器状态已过期: {key}")
+            self._remove(path)
+            return None
+
+        self._count("reused")
+        return saved.get("state")
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        """
+        保存网站的存储状态（刷新有效期）
+
+        Args:
+            key: 网站键
+            state: Playwright storage_state 字典
+        """
+        path = self._path(key)
+        data = json.dumps({"saved_at": time.time(), "state": state}, ensure_ascii=False)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._count("saved")
+        except OSError as e:
+            self.logger.warning(f"保存浏览器状态失败: {key} - {str(e)}")
+
+    def invalidate(self, key: str) -> None:
+        """删除失效的存储状态"""
+        self._count("invalidated")
+        self.logger.info(f"🍪 浏览器状态已失效，改用全新上下文: {key}")
+        self._remove(self._path(key))
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取统计信息"""
+        with self._lock:
+            return dict(self.stats)
+
+
+# 全局单例实例
+_browser_state_store = None
+_browser_state_store_lock = threading.Lock()
+
+
+def get_browser_state_store() -> Optional[BrowserStateStore]:
+    """获取浏览器状态缓存单例实例，未启用时返回None"""
+    global _browser_state_store
+    config = get_config()
+    if not config.base.BROWSER_STATE_ENABLED:
+        return None
+    if _browser_state_store is None:
+        with _browser_state_store_lock:
+            if _browser_state_store is None:
+                _browser_state_store = BrowserStateStore(
+                    config.base.BROWSER_STATE_DIR, config.base.BROWSER_STATE_TTL
+                )
+    return _browser_state_store
@@ -7,19 +7,29 @@
 
 import sys
 import os
+import asyncio
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.core.config_manager import get_config
+from src.core.async_base_collector import is_async_collector
+from src.core.singleflight import SingleFlight
+from src.core.browser_pool import shutdown_browser_pool
+from src.core.debug_artifacts import flush_debug_artifacts
 from src.collectors import get_collector_instance, run_collector
 from src.utils.logger import get_logger
 from src.utils.file_handler import FileHandler
+from src.utils.node_fingerprint import dedupe_nodes
+from src.utils.url_utils import canonicalize_url
 
 
 class CollectorManager:
@@ -31,6 +41,10 @@ class CollectorManager:
         self.file_handler = FileHandler()
         self.collectors = {}
         self.results = {}
+        self._subscription_parser = None
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self._link_flight = SingleFlight(memoize=True)
 
     def initialize_collectors(self, sites: Optional[List[str]] = None):
         """初始化收集器"""
@@ -93,92 +107,229 @@ class CollectorManager:
 
         return info
 
-    def collect_all_links(self) -> Dict[str, Dict]:
+    def collect_all_links(self, concurrent: Optional[bool] = None) -> Dict[str, Dict]:
         """
         阶段1：收集所有网站的文章链接和订阅链接（带重试机制）
 
+        Args:
+            concurrent: 是否并发收集，为None时使用配置 CONCURRENT_COLLECTION
+
         Returns:
             链接收集结果字典
         """
-        results = {}
+        if concurrent is None:
+            concurrent = self.config_manager.base.CONCURRENT_COLLECTION
+
+        if concurrent and any(is_async_collector(c) for c in self.collectors.values()):
+            return asyncio.run(self.collect_all_links_async())
+
+        if not concurrent or len(self.collectors) <= 1:
+            return {
+                site_key: self._collect_site_links_with_retry(collector)
+                for site_key, collector in self.collectors.items()
+            }
+
+        max_workers = max(1, min(self.config_manager.base.MAX_WORKERS, len(self.collectors)))
+        self.logger.info(f"⚡ 并发收集链接，工作线程数: {max_workers}")
+
+        site_results = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="collect_links"
+        ) as executor:
+            futures = {
+                executor.submit(self._collect_site_links_with_retry, collector): site_key
+                for site_key, collector in self.collectors.items()
+            }
+            for future in as_completed(futures):
+                site_key = futures[future]
+                site_results[site_key] = self._site_links_result(site_key, future)
+
+        # 保持与收集器初始化顺序一致
+        return {site_key: site_results[site_key] for site_key in self.collectors}
+
+    def _site_links_result(self, site_key: str, future: Future) -> Dict:
+        """从已完成的链接收集任务中取出结果"""
+        try:
+            return future.result()
+        except Exception as e:
+            return self._site_links_failure(site_key, e)
+
+    def _site_links_failure(self, site_key: str, error: Exception) -> Dict:
+        """构建链接收集异常的失败结果"""
+        collector = self.collectors[site_key]
+        self.logger.error(f"❌ {collector.site_name} 链接收集异常: {str(error)}")
+        return {
+            "name": collector.site_name,
+            "success": False,
+            "error": str(error),
+        }
+
+    def _collect_site_links_with_retry(self, collector) -> Dict:
+        """
+        收集单个网站的链接（重试与退避只影响当前网站）
+
+        Args:
+            collector: 收集器实例
+
+        Returns:
+            单个网站的链接收集结果
+        """
         max_retries = 3
         retry_delay = 2  # 秒
+        last_error = None
 
-        for site_key, collector in self.collectors.items():
-            success = False
-            last_error = None
-
-            # 重试机制
-            for attempt in range(max_retries):
-                try:
-                    # 只在重试时显示尝试信息
-                    if attempt > 0:
-                        self.logger.info(
-                            f"📄 重新收集 {collector.site_name} 的链接... (尝试 {attempt + 1}/{max_retries})"
-                        )
-                    else:
-                        self.logger.info(f"📄 收集 {collector.site_name} 的链接...")
+        for attempt in range(max_retries):
+            try:
+                # 只在重试时显示尝试信息
+                if attempt > 0:
+                    self.logger.info(
+                        f"📄 重新收集 {collector.site_name} 的链接... (尝试 {attempt + 1}/{max_retries})"
+                    )
+                else:
+                    self.logger.info(f"📄 收集 {collector.site_name} 的链接...")
 
-                    # 只收集链接，不解析订阅内容
+                # 只收集链接，不解析订阅内容
+                if is_async_collector(collector):
+                    links_info = asyncio.run(collector.collect_links())
+                else:
                     links_info = collector.collect_links()
+                return self._build_links_result(collector, links_info)
 
-                    if links_info and links_info.get("subscription_links"):
-                        results[site_key] = {
-                            "name": collector.site_name,
-                            "article_url": links_info.get("article_url"),
-                            "subscription_links": links_info.get(
-                                "subscription_links", []
-                            ),
-                            "raw_data": links_info.get("raw_data"),
-                            "success": True,
-                        }
-                        self.logger.info(
-                            f"✓ {collector.site_name} 找到 {len(links_info.get('subscription_links', []))} 个订阅链接"
-                        )
-                        success = True
-                        break
+            except Exception as e:
+                last_error = str(e)
+                self.logger.warning(
+                    f"❌ {collector.site_name} 链接收集失败 (尝试 {attempt + 1}/{max_retries}): {last_error}"
+                )
+
+                # 如果不是最后一次尝试，等待后重试
+                if attempt < max_retries - 1:
+                    self.logger.info(f"⏳ {collector.site_name} {retry_delay}秒后重试...")
+                    time.sleep(retry_delay)
+                    retry_delay *= 2  # 指数退避
+
+        # 最后一次失败，记录错误
+        self.logger.error(f"❌ {collector.site_name} 链接收集最终失败: {last_error}")
+        return {
+            "name": collector.site_name,
+            "success": False,
+            "error": last_error,
+        }
+
+    async def collect_all_links_async(self) -> Dict[str, Dict]:
+        """
+        阶段1（事件循环版）：异步收集器直接在事件循环中运行，
+        同步收集器放入线程池执行，两者共享同一个事件循环
+
+        Returns:
+            链接收集结果字典，结构与 collect_all_links 相同
+        """
+        results = {}
+        await self._collect_links_on_loop(results.__setitem__)
+        return {site_key: results[site_key] for site_key in self.collectors}
+
+    async def _collect_links_on_loop(
+        self, on_result: Callable[[str, Dict], None]
+    ) -> None:
+        """
+        在当前事件循环中收集所有网站的链接，每个网站完成时立即回调
+
+        Args:
+            on_result: 回调 (site_key, 链接收集结果)，在事件循环线程中调用
+        """
+        loop = asyncio.get_running_loop()
+        max_workers = max(1, min(self.config_manager.base.MAX_WORKERS, len(self.collectors)))
+        async_count = sum(1 for c in self.collectors.values() if is_async_collector(c))
+        self.logger.info(
+            f"⚡ 事件循环收集链接: {async_count} 个异步收集器, "
+            f"{len(self.collectors) - async_count} 个同步收集器 (线程数: {max_workers})"
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="collect_links"
+        ) as executor:
+
+            async def collect_site(site_key: str, collector) -> None:
+                try:
+                    if is_async_collector(collector):
+                        site_data = await self._collect_site_links_with_retry_async(collector)
                     else:
-                        # 如果没有找到订阅链接，也可能是正常情况（网站暂时没有更新）
-                        results[site_key] = {
-                            "name": collector.site_name,
-                            "article_url": links_info.get("article_url")
-                            if links_info
-                            else None,
-                            "subscription_links": [],
-                            "raw_data": links_info.get("raw_data")
-                            if links_info
-                            else None,
-                            "success": True,  # 成功访问但没有新内容
-                        }
-                        self.logger.info(
-                            f"✓ {collector.site_name} 访问成功但未找到新订阅链接"
+                        site_data = await loop.run_in_executor(
+                            executor, self._collect_site_links_with_retry, collector
                         )
-                        success = True
-                        break
-
                 except Exception as e:
-                    last_error = str(e)
-                    self.logger.warning(
-                        f"❌ {collector.site_name} 链接收集失败 (尝试 {attempt + 1}/{max_retries}): {last_error}"
+                    site_data = self._site_links_failure(site_key, e)
+                on_result(site_key, site_data)
+
+            await asyncio.gather(
+                *(collect_site(site_key, c) for site_key, c in self.collectors.items())
+            )
+
+    async def _collect_site_links_with_retry_async(self, collector) -> Dict:
+        """
+        收集单个异步收集器的链接（重试等待不阻塞事件循环）
+
+        Args:
+            collector: 异步收集器实例
+
+        Returns:
+            单个网站的链接收集结果
+        """
+        max_retries = 3
+        retry_delay = 2  # 秒
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    self.logger.info(
+                        f"📄 重新收集 {collector.site_name} 的链接... (尝试 {attempt + 1}/{max_retries})"
                     )
+                else:
+                    self.logger.info(f"📄 收集 {collector.site_name} 的链接...")
 
-                    # 如果不是最后一次尝试，等待后重试
-                    if attempt < max_retries - 1:
-                        self.logger.info(f"⏳ {retry_delay}秒后重试...")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # 指数退避
-                    else:
-                        # 最后一次失败，记录错误
-                        results[site_key] = {
-                            "name": collector.site_name,
-                            "success": False,
-                            "error": last_error,
-                        }
-                        self.logger.error(
-                            f"❌ {collector.site_name} 链接收集最终失败: {last_error}"
-                        )
+                links_info = await collector.collect_links()
+                return self._build_links_result(collector, links_info)
+
+            except Exception as e:
+                last_error = str(e)
+                self.logger.warning(
+                    f"❌ {collector.site_name} 链接收集失败 (尝试 {attempt + 1}/{max_retries}): {last_error}"
+                )
+                if attempt < max_retries - 1:
+                    self.logger.info(f"⏳ {collector.site_name} {retry_delay}秒后重试...")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2  # 指数退避
+
+        self.logger.error(f"❌ {collector.site_name} 链接收集最终失败: {last_error}")
+        return {
+            "name": collector.site_name,
+            "success": False,
+            "error": last_error,
+        }
+
+    def _build_links_result(self, collector, links_info: Optional[Dict]) -> Dict:
+        """将收集器返回的链接信息转换为阶段1结果"""
+        if links_info and links_info.get("subscription_links"):
+            self.logger.info(
+                f"✓ {collector.site_name} 找到 {len(links_info.get('subscription_links', []))} 个订阅链接"
+            )
+            return {
+                "name": collector.site_name,
+                "article_url": links_info.get("article_url"),
+                "subscription_links": links_info.get("subscription_links", []),
+                "raw_data": links_info.get("raw_data"),
+                "success": True,
+            }
 
-        return results
+        # 如果没有找到订阅链接，也可能是正常情况（网站暂时没有更新）
+        self.logger.info(f"✓ {collector.site_name} 访问成功但未找到新订阅链接")
+        return {
+            "name": collector.site_name,
+            "article_url": links_info.get("article_url") if links_info else None,
+            "subscription_links": [],
+            "raw_data": links_info.get("raw_data") if links_info else None,
+            "success": True,  # 成功访问但没有新内容
+        }
 
     def parse_all_subscriptions(
         self, links_results: Dict[str, Dict]
@@ -192,9 +343,101 @@ class CollectorManager:
         Returns:
             最终的节点收集结果
         """
-        final_results = {}
+        all_subscription_links = self._build_subscription_link_list(links_results)
+        unique_count = len({canonicalize_url(info["link"]) for info in all_subscription_links})
+
+        self.logger.info(
+            f"🔍 共收集到 {len(all_subscription_links)} 个订阅链接"
+            f"（去重后 {unique_count} 个），开始统一解析..."
+        )
+
+        # 解析所有订阅链接（带容错机制）
+        self._link_flight = SingleFlight(memoize=True)
+        outcomes = self._parse_subscription_links(all_subscription_links)
+        self._log_shared_links()
+
+        return self._merge_subscription_results(
+            links_results, all_subscription_links, outcomes
+        )
+
+    def collect_and_parse_pipelined(self) -> Dict[str, Dict]:
+        """
+        流水线方式执行阶段1和阶段2
+
+        每个网站完成链接收集后，其订阅链接立即进入解析线程池，
+        无需等待较慢的网站（如浏览器访问的网站）完成。返回结构与
+        parse_all_subscriptions 相同。
+
+        Returns:
+            最终的节点收集结果
+        """
+        link_workers = max(
+            1, min(self.config_manager.base.MAX_WORKERS, len(self.collectors))
+        )
+        parse_workers = max(1, self.config_manager.base.SUBSCRIPTION_CONCURRENCY)
+        self.logger.info(
+            f"⚡ 流水线收集：链接线程数 {link_workers}，订阅解析线程数 {parse_workers}"
+        )
+
+        site_results = {}
+        parse_futures: Dict[str, List[Future]] = {}
+        self._link_flight = SingleFlight(memoize=True)
+
+        with ThreadPoolExecutor(
+            max_workers=parse_workers, thread_name_prefix="parse_subscription"
+        ) as parse_executor:
+
+            def on_links_collected(site_key: str, site_data: Dict) -> None:
+                site_results[site_key] = site_data
+                if site_data.get("success") and site_data.get("subscription_links"):
+                    self.logger.debug(
+                        f"📥 {site_data['name']} 的 {len(site_data['subscription_links'])} 个订阅链接进入解析队列"
+                    )
+                    parse_futures[site_key] = [
+                        parse_executor.submit(
+                            self._parse_link_guarded, site_data["name"], link
+                        )
+                        for link in site_data["subscription_links"]
+                    ]
+
+            if any(is_async_collector(c) for c in self.collectors.values()):
+                # 异步收集器共享一个事件循环，同步收集器在该循环的线程池中运行
+                asyncio.run(self._collect_links_on_loop(on_links_collected))
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=link_workers, thread_name_prefix="collect_links"
+                ) as link_executor:
+                    link_futures = {
+                        link_executor.submit(
+                            self._collect_site_links_with_retry, collector
+                        ): site_key
+                        for site_key, collector in self.collectors.items()
+                    }
+                    for future in as_completed(link_futures):
+                        site_key = link_futures[future]
+                        on_links_collected(
+                            site_key, self._site_links_result(site_key, future)
+                        )
+
+            links_results = {
+                site_key: site_results[site_key] for site_key in self.collectors
+            }
+            all_subscription_links = self._build_subscription_link_list(links_results)
+            self.logger.info(
+                f"🔍 共收集到 {len(all_subscription_links)} 个订阅链接，等待解析完成..."
+            )
+
+            outcomes = []
+            for site_key in links_results:
+                outcomes.extend(f.result() for f in parse_futures.get(site_key, []))
+        self._log_shared_links()
+
+        return self._merge_subscription_results(
+            links_results, all_subscription_links, outcomes
+        )
 
-        # 收集所有订阅链接进行统一解析
+    def _build_subscription_link_list(self, links_results: Dict[str, Dict]) -> List[Dict]:
+        """按网站顺序展开阶段1结果中的订阅链接"""
         all_subscription_links = []
         for site_key, site_data in links_results.items():
             if site_data.get("success") and site_data.get("subscription_links"):
@@ -206,39 +449,55 @@ class CollectorManager:
                             "site_name": site_data["name"],
                         }
                     )
+        return all_subscription_links
 
-        self.logger.info(
-            f"🔍 共收集到 {len(all_subscription_links)} 个订阅链接，开始统一解析..."
-        )
+    def _merge_subscription_results(
+        self,
+        links_results: Dict[str, Dict],
+        all_subscription_links: List[Dict],
+        outcomes: List[Tuple[Optional[List[str]], Optional[Exception]]],
+    ) -> Dict[str, Dict]:
+        """
+        将订阅解析结果合并为每个网站的最终结果
 
-        # 解析所有订阅链接（带容错机制）
+        Args:
+            links_results: 阶段1的链接收集结果
+            all_subscription_links: 展开后的订阅链接列表
+            outcomes: 与订阅链接顺序一致的 (节点列表, 异常) 列表
+
+        Returns:
+            最终的节点收集结果
+        """
+        final_results = {}
         parsed_nodes = {}
+        node_sources = {}
         failed_links = 0
         total_parsed = 0
 
-        for link_info in all_subscription_links:
+        # 按原始链接顺序合并结果，保证每个网站的节点顺序稳定
+        for link_info, (nodes, error) in zip(all_subscription_links, outcomes):
             site_key = link_info["site_key"]
             link = link_info["link"]
             site_name = link_info["site_name"]
 
-            try:
-                self.logger.debug(f"解析 {site_name}: {link[:50]}...")
-                nodes = self._parse_single_subscription_with_retry(link)
-
-                if nodes:  # 只记录有内容的解析结果
-                    if site_key not in parsed_nodes:
-                        parsed_nodes[site_key] = []
-                    parsed_nodes[site_key].extend(nodes)
-                    total_parsed += len(nodes)
-                    self.logger.debug(f"✓ {site_name} 解析成功: {len(nodes)} 个节点")
-                else:
-                    self.logger.debug(f"⚠️ {site_name} 解析为空: {link[:50]}...")
-
-            except Exception as e:
+            if error is not None:
                 failed_links += 1
                 self.logger.warning(
-                    f"❌ 订阅链接解析失败 {site_name}: {link[:50]}... - {str(e)}"
+                    f"❌ 订阅链接解析失败 {site_name}: {link[:50]}... - {str(error)}"
                 )
+                continue
+
+            if nodes:  # 只记录有内容的解析结果
+                if site_key not in parsed_nodes:
+                    parsed_nodes[site_key] = []
+                parsed_nodes[site_key].extend(nodes)
+                sources = node_sources.setdefault(site_key, {})
+                for node in nodes:
+                    sources.setdefault(node, link)
+                total_parsed += len(nodes)
+                self.logger.debug(f"✓ {site_name} 解析成功: {len(nodes)} 个节点")
+            else:
+                self.logger.debug(f"⚠️ {site_name} 解析为空: {link[:50]}...")
 
         if failed_links > 0:
             success_rate = (
@@ -253,7 +512,7 @@ class CollectorManager:
         # 合并结果
         for site_key, site_data in links_results.items():
             nodes = parsed_nodes.get(site_key, [])
-            # 高级去重（基于server:port）
+            # 高级去重（基于节点指纹）
             unique_nodes = self._deduplicate_nodes_advanced(nodes)
 
             final_results[site_key] = {
@@ -261,6 +520,10 @@ class CollectorManager:
                 "nodes": unique_nodes,
                 "article_url": site_data.get("article_url"),
                 "subscription_links": site_data.get("subscription_links", []),
+                # 每个节点第一次出现的订阅链接
+                "node_sources": {
+                    node: node_sources[site_key][node] for node in unique_nodes
+                },
                 "success": len(unique_nodes) > 0,
             }
 
@@ -274,19 +537,117 @@ class CollectorManager:
         return final_results
 
     def _deduplicate_nodes_advanced(self, nodes: List[str]) -> List[str]:
-        """高级去重：基于server:port组合去重"""
+        """高级去重：基于节点指纹去重"""
         return self._deduplicate_nodes(nodes)
 
+    def _parse_subscription_links(
+        self, link_infos: List[Dict]
+    ) -> List[Tuple[Optional[List[str]], Optional[Exception]]]:
+        """
+        并行获取并解析订阅链接
+
+        并发总数由 SUBSCRIPTION_CONCURRENCY 控制，同一主机的并发数由
+        SUBSCRIPTION_PER_HOST_LIMIT 控制。
+
+        Args:
+            link_infos: 订阅链接信息列表
+
+        Returns:
+            与输入顺序一致的 (节点列表, 异常) 列表
+        """
+        if not link_infos:
+            return []
+
+        # 跨网站去重：同一规范化URL只解析一次，结果分配给每个引用它的网站
+        groups: Dict[str, List[int]] = {}
+        for index, link_info in enumerate(link_infos):
+            groups.setdefault(canonicalize_url(link_info["link"]), []).append(index)
+        unique_indexes = [indexes[0] for indexes in groups.values()]
+
+        max_workers = max(
+            1, min(self.config_manager.base.SUBSCRIPTION_CONCURRENCY, len(unique_indexes))
+        )
+
+        def parse_one(index: int) -> Tuple[Optional[List[str]], Optional[Exception]]:
+            link_info = link_infos[index]
+            return self._parse_link_guarded(link_info["site_name"], link_info["link"])
+
+        if max_workers == 1:
+            unique_outcomes = [parse_one(index) for index in unique_indexes]
+        else:
+            self.logger.info(
+                f"⚡ 并行解析订阅链接，并发数: {max_workers}，单主机上限: "
+                f"{self.config_manager.base.SUBSCRIPTION_PER_HOST_LIMIT}"
+            )
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="parse_subscription"
+            ) as executor:
+                unique_outcomes = list(executor.map(parse_one, unique_indexes))
+
+        outcomes: List[Tuple[Optional[List[str]], Optional[Exception]]] = [
+            (None, None)
+        ] * len(link_infos)
+        for indexes, outcome in zip(groups.values(), unique_outcomes):
+            for index in indexes:
+                outcomes[index] = outcome
+        return outcomes
+
+    def _parse_link_guarded(
+        self, site_name: str, link: str
+    ) -> Tuple[Optional[List[str]], Optional[Exception]]:
+        """
+        在主机并发槽位内解析单个订阅链接，异常作为结果返回
+
+        相同规范化URL的请求（包括进行中的请求）只执行一次，其余调用共享结果；
+        等待共享结果的调用不占用主机槽位。
+        """
+        self.logger.debug(f"解析 {site_name}: {link[:50]}...")
+
+        def fetch() -> List[str]:
+            with self._host_slot(link):
+                return self._parse_single_subscription_with_retry(link)
+
+        try:
+            return self._link_flight.do(canonicalize_url(link), fetch), None
+        except Exception as e:
+            return None, e
+
+    def _log_shared_links(self) -> None:
+        """输出跨网站共享的订阅链接数量"""
+        if self._link_flight.shared:
+            self.logger.info(
+                f"🔗 {self._link_flight.shared} 个重复订阅链接复用了已有解析结果"
+                f"（实际解析 {self._link_flight.executed} 个）"
+            )
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """获取订阅链接所在主机的并发槽位"""
+        host = (urlparse(url).hostname or "").lower()
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(
+                    max(1, self.config_manager.base.SUBSCRIPTION_PER_HOST_LIMIT)
+                )
+                self._host_slots[host] = slot
+        return slot
+
+    def _get_subscription_parser(self):
+        """获取共享的订阅解析器（线程安全，无需每个链接重新创建）"""
+        if self._subscription_parser is None:
+            from src.core.subscription_parser import get_subscription_parser
+
+            self._subscription_parser = get_subscription_parser()
+        return self._subscription_parser
+
     def _parse_single_subscription_with_retry(self, subscription_url: str) -> List[str]:
         """解析单个订阅链接（带重试机制）"""
         max_retries = 2
         retry_delay = 1
+        parser = self._get_subscription_parser()
 
         for attempt in range(max_retries):
             try:
-                from src.core.subscription_parser import SubscriptionParser
-
-                parser = SubscriptionParser()
                 nodes = parser.parse_subscription_url(subscription_url)
 
                 # 验证解析结果
@@ -331,21 +692,62 @@ class CollectorManager:
             self.logger.error("没有可用的收集器")
             return {}
 
-        # 阶段1：收集所有链接（文章URL和订阅链接）
-        self.logger.info("📋 阶段1：收集文章链接和订阅链接...")
-        links_results = self.collect_all_links()
+        base_config = self.config_manager.base
+        if base_config.STREAMING_PIPELINE and base_config.CONCURRENT_COLLECTION:
+            # 阶段1和阶段2流水线执行：网站完成后立即解析其订阅链接
+            self.logger.info("📋 流水线：收集链接的同时解析订阅链接...")
+            final_results = self.collect_and_parse_pipelined()
+        else:
+            # 阶段1：收集所有链接（文章URL和订阅链接）
+            self.logger.info("📋 阶段1：收集文章链接和订阅链接...")
+            links_results = self.collect_all_links()
 
-        # 阶段2：统一解析所有订阅链接
-        self.logger.info("🔍 阶段2：统一解析订阅链接...")
-        final_results = self.parse_all_subscriptions(links_results)
+            # 阶段2：统一解析所有订阅链接
+            self.logger.info("🔍 阶段2：统一解析订阅链接...")
+            final_results = self.parse_all_subscriptions(links_results)
 
         total_nodes = sum(
             len(result.get("nodes", [])) for result in final_results.values()
         )
         self.logger.info(f"所有网站收集完成，共获取 {total_nodes} 个节点")
+        self._finish_parse_cache()
+        self._finish_http_cache()
+        self._log_decode_stats()
+        shutdown_browser_pool()
+        flush_debug_artifacts()
 
         return final_results
 
+    def _finish_parse_cache(self) -> None:
+        """输出本次运行的解析缓存命中率并持久化"""
+        from src.core.parse_cache import get_parse_cache
+
+        parse_cache = get_parse_cache()
+        stats = parse_cache.get_stats()
+        self.logger.info(
+            f"💾 解析缓存: 命中 {stats['hits']} 次, 未命中 {stats['misses']} 次, "
+            f"命中率 {stats['hit_rate']:.1%}"
+        )
+        parse_cache.save()
+
+    def _finish_http_cache(self) -> None:
+        """清理本次运行未使用的过期HTTP缓存条目（CI在运行结束后保存缓存目录）"""
+        from src.core.http_cache import get_http_cache
+
+        http_cache = get_http_cache()
+        if http_cache is not None:
+            http_cache.prune()
+
+    def _log_decode_stats(self) -> None:
+        """输出本次运行各解码阶段的耗时统计"""
+        from src.core.decode_engine import get_decode_stats
+
+        for stage, entry in sorted(get_decode_stats().get_stats().items()):
+            self.logger.info(
+                f"⏱️ 解码阶段 {stage}: 调用 {entry['calls']} 次, 命中 {entry['hits']} 次, "
+                f"{entry['nodes']} 个节点, 耗时 {entry['seconds']:.3f}s"
+            )
+
     def run_single_collector(self, site_key: str) -> Tuple[bool, List[str]]:
         """运行单个收集器"""
         if site_key not in self.collectors:
@@ -410,9 +812,8 @@ class CollectorManager:
                 success_count += 1
                 all_nodes.extend(nodes)
 
-            # 请求间隔
-            if i < total_count:
-                time.sleep(self.config_manager.base.REQUEST_DELAY)
+        shutdown_browser_pool()
+        flush_debug_artifacts()
 
         # 去重节点
         unique_nodes = self._deduplicate_nodes(all_nodes)
@@ -435,49 +836,8 @@ class CollectorManager:
         return {site_key: self.results[site_key]["nodes"] for site_key in self.results}
 
     def _deduplicate_nodes(self, nodes: List[str]) -> List[str]:
-        """去重节点，基于server:port组合"""
-        if not nodes:
-            return []
-
-        seen = set()
-        unique_nodes = []
-
-        for node in nodes:
-            server_port = self._extract_server_port(node)
-            if server_port and server_port not in seen:
-                seen.add(server_port)
-                unique_nodes.append(node)
-
-        return unique_nodes
-
-    def _extract_server_port(self, node: str) -> Optional[str]:
-        """从节点中提取server:port作为唯一标识"""
-        try:
-            if "://" not in node:
-                return None
-
-            protocol = node.split("://", 1)[0]
-            rest = node.split("://", 1)[1]
-
-            # 移除名称部分
-            if "#" in rest:
-                rest = rest.rsplit("#", 1)[0]
-
-            # 提取server:port
-            if "@" in rest:
-                rest = rest.split("@", 1)[1]
-
-            if ":" in rest:
-                parts = rest.split(":")
-                if len(parts) >= 2:
-                    server = parts[0]
-                    port = parts[1].split("?")[0].split("/")[0].rstrip("/")
-                    return f"{server}:{port}"
-
-        except Exception:
-            pass
-
-        return None
+        """去重节点，基于协议感知的节点指纹（无法解析的节点保留，按原始字符串去重）"""
+        return dedupe_nodes(nodes, keep_unparsed=True)
 
     def get_results_summary(self) -> Dict:
         """获取收集结果摘要"""
@@ -49,6 +49,22 @@ class BaseConfig:
         # 测试配置
         self.CONNECTION_TIMEOUT = int(os.getenv("CONNECTION_TIMEOUT", "5"))
         self.MAX_WORKERS = int(os.getenv("MAX_WORKERS", "10"))
+        self.CONCURRENT_COLLECTION = (
+            os.getenv("CONCURRENT_COLLECTION", "True").lower() == "true"
+        )
+        self.SUBSCRIPTION_CONCURRENCY = int(
+            os.getenv("SUBSCRIPTION_CONCURRENCY", str(self.MAX_WORKERS))
+        )
+        self.SUBSCRIPTION_PER_HOST_LIMIT = int(
+            os.getenv("SUBSCRIPTION_PER_HOST_LIMIT", "2")
+        )
+        self.STREAMING_PIPELINE = (
+            os.getenv("STREAMING_PIPELINE", "True").lower() == "true"
+        )
+        self.BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "3"))
+        self.BROWSER_LOAD_PROFILE = os.getenv("BROWSER_LOAD_PROFILE", "lean")
+        self.V2RAYSE_CAPTURE_MODE = os.getenv("V2RAYSE_CAPTURE_MODE", "api")
+        self.V2RAYSE_API_TIMEOUT = int(os.getenv("V2RAYSE_API_TIMEOUT", "30"))
 
         # 文件路径配置
         self.DATA_DIR = self.PROJECT_ROOT / "data"
@@ -85,9 +101,28 @@ class BaseConfig:
         # 性能配置
         self.BATCH_SIZE = int(os.getenv("BATCH_SIZE", "100"))
         self.CACHE_TTL = int(os.getenv("CACHE_TTL", "3600"))
+        self.HTTP_CACHE_ENABLED = (
+            os.getenv("HTTP_CACHE_ENABLED", "True").lower() == "true"
+        )
+        self.HTTP_CACHE_DIR = self.DATA_DIR / "cache" / "http"
+        self.HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+        self.PARSE_CACHE_PERSIST = (
+            os.getenv("PARSE_CACHE_PERSIST", "False").lower() == "true"
+        )
+        self.PARSE_CACHE_FILE = self.DATA_DIR / "cache" / "parse_cache.json"
+        self.BROWSER_STATE_ENABLED = (
+            os.getenv("BROWSER_STATE_ENABLED", "True").lower() == "true"
+        )
+        self.BROWSER_STATE_DIR = self.DATA_DIR / "cache" / "browser_state"
+        self.BROWSER_STATE_TTL = int(os.getenv("BROWSER_STATE_TTL", "86400"))
 
         # 调试配置
         self.DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+        self.DEBUG_ARTIFACTS = os.getenv(
+            "DEBUG_ARTIFACTS", "full" if self.DEBUG else "off"
+        )
+        self.DEBUG_ARTIFACT_RUNS = int(os.getenv("DEBUG_ARTIFACT_RUNS", "5"))
+        self.DEBUG_DIR = self.DATA_DIR / "debug"
 
         # API配置
         self.API_ENABLED = os.getenv("API_ENABLED", "False").lower() == "true"
@@ -189,8 +224,24 @@ class ConfigManager:
                 "user_agent": self.base.USER_AGENT,
                 "connection_timeout": self.base.CONNECTION_TIMEOUT,
                 "max_workers": self.base.MAX_WORKERS,
+                "concurrent_collection": self.base.CONCURRENT_COLLECTION,
+                "subscription_concurrency": self.base.SUBSCRIPTION_CONCURRENCY,
+                "subscription_per_host_limit": self.base.SUBSCRIPTION_PER_HOST_LIMIT,
+                "streaming_pipeline": self.base.STREAMING_PIPELINE,
+                "browser_pool_size": self.base.BROWSER_POOL_SIZE,
+                "browser_load_profile": self.base.BROWSER_LOAD_PROFILE,
+                "v2rayse_capture_mode": self.base.V2RAYSE_CAPTURE_MODE,
+                "v2rayse_api_timeout": self.base.V2RAYSE_API_TIMEOUT,
+                "cache_ttl": self.base.CACHE_TTL,
+                "http_cache_enabled": self.base.HTTP_CACHE_ENABLED,
+                "http_cache_max_age": self.base.HTTP_CACHE_MAX_AGE,
+                "parse_cache_persist": self.base.PARSE_CACHE_PERSIST,
+                "browser_state_enabled": self.base.BROWSER_STATE_ENABLED,
+                "browser_state_ttl": self.base.BROWSER_STATE_TTL,
                 "log_level": self.base.LOG_LEVEL,
                 "debug": self.base.DEBUG,
+                "debug_artifacts": self.base.DEBUG_ARTIFACTS,
+                "debug_artifact_runs": self.base.DEBUG_ARTIFACT_RUNS,
                 "api_enabled": self.base.API_ENABLED,
                 "api_host": self.base.API_HOST,
                 "api_port": self.base.API_PORT,
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+调试文件保存
+按 DEBUG_ARTIFACTS 级别决定是否保存调试HTML和截图，由后台线程写入磁盘，
+每次运行使用单独的目录，只保留最近 DEBUG_ARTIFACT_RUNS 次运行
+"""
+
+import atexit
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Union
+
+from src.core.config_manager import get_config
+from src.utils.logger import get_logger
+
+# 调试级别：off 不保存；html 保存页面HTML和文本；full 另外保存截图
+ARTIFACT_LEVELS = {"off": 0, "html": 1, "full": 2}
+
+# 各类调试文件需要的最低级别
+ARTIFACT_KINDS = {"html": 1, "text": 1, "screenshot": 2}
+
+
+class DebugArtifacts:
+    """调试文件保存器"""
+
+    def __init__(self, debug_dir: Path, level: str = "off", max_runs: int = 5):
+        """
+        初始化调试文件保存器
+
+        Args:
+            debug_dir: 调试文件根目录
+            level: 调试级别（off / html / full）
+            max_runs: 保留最近几次运行的调试文件
+        """
+        self.debug_dir = Path(debug_dir)
+        self.level = ARTIFACT_LEVELS.get(level, 0)
+        self.max_runs = max(1, max_runs)
+        self.logger = get_logger("debug_artifacts")
+        self.run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        self._run_dir: Optional[Path] = None
+        self._names = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+
+    def enabled(self, kind: str = "html") -> bool:
+        """
+        判断某类调试文件是否需要保存（截图等开销较大的操作应先调用此方法）
+
+        Args:
+            kind: 调试文件类型（html / text / screenshot）
+
+        Returns:
+            是否需要保存
+        """
+        return self.level >= ARTIFACT_KINDS.get(kind, 1)
+
+    def save(self, kind: str, name: str, content: Union[str, bytes]) -> Optional[Path]:
+        """
+        在后台保存调试文件（不阻塞调用方）
+
+        Args:
+            kind: 调试文件类型（html / text / screenshot）
+            name: 文件名，同一次运行中重名时自动添加序号
+            content: 文件内容
+
+        Returns:
+            文件路径，未启用时返回None
+        """
+        if not self.enabled(kind):
+            return None
+
+        with self._lock:
+            path = self._reserve_path(name)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug_artifacts")
+            self._pending = [future for future in self._pending if not future.done()]
+            self._pending.append(self._executor.submit(self._write, path, content))
+        return path
+
+    def _reserve_path(self, name: str) -> Path:
+        if self._run_dir is None:
+            self._run_dir = self.debug_dir / self.run_id
+            self._run_dir.mkdir(parents=True, exist_ok=True)
+            self._prune_old_runs()
+
+        name = re.sub(r"[^\w.-]", "_", name)
+        stem, suffix = os.path.splitext(name)
+        candidate, index = name, 1
+        while candidate in self._names:
+            index += 1
+            candidate = f"{stem}_{index}{suffix}"
+        self._names.add(candidate)
+        return self._run_dir / candidate
+
+    def _prune_old_runs(self) -> None:
+        """删除超出保留数量的旧运行目录（目录名以时间开头，按名称排序即按时间排序）"""
+        runs = sorted(path for path in self.debug_dir.iterdir() if path.is_dir())
+        for old_run in runs[: -self.max_runs]:
+            shutil.rmtree(old_run, ignore_errors=True)
+
+    def _write(self, path: Path, content: Union[str, bytes]) -> None:
+        try:
+            if isinstance(content, str):
+                path.write_text(content, encoding="utf-8")
+            else:
+                path.write_bytes(content)
+            self.logger.debug(f"💾 保存调试文件: {path} ({len(content)} bytes)")
+        except OSError as e:
+            self.logger.warning(f"保存调试文件失败: {path} - {str(e)}")
+
+    def flush(self) -> None:
+        """等待所有调试文件写入完成"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+
+# 全局单例实例
+_debug_artifacts = None
+_debug_artifacts_lock = threading.Lock()
+
+
+def get_debug_artifacts() -> DebugArtifacts:
+    """获取调试文件保存器单例实例"""
+    global _debug_artifacts
+    if _debug_artifacts is None:
+        with _debug_artifacts_lock:
+            if _debug_artifacts is None:
+                config = get_config().base
+                _debug_artifacts = DebugArtifacts(
+                    config.DEBUG_DIR, config.DEBUG_ARTIFACTS, config.DEBUG_ARTIFACT_RUNS
+                )
+                atexit.register(_debug_artifacts.flush)
+    return _debug_artifacts
+
+
+def flush_debug_artifacts() -> None:
+    """等待调试文件写入完成（运行结束时调用）"""
+    if _debug_artifacts is not None:
+        _debug_artifacts.flush()
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+订阅内容解码引擎
+SubscriptionParser、SubscriptionExtractor 和 BaseCollector 共用的唯一解码实现：
+先嗅探格式只运行对应的解码阶段，没有结果时按固定顺序尝试其余阶段；
+格式嗅探、Base64 和 URL 解码都在字节上进行，只有需要扫描节点的文本才按
+TEXT_ENCODING 解码为字符串；结果统一按长度过滤并保序去重，每个阶段记录耗时统计。
+收集器的特殊处理通过 DecodeHooks 注入，而不是重写整个解析流程
+"""
+
+import base64
+import binascii
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote_to_bytes
+
+from src.core.protocol_converter import URI_NODE_SCHEMES
+from src.utils.clash_yaml import load_clash_proxies, proxies_of
+from src.utils.content_sniffer import (
+    FORMAT_BASE64,
+    FORMAT_STRUCTURED,
+    FORMAT_URI,
+    FORMAT_URL_ENCODED,
+    decode_by_format,
+)
+from src.utils.logger import get_logger
+from src.utils.node_scanner import get_node_scanner
+
+# 解码输出的版本：提取、解码、过滤或去重规则改变了同一内容的结果时递增，
+# 持久化的解析缓存（parse_cache）以它派生版本，旧的解析结果随之失效
+DECODER_VERSION = 1
+
+# 行内 JSON 代理（"- {name: ..., server: ...}"），支持一层嵌套
+INLINE_JSON_PATTERN = re.compile(r"-\s*(\{[^}]*\{[^}]*\}[^}]*\})")
+INLINE_JSON_FALLBACK_PATTERN = re.compile(r"-\s*(\{.+\})")
+
+# Base64 逐行解码时忽略过短的行
+MIN_BASE64_LINE = 10
+
+# 字节转文本的统一策略：UTF-8（去掉开头的BOM），非法字节直接丢弃
+TEXT_ENCODING = "utf-8-sig"
+TEXT_ERRORS = "ignore"
+
+
+def to_text(raw: bytes) -> str:
+    """
+    按统一策略将字节解码为文本
+
+    Args:
+        raw: 原始字节
+
+    Returns:
+        文本
+    """
+    return raw.decode(TEXT_ENCODING, errors=TEXT_ERRORS)
+
+
+@dataclass
+class DecodeHooks:
+    """收集器可注入的解码钩子"""
+
+    # 从明文中提取节点（默认使用多协议节点扫描器）
+    extract_text: Optional[Callable[[str], List[str]]] = None
+    # 将 Clash 代理字典转换为节点URI（默认使用协议转换器）
+    convert_proxy: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None
+    # 按格式替换内置解码阶段（格式 -> 解码函数）
+    decoders: Dict[str, Callable[[str], List[str]]] = field(default_factory=dict)
+    # 对去重后的节点列表做最后处理
+    post_process: Optional[Callable[[List[str]], List[str]]] = None
+
+
+class DecodeStats:
+    """各解码阶段的调用次数、命中次数、节点数和耗时统计（线程安全）"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Dict[str, float]] = {}
+
+    def record(self, stage: str, seconds: float, node_count: int) -> None:
+        """
+        记录一次阶段执行
+
+        Args:
+            stage: 阶段名称
+            seconds: 耗时（秒）
+            node_count: 提取到的节点数
+        """
+        with self._lock:
+            entry = self._stages.setdefault(
+                stage, {"calls": 0, "hits": 0, "nodes": 0, "seconds": 0.0}
+            )
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            if node_count:
+                entry["hits"] += 1
+                entry["nodes"] += node_count
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """获取统计信息副本"""
+        with self._lock:
+            return {stage: dict(entry) for stage, entry in self._stages.items()}
+
+    def reset(self) -> None:
+        """清空统计"""
+        with self._lock:
+            self._stages.clear()
+
+
+class _Content:
+    """同时提供字节和文本视图的订阅内容（按需转换，只转换一次）"""
+
+    __slots__ = ("_text", "_raw")
+
+    def __init__(self, content: Union[str, bytes]):
+        if isinstance(content, bytes):
+            self._raw, self._text = content, None
+        else:
+            self._raw, self._text = None, content
+
+    @property
+    def original(self) -> Union[str, bytes]:
+        return self._text if self._raw is None else self._raw
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = to_text(self._raw)
+        return self._text
+
+    @property
+    def raw(self) -> bytes:
+        if self._raw is None:
+            self._raw = self._text.encode("utf-8", errors="ignore")
+        return self._raw
+
+
+class SubscriptionDecoder:
+    """订阅内容解码器"""
+
+    def __init__(
+        self,
+        converter,
+        min_node_length: int = 20,
+        logger=None,
+        hooks: Optional[DecodeHooks] = None,
+        stats: Optional[DecodeStats] = None,
+    ):
+        """
+        初始化解码器
+
+        Args:
+            converter: 协议转换器（Clash 代理 -> 节点URI）
+            min_node_length: 最小节点长度
+            logger: 日志记录器
+            hooks: 收集器注入的解码钩子
+            stats: 阶段统计，默认使用全局统计
+        """
+        self.converter = converter
+        self.min_node_length = min_node_length
+        self.logger = logger or get_logger("decode_engine")
+        self.hooks = hooks or DecodeHooks()
+        self.stats = stats or get_decode_stats()
+        self.node_scanner = get_node_scanner(URI_NODE_SCHEMES, '<>"')
+
+    def decode(self, content: Union[str, bytes]) -> List[str]:
+        """
+        解码订阅内容
+
+        Args:
+            content: 订阅内容（文本或原始字节）
+
+        Returns:
+            去重后的节点列表（保持首次出现顺序）
+        """
+        return self.decode_with_format(content)[1]
+
+    def decode_with_format(self, content: Union[str, bytes]) -> Tuple[Optional[str], List[str]]:
+        """
+        解码订阅内容并返回产生结果的格式
+
+        Args:
+            content: 订阅内容（文本或原始字节）
+
+        Returns:
+            (格式, 节点列表)，没有节点时格式为None
+        """
+        data = _Content(content)
+        # 文本阶段按需解码为字符串（只解码一次），字节阶段直接处理原始字节
+        stages = {
+            FORMAT_URI: lambda _: self._extract(data.text),
+            FORMAT_BASE64: lambda _: self.decode_base64(data.raw),
+            FORMAT_URL_ENCODED: lambda _: self.decode_url_encoded(data.raw),
+            FORMAT_STRUCTURED: lambda _: self.decode_structured(data.text),
+        }
+        for fmt, decoder in self.hooks.decoders.items():
+            stages[fmt] = lambda _, decoder=decoder: decoder(data.text)
+        timed = {fmt: self._timed(fmt, stage) for fmt, stage in stages.items()}
+
+        fmt, nodes = decode_by_format(data.original, timed)
+        nodes = self._finalize(nodes)
+        if fmt:
+            self.logger.debug(f"按 {fmt} 格式解码，提取到 {len(nodes)} 个节点")
+        return fmt, nodes
+
+    def _timed(self, stage: str, func: Callable[[Any], List[str]]) -> Callable[[Any], List[str]]:
+        def run(content: Any) -> List[str]:
+            started = time.perf_counter()
+            try:
+                nodes = func(content)
+            except Exception as e:
+                self.logger.debug(f"{stage} 解码失败: {str(e)}")
+                nodes = []
+            self.stats.record(stage, time.perf_counter() - started, len(nodes))
+            return nodes
+
+        return run
+
+    def _extract(self, text: str) -> List[str]:
+        """从明文提取节点"""
+        if self.hooks.extract_text is not None:
+            return self.hooks.extract_text(text)
+        return self.node_scanner.scan(text, self.min_node_length)
+
+    def _finalize(self, nodes: List[str]) -> List[str]:
+        """按长度过滤并保序去重"""
+        nodes = list(dict.fromkeys(node for node in nodes if len(node) >= self.min_node_length))
+        if self.hooks.post_process is not None:
+            nodes = self.hooks.post_process(nodes)
+        return nodes
+
+    # ------------------------------------------------------------------
+    # Base64
+    # ------------------------------------------------------------------
+
+    def decode_base64(self, raw: bytes) -> List[str]:
+        """
+        Base64 解码：整体编码（包括按固定宽度换行）的内容整体解码，
+        每行单独编码的内容逐行解码；单层没有结果时尝试双重解码
+
+        Args:
+            raw: 原始字节
+
+        Returns:
+            节点列表
+        """
+        lines = [line for line in (line.strip() for line in raw.splitlines()) if line]
+        whole = _is_wrapped_block(lines)
+        if whole:
+            nodes = self._decode_base64_block(b"".join(lines))
+            if nodes:
+                return nodes
+
+        nodes = []
+        for line in lines:
+            if len(line) >= MIN_BASE64_LINE:
+                nodes.extend(self._decode_base64_block(line))
+        if not nodes and not whole:
+            nodes = self._decode_base64_block(b"".join(lines))
+        return nodes
+
+    def _decode_base64_block(self, raw: bytes) -> List[str]:
+        decoded = _b64decode(raw)
+        if decoded is None:
+            return []
+        nodes = self._extract(to_text(decoded))
+        if nodes:
+            return nodes
+
+        # 双重Base64编码
+        double_decoded = _b64decode(decoded)
+        if double_decoded is None:
+            return []
+        return self._extract(to_text(double_decoded))
+
+    # ------------------------------------------------------------------
+    # URL编码
+    # ------------------------------------------------------------------
+
+    def decode_url_encoded(self, raw: bytes) -> List[str]:
+        """
+        URL 解码后提取节点
+
+        Args:
+            raw: 原始字节
+
+        Returns:
+            节点列表，内容不含URL编码时返回空列表
+        """
+        if b"%" not in raw:
+            return []
+        return self._extract(to_text(unquote_to_bytes(raw)))
+
+    # ------------------------------------------------------------------
+    # Clash YAML / JSON
+    # ------------------------------------------------------------------
+
+    def decode_structured(self, text: str) -> List[str]:
+        """
+        解析 Clash 配置：依次尝试完整JSON、YAML（只解析 proxies 段）、行内JSON对象
+
+        Args:
+            text: 订阅文本
+
+        Returns:
+            节点列表
+        """
+        text = text.strip()
+        if not text:
+            return []
+
+        proxies = self._load_json_proxies(text)
+        if proxies is None:
+            proxies = self._load_yaml_proxies(text)
+        if proxies:
+            return self._convert_proxies(proxies)
+
+        if "proxies" in text:
+            return self._decode_inline_json(text)
+        return []
+
+    def _load_json_proxies(self, text: str) -> Optional[List[Any]]:
+        if text[0] not in "{[":
+            return None
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        return proxies_of(data)
+
+    def _load_yaml_proxies(self, text: str) -> Optional[List[Any]]:
+        try:
+            return load_clash_proxies(text)
+        except Exception as e:
+            self.logger.debug(f"YAML解析失败: {str(e)}")
+            return None
+
+    def _decode_inline_json(self, text: str) -> List[str]:
+        """从无法整体解析的YAML文本中提取行内JSON代理"""
+        proxies = []
+        for line in text.splitlines():
+            line = line.strip()
+            matches = INLINE_JSON_PATTERN.findall(line)
+            if not matches:
+                match = INLINE_JSON_FALLBACK_PATTERN.search(line)
+                matches = [match.group(1)] if match else []
+            for json_str in matches:
+                try:
+                    proxies.append(json.loads(json_str))
+                except ValueError:
+                    continue
+
+        self.logger.debug(f"从YAML文本中找到 {len(proxies)} 个行内JSON代理")
+        return self._convert_proxies(proxies)
+
+    def _convert_proxies(self, proxies: List[Any]) -> List[str]:
+        """将 Clash 代理列表转换为节点URI"""
+        convert = self.hooks.convert_proxy or self.converter.convert
+        nodes = []
+        for proxy in proxies:
+            if not isinstance(proxy, dict):
+                continue
+            try:
+                node = convert(proxy)
+            except Exception as e:
+                self.logger.debug(f"Clash代理转换失败: {str(e)}")
+                continue
+            if node and len(node) >= self.min_node_length:
+                nodes.append(node)
+        return nodes
+
+
+def _b64decode(data: bytes) -> Optional[bytes]:
+    """宽松的Base64解码（忽略空白和非法字符，自动补齐padding），失败时返回None"""
+    data = b"".join(data.split())
+    try:
+        return base64.b64decode(data + b"=" * (-len(data) % 4))
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _is_wrapped_block(lines: List[bytes]) -> bool:
+    """判断多行Base64是否为一整段按固定宽度换行的编码（而不是每行单独编码）"""
+    if len(lines) <= 1:
+        return True
+    width = len(lines[0])
+    return (
+        all(len(line) == width and not line.endswith(b"=") for line in lines[:-1])
+        and len(lines[-1]) <= width
+    )
+
+
+# 全局单例实例
+_decode_stats = None
+_decode_stats_lock = threading.Lock()
+
+
+def get_decode_stats() -> DecodeStats:
+    """获取解码阶段统计单例实例"""
+    global _decode_stats
+    if _decode_stats is None:
+        with _decode_stats_lock:
+            if _decode_stats is None:
+                _decode_stats = DecodeStats()
+    return _decode_stats
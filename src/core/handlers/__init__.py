@@ -4,7 +4,8 @@
 """
 
 from .request_handler import RequestHandler
+from .async_request_handler import AsyncRequestHandler
 from .article_finder import ArticleFinder
 from .subscription_extractor import SubscriptionExtractor
 
-__all__ = ["RequestHandler", "ArticleFinder", "SubscriptionExtractor"]
\ No newline at end of file
+__all__ = ["RequestHandler", "AsyncRequestHandler", "ArticleFinder", "SubscriptionExtractor"]
\ No newline at end of file
@@ -5,11 +5,13 @@
 """
 
 import re
-import os
 from datetime import datetime
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
-from playwright.sync_api import sync_playwright
+
+from src.core.browser_pool import get_browser_pool, get_load_profile
+from src.core.browser_state import state_key_for
+from src.core.debug_artifacts import get_debug_artifacts
 
 
 class ArticleFinder:
@@ -279,41 +281,21 @@ class ArticleFinder:
         try:
             self.logger.info(f"启动浏览器访问: {self.base_url} (禁用代理)")
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=["--no-sandbox", "--disable-dev-shm-usage"],
-                )
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    viewport={"width": 1920, "height": 1080},
-                    locale="zh-CN",
-                )
-                page = context.new_page()
-                # 使用 domcontentloaded 避免 networkidle 超时
-                page.goto(self.base_url, wait_until="domcontentloaded", timeout=30000)
-                # 等待额外时间让JS执行
-                page.wait_for_timeout(3000)
-                content = page.content()
-                browser.close()
+            # 使用 domcontentloaded 避免 networkidle 超时，文章链接出现即读取
+            content = get_browser_pool().fetch_content(
+                self.base_url,
+                wait_until="domcontentloaded",
+                timeout=30000,
+                settle_ms=3000,
+                ready_selectors=self.site_config.get("selectors"),
+                profile=get_load_profile(self.site_config),
+                state_key=state_key_for(self.site_config),
+            )
 
             self.logger.info(f"浏览器获取到 {len(content)} 字节内容")
 
-            # 保存调试HTML
-            debug_dir = os.path.join(os.getcwd(), "data", "debug")
-            os.makedirs(debug_dir, exist_ok=True)
-            debug_file = os.path.join(
-                debug_dir,
-                f"debug_{self.site_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html",
-            )
-            try:
-                with open(debug_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                self.logger.info(
-                    f"💾 保存调试HTML到: {debug_file} ({len(content)} bytes)"
-                )
-            except Exception as e:
-                self.logger.warning(f"保存调试HTML失败: {str(e)}")
+            # 保存调试HTML（按 DEBUG_ARTIFACTS 级别，后台写入）
+            get_debug_artifacts().save("html", f"{self.site_name}_browser.html", content)
 
             soup = BeautifulSoup(content, "html.parser")
             article_url = self.find_latest_article(soup, target_date)
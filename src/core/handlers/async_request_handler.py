@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+异步请求处理器 - 基于aiohttp的网络请求和重试逻辑
+"""
+
+import asyncio
+import os
+import random
+from typing import Dict, Optional
+
+from src.core.exceptions import NetworkError
+from src.core.http_client import HttpClientRegistry, aiohttp
+
+
+class AsyncRequestHandler:
+    """异步请求处理器"""
+
+    def __init__(
+        self,
+        http_client: HttpClientRegistry,
+        timeout,
+        retry_count,
+        logger,
+        proxy: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        scheduler=None,
+    ):
+        """
+        初始化异步请求处理器
+
+        Args:
+            http_client: HTTP客户端注册表
+            timeout: 请求超时时间（秒）
+            retry_count: 重试次数
+            logger: 日志记录器
+            proxy: 代理地址，为None时直连
+            headers: 默认请求头
+            scheduler: 按主机的访问频率调度器，为None时不限速
+        """
+        self.http_client = http_client
+        self.timeout = timeout
+        self.retry_count = retry_count
+        self.logger = logger
+        self.proxy = proxy
+        self.headers = headers or {}
+        self.scheduler = scheduler
+        self._session = None
+        self._loop = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """获取当前事件循环上的会话（会话不能跨事件循环复用）"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = self.http_client.create_async_session(
+                headers=self.headers, timeout=self.timeout
+            )
+            self._loop = loop
+        return self._session
+
+    async def fetch_text(self, url: str) -> str:
+        """
+        带重试机制的异步GET请求，支持代理失败时自动切换到直接连接
+
+        Args:
+            url: 请求URL
+
+        Returns:
+            响应文本
+
+        Raises:
+            Exception: 所有重试都失败后抛出异常
+        """
+        last_exception = None
+        # 代理失败时只对本次请求切换为直连，不影响之后的请求
+        proxy = self.proxy
+        using_proxy = bool(proxy)
+        # 使用代理时内容过短的响应（没有剩余次数进行直连重试时返回它）
+        short_text = None
+
+        for attempt in range(self.retry_count + 1):
+            try:
+                # GitHub Actions环境下添加随机延迟
+                if os.getenv("GITHUB_ACTIONS") == "true" and attempt > 0:
+                    await asyncio.sleep(random.uniform(1, 3))
+
+                if self.scheduler is not None:
+                    await self.scheduler.acquire_async(url)
+
+                session = self._get_session()
+                async with session.get(url, proxy=proxy) as response:
+                    response.raise_for_status()
+                    text = await response.text(errors="replace")
+
+                # 检查返回内容是否过短（可能被拦截）
+                if using_proxy and len(text) < 1000:
+                    self.logger.warning(f"返回内容过短（{len(text)}字节），可能被拦截: {url}")
+                    if attempt == 0:
+                        self.logger.info(f"尝试禁用代理直接访问: {url}")
+                        short_text = text
+                        proxy = None
+                        using_proxy = False
+                        continue
+
+                return text
+
+            except asyncio.TimeoutError as e:
+                last_exception = e
+                self.logger.warning(f"请求超时 (尝试 {attempt + 1}/{self.retry_count + 1}): {url}")
+                if attempt < self.retry_count:
+                    await asyncio.sleep(2**attempt)  # 指数退避
+
+            except aiohttp.ClientConnectionError as e:
+                last_exception = e
+                self.logger.warning(f"连接错误 (尝试 {attempt + 1}/{self.retry_count + 1}): {url}")
+
+                # 如果使用代理且连接失败，尝试禁用代理重试
+                if using_proxy and attempt == 0:
+                    self.logger.info(f"代理连接失败，尝试直接访问: {url}")
+                    proxy = None
+                    using_proxy = False
+                    continue
+
+                if attempt < self.retry_count:
+                    await asyncio.sleep(2**attempt)
+
+            except aiohttp.ClientError as e:
+                last_exception = e
+                self.logger.warning(f"请求错误 (尝试 {attempt + 1}/{self.retry_count + 1}): {url}")
+                if attempt < self.retry_count:
+                    await asyncio.sleep(1)
+
+        if short_text is not None and last_exception is None:
+            return short_text
+
+        # 所有重试都失败
+        self.logger.error(f"请求失败，已重试 {self.retry_count + 1} 次: {last_exception}")
+        if last_exception is None:
+            raise NetworkError(f"请求失败（没有可用的请求次数）: {url}")
+        raise last_exception
+
+    async def close(self) -> None:
+        """关闭底层会话"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
@@ -18,7 +18,9 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 class RequestHandler:
     """请求处理器"""
 
-    def __init__(self, session, timeout, retry_count, logger):
+    def __init__(
+        self, session, timeout, retry_count, logger, http_cache=None, scheduler=None
+    ):
         """
         初始化请求处理器
 
@@ -27,11 +29,15 @@ class RequestHandler:
             timeout: 请求超时时间（秒）
             retry_count: 重试次数
             logger: 日志记录器
+            http_cache: HTTP条件请求缓存，为None时不使用缓存
+            scheduler: 按主机的访问频率调度器，为None时不限速
         """
         self.session = session
         self.timeout = timeout
         self.retry_count = retry_count
         self.logger = logger
+        self.http_cache = http_cache
+        self.scheduler = scheduler
 
     def make_request(self, url, method="GET", **kwargs):
         """
@@ -59,15 +65,13 @@ class RequestHandler:
                 if os.getenv("GITHUB_ACTIONS") == "true" and attempt > 0:
                     time.sleep(random.uniform(1, 3))
 
-                response = self.session.request(
-                    method, url, timeout=self.timeout, verify=False, **kwargs
-                )
+                response = self._send(method, url, **kwargs)
                 response.raise_for_status()
 
                 # 检查返回内容是否过短（可能被拦截）
-                if using_proxy and len(response.text) < 1000:
+                if using_proxy and len(response.content) < 1000:
                     self.logger.warning(
-                        f"返回内容过短（{len(response.text)}字节），可能被拦截: {url}"
+                        f"返回内容过短（{len(response.content)}字节），可能被拦截: {url}"
                     )
                     if attempt == 0:
                         self.logger.info(f"尝试禁用代理直接访问: {url}")
@@ -75,6 +79,8 @@ class RequestHandler:
                         using_proxy = False
                         continue
 
+                if self.http_cache is not None:
+                    self.http_cache.store(url, response)
                 return response
 
             except requests.exceptions.Timeout as e:
@@ -115,6 +121,28 @@ class RequestHandler:
         )
         raise last_exception
 
+    def _send(self, method, url, **kwargs):
+        """发送单次请求，启用缓存时附带条件请求头，启用调度器时按主机限速"""
+        before_send = None
+        if self.scheduler is not None:
+            before_send = lambda: self.scheduler.acquire(url)
+
+        if self.http_cache is None:
+            if before_send:
+                before_send()
+            return self.session.request(
+                method, url, timeout=self.timeout, verify=False, **kwargs
+            )
+        return self.http_cache.request(
+            self.session,
+            method,
+            url,
+            before_send=before_send,
+            timeout=self.timeout,
+            verify=False,
+            **kwargs,
+        )
+
     def test_proxy_connection(self):
         """测试代理连接"""
         if not self.session.proxies.get("http"):
@@ -5,15 +5,16 @@
 """
 
 import re
-import base64
-from urllib.parse import unquote
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
+
+from src.core.decode_engine import SubscriptionDecoder
+from src.utils.node_scanner import get_node_scanner
 
 
 class SubscriptionExtractor:
     """订阅提取器"""
 
-    def __init__(self, logger, site_config, converter, min_node_length=20):
+    def __init__(self, logger, site_config, converter, min_node_length=20, hooks=None):
         """
         初始化订阅提取器
 
@@ -22,11 +23,18 @@ class SubscriptionExtractor:
             site_config: 网站配置
             converter: 协议转换器
             min_node_length: 最小节点长度
+            hooks: 收集器的解码钩子（DecodeHooks）
         """
         self.logger = logger
         self.site_config = site_config
         self.converter = converter
         self.min_node_length = min_node_length
+        self.decoder = SubscriptionDecoder(
+            converter,
+            min_node_length,
+            logger,
+            hooks,
+        )
 
     def find_subscription_links(self, content: str) -> List[str]:
         """
@@ -103,26 +111,16 @@ class SubscriptionExtractor:
         Returns:
             节点列表
         """
-        from src.config.websites import NODE_PATTERNS
+        from src.config.websites import NODE_SCHEMES
 
-        nodes = []
-        for pattern in NODE_PATTERNS:
-            try:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    node = match.strip()
-                    if node and len(node) >= self.min_node_length:
-                        nodes.append(node)
-            except Exception as e:
-                self.logger.warning(f"节点模式匹配失败: {pattern} - {str(e)}")
-        return nodes
+        return get_node_scanner(NODE_SCHEMES).scan(text, self.min_node_length)
 
-    def parse_subscription_content(self, content: str) -> List[str]:
+    def parse_subscription_content(self, content: Union[str, bytes]) -> List[str]:
         """
         解析订阅内容，支持多种编码格式
 
         Args:
-            content: 订阅内容
+            content: 订阅内容（原始字节或文本）
 
         Returns:
             节点列表
@@ -136,254 +134,9 @@ class SubscriptionExtractor:
             self.logger.warning(f"订阅链接内容过短 ({len(content)} 字符)")
             return []
 
-        # 尝试多种解析方式
-        all_nodes = []
-
-        # 方式1: 直接从原始内容提取
-        nodes = self.extract_nodes_from_text(content)
-        if nodes:
-            self.logger.info(f"直接解析获取到 {len(nodes)} 个节点")
-            all_nodes.extend(nodes)
-
-        # 方式2: 尝试Base64解码
-        try:
-            # 补齐base64 padding
-            padded_content = content + "=" * (-len(content) % 4)
-            decoded_content = base64.b64decode(padded_content).decode(
-                "utf-8", errors="ignore"
-            )
-            nodes = self.extract_nodes_from_text(decoded_content)
-            if nodes:
-                self.logger.info(f"Base64解码后获取到 {len(nodes)} 个节点")
-                all_nodes.extend(nodes)
-            else:
-                # 尝试双重Base64解码（某些订阅链接使用双重编码）
-                try:
-                    decoded_bytes = base64.b64decode(padded_content)
-                    double_padded = decoded_bytes + b"=" * (-len(decoded_bytes) % 4)
-                    double_decoded = base64.b64decode(double_padded).decode(
-                        "utf-8", errors="ignore"
-                    )
-                    nodes = self.extract_nodes_from_text(double_decoded)
-                    if nodes:
-                        self.logger.info(f"双重Base64解码后获取到 {len(nodes)} 个节点")
-                        all_nodes.extend(nodes)
-                except Exception:
-                    pass
-        except Exception as e:
-            self.logger.debug(f"Base64解码失败: {str(e)}")
-
-        # 方式3: 尝试URL解码
-        try:
-            url_decoded = unquote(content)
-            if url_decoded != content:  # 确实发生了解码
-                nodes = self.extract_nodes_from_text(url_decoded)
-                if nodes:
-                    self.logger.info(f"URL解码后获取到 {len(nodes)} 个节点")
-                    all_nodes.extend(nodes)
-        except Exception as e:
-            self.logger.debug(f"URL解码失败: {str(e)}")
-
-        # 方式4: 逐行分割后提取（处理某些特殊格式）
-        lines = content.split("\n")
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 10:
-                continue
-
-            # 尝试从单行提取节点
-            nodes = self.extract_nodes_from_text(line)
-            all_nodes.extend(nodes)
-
-            # 尝试Base64解码单行
-            try:
-                padded_line = line + "=" * (-len(line) % 4)
-                decoded_line = base64.b64decode(padded_line).decode(
-                    "utf-8", errors="ignore"
-                )
-                nodes = self.extract_nodes_from_text(decoded_line)
-                all_nodes.extend(nodes)
-
-                # 尝试双重Base64解码
-                try:
-                    decoded_bytes = base64.b64decode(padded_line)
-                    double_padded = decoded_bytes + b"=" * (-len(decoded_bytes) % 4)
-                    double_decoded = base64.b64decode(double_padded).decode(
-                        "utf-8", errors="ignore"
-                    )
-                    nodes = self.extract_nodes_from_text(double_decoded)
-                    all_nodes.extend(nodes)
-                except Exception:
-                    pass
-            except Exception:
-                pass
-
-        # 方式5: 尝试解析 YAML/JSON 格式（Clash配置）
-        yaml_nodes = self._extract_yaml_json_nodes(content)
-        if yaml_nodes:
-            self.logger.info(f"YAML/JSON格式解析获取到 {len(yaml_nodes)} 个节点")
-            all_nodes.extend(yaml_nodes)
-
-        # 去重
-        unique_nodes = list(set(all_nodes))
-
-        # 过滤长度
-        unique_nodes = [
-            node for node in unique_nodes if len(node) >= self.min_node_length
-        ]
-
-        self.logger.info(
-            f"从订阅链接获取到 {len(unique_nodes)} 个节点 (原始: {len(all_nodes)})"
-        )
-        return unique_nodes
-
-    def _extract_yaml_json_nodes(self, content: str) -> List[str]:
-        """
-        从 YAML/JSON 格式提取节点（Clash配置格式）
-
-        Args:
-            content: YAML/JSON内容
-
-        Returns:
-            节点列表
-        """
-        nodes = []
-        try:
-            import json
-            import yaml
-
-            # 首先尝试作为完整JSON解析
-            try:
-                data = json.loads(content.strip())
-                proxies_list = None
-
-                if isinstance(data, list):
-                    # JSON数组格式
-                    proxies_list = data
-                    self.logger.info(
-                        f"识别为JSON数组格式，包含 {len(proxies_list)} 个代理"
-                    )
-                elif isinstance(data, dict):
-                    # JSON对象格式
-                    if "proxies" in data:
-                        proxies_list = data["proxies"]
-                        self.logger.info(
-                            f"识别为JSON对象格式，包含 {len(proxies_list)} 个代理"
-                        )
-
-                if proxies_list:
-                    for proxy in proxies_list:
-                        try:
-                            node = self.converter.convert(proxy)
-                            if node and len(node) >= self.min_node_length:
-                                nodes.append(node)
-                        except Exception as e:
-                            self.logger.debug(f"JSON代理转换失败: {str(e)}")
-                    return nodes
-
-            except json.JSONDecodeError:
-                # 不是JSON格式，尝试YAML
-                pass
-
-            # 尝试作为YAML解析
-            try:
-                self.logger.info("开始尝试YAML解析...")
-                yaml_data = yaml.safe_load(content.strip())
-                self.logger.info(f"YAML解析成功，数据类型: {type(yaml_data)}")
-
-                # 处理Clash配置文件格式（包含proxies字段的完整配置）
-                if isinstance(yaml_data, dict) and "proxies" in yaml_data:
-                    proxies_list = yaml_data["proxies"]
-                    self.logger.info(
-                        f"识别为Clash配置格式，包含 {len(proxies_list)} 个代理"
-                    )
-
-                    for i, proxy in enumerate(proxies_list):
-                        try:
-                            node = self.converter.convert(proxy)
-                            self.logger.debug(
-                                f"YAML代理 {i + 1} 转换结果长度: {len(node) if node else 0}"
-                            )
-                            if node and len(node) >= self.min_node_length:
-                                nodes.append(node)
-                            else:
-                                self.logger.warning(
-                                    f"YAML代理 {i + 1} 转换结果太短或为空"
-                                )
-                        except Exception as e:
-                            self.logger.warning(f"YAML代理 {i + 1} 转换失败: {str(e)}")
-                    self.logger.info(f"YAML解析完成，共转换 {len(nodes)} 个节点")
-                    return nodes
-
-                # 处理只有代理列表的格式（兼容旧格式）
-                elif isinstance(yaml_data, list):
-                    self.logger.info(
-                        f"识别为代理列表格式，包含 {len(yaml_data)} 个代理"
-                    )
-                    for i, proxy in enumerate(yaml_data):
-                        try:
-                            node = self.converter.convert(proxy)
-                            if node and len(node) >= self.min_node_length:
-                                nodes.append(node)
-                        except Exception as e:
-                            self.logger.warning(f"YAML代理 {i + 1} 转换失败: {str(e)}")
-                    self.logger.info(f"YAML解析完成，共转换 {len(nodes)} 个节点")
-                    return nodes
-                else:
-                    self.logger.info(f"YAML数据格式不支持: {type(yaml_data)}")
-
-            except Exception as e:
-                # YAML解析失败，回退到行内JSON解析
-                pass
-
-            # 回退方案：从文本中提取行内JSON对象
-            if "proxies:" in content or "proxies" in content:
-                lines = content.split("\n")
-                json_objects = []
-
-                for line in lines:
-                    line = line.strip()
-                    # 查找行内的 JSON 对象（支持嵌套）
-                    json_matches = re.findall(r"-\s*(\{[^}]*\{[^}]*\}[^}]*\})", line)
-                    if not json_matches:
-                        json_match = re.search(r"-\s*(\{.+\})", line)
-                        if json_match:
-                            json_matches.append(json_match.group(1))
-
-                    for json_str in json_matches:
-                        json_objects.append(json_str)
-
-                self.logger.info(f"从YAML文本中找到 {len(json_objects)} 个行内JSON对象")
-
-                success_count = 0
-                error_count = 0
-
-                for json_str in json_objects:
-                    try:
-                        proxy = json.loads(json_str)
-                        node = self.converter.convert(proxy)
-                        if node and len(node) >= self.min_node_length:
-                            nodes.append(node)
-                            success_count += 1
-                        else:
-                            error_count += 1
-                    except json.JSONDecodeError as e:
-                        error_count += 1
-                        if error_count <= 3:  # 只显示前3个错误
-                            self.logger.warning(f"行内JSON解析失败: {str(e)[:100]}")
-                    except Exception as e:
-                        error_count += 1
-
-                self.logger.info(
-                    f"YAML行内JSON解析完成: {success_count} 成功, {error_count} 失败"
-                )
-
-        except ImportError as e:
-            self.logger.warning(f"模块导入失败: {str(e)}")
-        except Exception as e:
-            self.logger.warning(f"YAML/JSON 解析失败: {str(e)}")
-
-        return nodes
+        all_nodes = self.decoder.decode(content)
+        self.logger.info(f"从订阅链接获取到 {len(all_nodes)} 个节点")
+        return all_nodes
 
     def _clean_link(self, link: str) -> str:
         """
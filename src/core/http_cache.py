@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP条件请求缓存
+将响应体和校验信息（ETag / Last-Modified）保存到磁盘，
+在 CACHE_TTL 内直接使用磁盘内容，过期后发送条件请求，收到304时复用磁盘内容；
+运行结束时删除本次未使用且超过 HTTP_CACHE_MAX_AGE 的条目，避免带日期的订阅URL使缓存无限增长
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.core.config_manager import get_config
+from src.utils.logger import get_logger
+
+
+@dataclass
+class CacheEntry:
+    """缓存条目"""
+
+    url: str
+    body: bytes
+    encoding: Optional[str]
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def validators(self) -> Dict[str, str]:
+        """生成条件请求头"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """还原为 requests.Response，调用方无需区分是否命中缓存"""
+        response = requests.Response()
+        response._content = self.body
+        response.status_code = 200
+        response.url = self.url
+        response.encoding = self.encoding
+        response.headers = CaseInsensitiveDict()
+        if self.content_type:
+            response.headers["Content-Type"] = self.content_type
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        if self.last_modified:
+            response.headers["Last-Modified"] = self.last_modified
+        response.from_cache = True
+        return response
+
+
+class HttpCache:
+    """磁盘HTTP缓存"""
+
+    def __init__(self, cache_dir: Path, ttl: int, max_age: Optional[int] = None):
+        """
+        初始化HTTP缓存
+
+        Args:
+            cache_dir: 缓存目录
+            ttl: 新鲜期（秒），新鲜期内不发送网络请求
+            max_age: 清理时保留本次未使用条目的最长时间（秒），为None时不清理
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_age = max_age
+        self.logger = get_logger("http_cache")
+        self._lock = threading.Lock()
+        # 本次运行读取或写入过的条目（清理时保留）
+        self._used_keys = set()
+        self.stats = {"fresh_hits": 0, "revalidated": 0, "misses": 0, "stored": 0}
+
+    def _paths(self, url: str):
+        """获取URL对应的元数据和响应体文件路径"""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _mark_used(self, url: str) -> None:
+        with self._lock:
+            self._used_keys.add(self._paths(url)[0].stem)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """
+        读取缓存条目
+
+        Args:
+            url: 请求URL
+
+        Returns:
+            缓存条目，不存在或损坏时返回None
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        if meta.get("url") != url:
+            return None
+
+        self._mark_used(url)
+        return CacheEntry(
+            url=url,
+            body=body,
+            encoding=meta.get("encoding"),
+            content_type=meta.get("content_type"),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            stored_at=meta.get("stored_at", 0),
+        )
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """判断缓存条目是否仍在新鲜期内"""
+        return self.ttl > 0 and time.time() - entry.stored_at < self.ttl
+
+    def request(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        before_send: Optional[Callable[[], Any]] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        发送请求，GET请求优先使用缓存并附带条件请求头
+
+        Args:
+            session: requests会话对象
+            method: 请求方法
+            url: 请求URL
+            before_send: 实际发起网络请求前的回调（如访问频率等待），命中新鲜缓存时不调用
+            **kwargs: 其他请求参数
+
+        Returns:
+            requests.Response对象，命中缓存时 from_cache 属性为True
+        """
+        if method.upper() != "GET":
+            if before_send:
+                before_send()
+            return session.request(method, url, **kwargs)
+
+        entry = self.lookup(url)
+        if entry is not None and self.is_fresh(entry):
+            self._count("fresh_hits")
+            self.logger.debug(f"💾 缓存命中（新鲜期内）: {url}")
+            return entry.to_response()
+
+        if entry is not None:
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers.update(entry.validators())
+            kwargs["headers"] = headers
+
+        if before_send:
+            before_send()
+        response = session.get(url, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self._count("revalidated")
+            self.logger.debug(f"💾 内容未变化（304），使用缓存: {url}")
+            self._touch(url)
+            return entry.to_response()
+
+        self._count("misses")
+        return response
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """
+        保存成功的响应（调用方在完成内容校验后调用）
+
+        Args:
+            url: 请求URL
+            response: 响应对象
+        """
+        if getattr(response, "from_cache", False) or response.status_code != 200:
+            return
+
+        meta = {
+            "url": url,
+            "encoding": response.encoding,
+            "content_type": response.headers.get("Content-Type"),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "stored_at": time.time(),
+        }
+        meta_path, body_path = self._paths(url)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(body_path, response.content)
+            self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+            self._mark_used(url)
+            self._count("stored")
+        except OSError as e:
+            self.logger.warning(f"保存HTTP缓存失败: {url} - {str(e)}")
+
+    def _touch(self, url: str) -> None:
+        """304后刷新缓存条目的新鲜期"""
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["stored_at"] = time.time()
+            self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"刷新HTTP缓存失败: {url} - {str(e)}")
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """先写临时文件再替换，避免并发读取到半写入的文件"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def prune(self, max_age: Optional[int] = None) -> int:
+        """
+        删除本次运行未使用且超过 max_age 的条目（以及残留的临时文件和孤立的响应体）
+
+        Args:
+            max_age: 最长保留时间（秒），默认使用初始化时的 max_age
+
+        Returns:
+            删除的条目数
+        """
+        max_age = self.max_age if max_age is None else max_age
+        if max_age is None or not self.cache_dir.is_dir():
+            return 0
+
+        now = time.time()
+        with self._lock:
+            used_keys = set(self._used_keys)
+
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            try:
+                if path.suffix == ".tmp":
+                    if now - path.stat().st_mtime > max_age:
+                        path.unlink()
+                    continue
+                if path.suffix == ".body":
+                    if not path.with_suffix(".json").exists():
+                        path.unlink()
+                    continue
+                if path.suffix != ".json" or path.stem in used_keys:
+                    continue
+
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        stored_at = float(json.load(f).get("stored_at", 0))
+                except ValueError:
+                    stored_at = 0
+                if now - stored_at <= max_age:
+                    continue
+                path.unlink()
+                path.with_suffix(".body").unlink(missing_ok=True)
+                removed += 1
+            except OSError as e:
+                self.logger.warning(f"清理HTTP缓存失败: {path.name} - {str(e)}")
+
+        if removed:
+            self.logger.info(f"🧹 清理了 {removed} 个过期的HTTP缓存条目")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取缓存统计信息"""
+        with self._lock:
+            return dict(self.stats)
+
+
+# 全局单例实例
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """获取HTTP缓存单例实例，未启用时返回None"""
+    global _http_cache
+    config = get_config()
+    if not config.base.HTTP_CACHE_ENABLED:
+        return None
+    if _http_cache is None:
+        with _http_cache_lock:
+            if _http_cache is None:
+                _http_cache = HttpCache(
+                    config.base.HTTP_CACHE_DIR,
+                    config.base.CACHE_TTL,
+                    config.base.HTTP_CACHE_MAX_AGE,
+                )
+    return _http_cache
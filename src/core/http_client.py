@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+共享HTTP客户端
+进程级的连接池注册表，所有收集器和订阅解析器复用同一组 keep-alive 连接池
+和同一个预先构建的SSL上下文，避免对相同主机重复进行TLS握手
+"""
+
+import os
+import ssl
+import threading
+from typing import Dict, Optional
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.ssl_ import create_urllib3_context
+
+from src.config.user_agents import get_user_agent
+
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+    aiohttp = None
+
+# 禁用SSL警告
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+# 订阅请求使用的请求头
+SUBSCRIPTION_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "zh-CN,zh;q=0.8,en;q=0.6",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+
+def build_ssl_context() -> ssl.SSLContext:
+    """
+    构建兼容更多网站的SSL上下文
+
+    Returns:
+        不校验证书、允许较低安全级别加密套件的SSL上下文
+    """
+    ssl_context = create_urllib3_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+    try:
+        ssl_context.set_ciphers("DEFAULT:@SECLEVEL=1")
+    except ssl.SSLError:
+        pass  # 部分OpenSSL版本不支持SECLEVEL语法
+    return ssl_context
+
+
+class SSLAdapter(HTTPAdapter):
+    """使用共享SSL上下文的HTTPAdapter"""
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs["ssl_context"] = self.ssl_context
+        return super().proxy_manager_for(*args, **kwargs)
+
+
+class HttpClientRegistry:
+    """HTTP客户端注册表 - 管理进程内共享的连接池"""
+
+    def __init__(self, pool_connections: int = 32, pool_maxsize: int = 16):
+        """
+        初始化HTTP客户端注册表
+
+        Args:
+            pool_connections: 缓存的主机连接池数量
+            pool_maxsize: 每个主机连接池的最大连接数
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.ssl_context = build_ssl_context()
+        self._adapters: Dict[int, SSLAdapter] = {}
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get_adapter(self, max_retries: int = 0) -> SSLAdapter:
+        """
+        获取共享的HTTPAdapter（连接池按重试策略区分）
+
+        Args:
+            max_retries: urllib3层面的重试次数
+
+        Returns:
+            共享的SSLAdapter实例
+        """
+        with self._lock:
+            adapter = self._adapters.get(max_retries)
+            if adapter is None:
+                adapter = SSLAdapter(
+                    self.ssl_context,
+                    max_retries=max_retries,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                )
+                self._adapters[max_retries] = adapter
+            return adapter
+
+    def create_session(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        proxies: Optional[Dict[str, Optional[str]]] = None,
+        max_retries: int = 0,
+        trust_env: bool = True,
+    ) -> requests.Session:
+        """
+        创建挂载共享连接池的会话
+
+        会话自身的请求头、代理和Cookie相互独立，可以安全修改；
+        底层连接池在所有会话之间共享。
+
+        Args:
+            headers: 额外的请求头
+            proxies: 会话代理设置
+            max_retries: urllib3层面的重试次数
+            trust_env: 是否读取环境变量中的代理等设置
+
+        Returns:
+            requests会话对象
+        """
+        session = requests.Session()
+        adapter = self.get_adapter(max_retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = False
+        session.trust_env = trust_env
+        if proxies:
+            session.proxies.update(proxies)
+        if headers:
+            session.headers.update(headers)
+        return session
+
+    def create_async_session(
+        self, headers: Optional[Dict[str, str]] = None, timeout: float = 30
+    ) -> "aiohttp.ClientSession":
+        """
+        创建异步HTTP会话（需在事件循环中调用）
+
+        使用与同步会话相同的SSL上下文和单主机连接上限。
+
+        Args:
+            headers: 默认请求头
+            timeout: 总超时时间（秒）
+
+        Returns:
+            aiohttp会话对象，由调用方负责关闭
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("异步收集器需要 aiohttp，请执行 pip install aiohttp")
+
+        connector = aiohttp.TCPConnector(
+            ssl=self.ssl_context,
+            limit=self.pool_connections * self.pool_maxsize,
+            limit_per_host=self.pool_maxsize,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            trust_env=False,  # 代理由调用方按请求显式传入
+        )
+
+    def get_session(self, variant: str = "direct") -> requests.Session:
+        """
+        获取只读用途的共享会话（如订阅下载）
+
+        Args:
+            variant: "direct" 直连 或 "proxy" 使用环境变量代理
+
+        Returns:
+            共享的requests会话对象，调用方不应修改其状态
+        """
+        with self._lock:
+            session = self._sessions.get(variant)
+        if session is not None:
+            return session
+
+        github_actions = os.getenv("GITHUB_ACTIONS") == "true"
+        session = self.create_session(
+            headers=dict(SUBSCRIPTION_HEADERS, **{"User-Agent": get_user_agent(github_actions)}),
+            proxies=self.get_env_proxies() if variant == "proxy" else None,
+            max_retries=3,
+            trust_env=False,  # 代理由 variant 显式控制
+        )
+        with self._lock:
+            return self._sessions.setdefault(variant, session)
+
+    @staticmethod
+    def get_env_proxies() -> Dict[str, Optional[str]]:
+        """从环境变量读取代理设置"""
+        http_proxy = os.getenv("http_proxy") or os.getenv("HTTP_PROXY")
+        https_proxy = os.getenv("https_proxy") or os.getenv("HTTPS_PROXY")
+        if not (http_proxy or https_proxy):
+            return {}
+        return {"http": http_proxy, "https": https_proxy}
+
+    def close(self) -> None:
+        """关闭所有共享连接池"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._sessions.clear()
+            self._adapters.clear()
+
+
+# 全局单例实例
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClientRegistry:
+    """获取HTTP客户端注册表单例实例"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HttpClientRegistry()
+    return _http_client
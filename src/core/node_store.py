@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+节点存储（SQLite）
+以节点指纹为主键记录每个节点的首次/最近出现时间、来源网站和订阅链接以及测速结果，
+每次运行的全部写入在一个事务中完成，可以直接查询节点存活时间和各网站独有的节点数
+"""
+
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.utils.logger import get_logger
+from src.utils.node import parse_node
+from src.utils.node_fingerprint import node_fingerprint
+from src.utils.region_detector import RegionDetector
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    fingerprint TEXT PRIMARY KEY,
+    uri TEXT NOT NULL,
+    protocol TEXT NOT NULL,
+    host TEXT NOT NULL,
+    port INTEGER,
+    region TEXT NOT NULL,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    seen_count INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_protocol ON nodes (protocol);
+CREATE INDEX IF NOT EXISTS idx_nodes_region ON nodes (region);
+CREATE INDEX IF NOT EXISTS idx_nodes_first_seen ON nodes (first_seen);
+CREATE INDEX IF NOT EXISTS idx_nodes_last_seen ON nodes (last_seen);
+
+CREATE TABLE IF NOT EXISTS sightings (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL REFERENCES nodes (fingerprint),
+    site TEXT NOT NULL,
+    subscription_url TEXT NOT NULL DEFAULT '',
+    seen_at INTEGER NOT NULL,
+    UNIQUE (fingerprint, site, subscription_url, seen_at)
+);
+CREATE INDEX IF NOT EXISTS idx_sightings_site ON sightings (site, seen_at);
+CREATE INDEX IF NOT EXISTS idx_sightings_seen_at ON sightings (seen_at);
+
+CREATE TABLE IF NOT EXISTS probes (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL REFERENCES nodes (fingerprint),
+    tester TEXT NOT NULL,
+    probed_at INTEGER NOT NULL,
+    latency_ms INTEGER,
+    success INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_probes_fingerprint ON probes (fingerprint, probed_at);
+"""
+
+UPSERT_NODE_SQL = """
+INSERT INTO nodes (fingerprint, uri, protocol, host, port, region, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (fingerprint) DO UPDATE SET
+    uri = excluded.uri,
+    region = excluded.region,
+    first_seen = MIN(nodes.first_seen, excluded.first_seen),
+    last_seen = MAX(nodes.last_seen, excluded.last_seen),
+    seen_count = nodes.seen_count + 1
+"""
+
+INSERT_SIGHTING_SQL = """
+INSERT OR IGNORE INTO sightings (fingerprint, site, subscription_url, seen_at)
+VALUES (?, ?, ?, ?)
+"""
+
+INSERT_PROBE_SQL = """
+INSERT INTO probes (fingerprint, tester, probed_at, latency_ms, success)
+SELECT ?, ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM nodes WHERE fingerprint = ?)
+"""
+
+SECONDS_PER_DAY = 86400
+
+# (节点URI, 网站, 订阅链接)
+Sighting = Tuple[str, str, Optional[str]]
+
+
+def sqlite_path(database_url: str) -> str:
+    """
+    把 DATABASE_URL 转换为 SQLite 数据库路径
+
+    sqlite:///nodes.db 为相对路径，sqlite:////data/nodes.db 为绝对路径，
+    sqlite:// 和 sqlite:///:memory: 为内存数据库
+
+    Args:
+        database_url: 数据库URL
+
+    Returns:
+        sqlite3.connect 使用的路径
+
+    Raises:
+        ValueError: 不是 sqlite URL 时
+    """
+    prefix = "sqlite://"
+    if not database_url.startswith(prefix):
+        raise ValueError(f"节点存储只支持SQLite: {database_url}")
+    path = database_url[len(prefix) :]
+    if not path:
+        return ":memory:"
+    if not path.startswith("/"):
+        raise ValueError(f"无效的SQLite URL: {database_url}")
+    return path[1:]
+
+
+class NodeStore:
+    """节点存储"""
+
+    def __init__(self, database_url: str):
+        """
+        打开（必要时创建）节点数据库
+
+        Args:
+            database_url: 数据库URL（见 sqlite_path）
+        """
+        self.logger = get_logger("node_store")
+        self.conn = sqlite3.connect(sqlite_path(database_url))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        self._region_detector = None
+
+    def __enter__(self) -> "NodeStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        self.conn.close()
+
+    def _detect_region(self, uri: str) -> str:
+        if self._region_detector is None:
+            self._region_detector = RegionDetector()
+        return self._region_detector.detect_region(uri)
+
+    def record_run(
+        self,
+        nodes: Iterable[str],
+        sightings: Iterable[Sighting],
+        seen_at: Optional[int] = None,
+    ) -> int:
+        """
+        记录一次运行的结果（一个事务）
+
+        Args:
+            nodes: 本次输出的节点（同一指纹以这里的URI为准）
+            sightings: (节点URI, 网站, 订阅链接) 列表，URI可以是同一节点的其他写法
+            seen_at: 运行时间（Unix秒），默认为当前时间
+
+        Returns:
+            写入的节点数（无法解析的节点不记录）
+        """
+        seen_at = int(time.time()) if seen_at is None else seen_at
+
+        uris: Dict[str, str] = {}
+        for uri in nodes:
+            fingerprint = node_fingerprint(uri)
+            if fingerprint:
+                uris.setdefault(fingerprint, uri)
+
+        sighting_rows = set()
+        for uri, site, subscription_url in sightings:
+            fingerprint = node_fingerprint(uri)
+            if not fingerprint:
+                continue
+            uris.setdefault(fingerprint, uri)
+            sighting_rows.add((fingerprint, site, subscription_url or "", seen_at))
+
+        node_rows = []
+        for fingerprint, uri in uris.items():
+            node = parse_node(uri)
+            node_rows.append(
+                (
+                    fingerprint,
+                    uri,
+                    node.scheme,
+                    node.host,
+                    node.port,
+                    self._detect_region(uri),
+                    seen_at,
+                    seen_at,
+                )
+            )
+
+        with self.conn:
+            self.conn.executemany(UPSERT_NODE_SQL, node_rows)
+            self.conn.executemany(INSERT_SIGHTING_SQL, sorted(sighting_rows))
+        return len(node_rows)
+
+    def record_probes(
+        self,
+        results: Iterable[Tuple[str, Optional[int]]],
+        tester: str,
+        probed_at: Optional[int] = None,
+    ) -> int:
+        """
+        记录测速结果（一个事务，数据库中没有的节点忽略）
+
+        Args:
+            results: (节点URI, 延迟毫秒) 列表，延迟为None或不大于0表示失败
+            tester: 测速工具名称
+            probed_at: 测速时间（Unix秒），默认为当前时间
+
+        Returns:
+            写入的结果数
+        """
+        probed_at = int(time.time()) if probed_at is None else probed_at
+        rows = []
+        for uri, latency in results:
+            fingerprint = node_fingerprint(uri)
+            if not fingerprint:
+                continue
+            success = latency is not None and latency > 0
+            rows.append(
+                (fingerprint, tester, probed_at, latency if success else None, int(success), fingerprint)
+            )
+
+        with self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(INSERT_PROBE_SQL, rows)
+            return self.conn.total_changes - before
+
+    def surviving_nodes(self, days: int) -> List[str]:
+        """
+        最近一次运行中仍然出现、且首次出现在至少 days 天前的节点
+
+        Args:
+            days: 存活天数
+
+        Returns:
+            节点URI列表（按首次出现时间排序）
+        """
+        latest = self.conn.execute("SELECT MAX(last_seen) FROM nodes").fetchone()[0]
+        if latest is None:
+            return []
+        rows = self.conn.execute(
+            "SELECT uri FROM nodes WHERE last_seen = ? AND first_seen <= ? "
+            "ORDER BY first_seen, fingerprint",
+            (latest, latest - days * SECONDS_PER_DAY),
+        )
+        return [uri for (uri,) in rows]
+
+    def unique_nodes_by_site(self, since: Optional[int] = None) -> Dict[str, int]:
+        """
+        各网站独有的节点数（只从这一个网站出现过的节点）
+
+        Args:
+            since: 只统计该时间（Unix秒）之后的出现记录，默认统计全部
+
+        Returns:
+            网站到独有节点数的映射
+        """
+        rows = self.conn.execute(
+            "SELECT site, COUNT(*) FROM ("
+            "  SELECT fingerprint, MIN(site) AS site FROM sightings WHERE seen_at >= ?"
+            "  GROUP BY fingerprint HAVING COUNT(DISTINCT site) = 1"
+            ") GROUP BY site ORDER BY site",
+            (since or 0,),
+        )
+        return dict(rows.fetchall())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+订阅内容解析缓存
+以原始订阅内容的哈希为键缓存解析结果，同一份内容（不同URL或上游副本）只解析一次
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from src.core.config_manager import get_config
+from src.core.decode_engine import DECODER_VERSION
+from src.utils.logger import get_logger
+
+# 缓存文件格式变化时递增
+PARSE_CACHE_FORMAT = 3
+# 持久化的版本：缓存格式或解码器输出（DECODER_VERSION）变化时，旧结果都会失效
+PARSE_CACHE_VERSION = f"{PARSE_CACHE_FORMAT}.{DECODER_VERSION}"
+
+
+class ParseCache:
+    """订阅解析结果缓存"""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        初始化解析缓存
+
+        Args:
+            cache_file: 持久化文件路径，为None时只在内存中缓存
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.logger = get_logger("parse_cache")
+        self._entries: Dict[str, List[str]] = {}
+        self._used_keys = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.cache_file:
+            self.load()
+
+    @staticmethod
+    def make_key(content: Union[str, bytes]) -> str:
+        """计算订阅内容的哈希键（文本按UTF-8编码，与相同内容的原始字节得到同一个键）"""
+        if isinstance(content, str):
+            content = content.encode("utf-8", errors="surrogatepass")
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def get(self, content: Union[str, bytes]) -> Optional[List[str]]:
+        """
+        查找已解析的节点列表
+
+        Args:
+            content: 原始订阅内容
+
+        Returns:
+            节点列表副本，未命中时返回None
+        """
+        key = self.make_key(content)
+        with self._lock:
+            nodes = self._entries.get(key)
+            if nodes is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._used_keys.add(key)
+            return list(nodes)
+
+    def put(self, content: Union[str, bytes], nodes: List[str]) -> None:
+        """
+        保存解析结果
+
+        Args:
+            content: 原始订阅内容
+            nodes: 解析得到的节点列表
+        """
+        key = self.make_key(content)
+        with self._lock:
+            self._entries[key] = list(nodes)
+            self._used_keys.add(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """获取本次运行的缓存统计信息"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+            }
+
+    def load(self) -> None:
+        """从磁盘加载持久化的解析结果"""
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"加载解析缓存失败: {str(e)}")
+            return
+
+        if data.get("version") != PARSE_CACHE_VERSION:
+            self.logger.info("解析缓存版本已变化，忽略旧缓存")
+            return
+
+        with self._lock:
+            self._entries.update(data.get("entries", {}))
+        self.logger.debug(f"加载 {len(self._entries)} 条解析缓存")
+
+    def save(self) -> None:
+        """保存本次运行用到的解析结果（未使用的旧条目会被淘汰）"""
+        if not self.cache_file:
+            return
+        with self._lock:
+            entries = {key: self._entries[key] for key in self._used_keys}
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": PARSE_CACHE_VERSION, "entries": entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            self.logger.warning(f"保存解析缓存失败: {str(e)}")
+
+
+# 全局单例实例
+_parse_cache = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """获取解析缓存单例实例"""
+    global _parse_cache
+    if _parse_cache is None:
+        with _parse_cache_lock:
+            if _parse_cache is None:
+                config = get_config()
+                cache_file = (
+                    config.base.PARSE_CACHE_FILE if config.base.PARSE_CACHE_PERSIST else None
+                )
+                _parse_cache = ParseCache(cache_file)
+    return _parse_cache
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+按主机的访问频率调度器
+每个主机一个令牌桶并带有最小请求间隔，只在访问同一主机时等待，
+不同主机的请求互不影响
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from src.utils.logger import get_logger
+
+
+class TokenBucket:
+    """令牌桶（预约式，不持有锁等待）"""
+
+    def __init__(self, rate: float, burst: int, min_interval: float = 0.0):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数，<=0 表示不限速率
+            burst: 令牌桶容量
+            min_interval: 两次请求之间的最小间隔（秒）
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_interval = max(0.0, min_interval)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        预约一次请求
+
+        Returns:
+            调用方需要等待的秒数（0表示可以立即请求）
+        """
+        with self._lock:
+            now = time.monotonic()
+            base = max(now, self._updated)
+            tokens = self._refill(self._tokens, base - self._updated)
+
+            start = max(base, self._next_allowed)
+            tokens = self._refill(tokens, start - base)
+            if self.rate > 0 and tokens < 1:
+                start += (1 - tokens) / self.rate
+                tokens = 1.0
+
+            self._tokens = tokens - 1
+            self._updated = start
+            self._next_allowed = start + self.min_interval
+            return max(0.0, start - now)
+
+    def _refill(self, tokens: float, elapsed: float) -> float:
+        if self.rate <= 0:
+            return float(self.burst)
+        return min(float(self.burst), tokens + elapsed * self.rate)
+
+
+# 不限速（未配置的主机默认使用）
+NO_LIMIT = {"rate": 0, "burst": 1, "min_interval": 0.0}
+
+
+class PolitenessScheduler:
+    """按主机的访问频率调度器"""
+
+    def __init__(
+        self,
+        default_limit: Dict[str, float],
+        host_limits: Optional[Dict[str, Dict[str, float]]] = None,
+    ):
+        """
+        初始化调度器
+
+        Args:
+            default_limit: 未单独配置的主机使用的默认限制
+            host_limits: 主机名到限制配置的映射
+        """
+        self.default_limit = dict(default_limit)
+        self.host_limits = {host.lower(): dict(limit) for host, limit in (host_limits or {}).items()}
+        self.logger = get_logger("politeness")
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.total_wait = 0.0
+
+    @classmethod
+    def from_websites(
+        cls,
+        websites: Dict[str, Dict],
+        page_limit: Dict[str, float],
+        host_limits: Optional[Dict[str, Dict[str, float]]] = None,
+        default_limit: Optional[Dict[str, float]] = None,
+    ) -> "PolitenessScheduler":
+        """
+        根据网站配置构建调度器
+
+        网站首页所在主机（文章页面）使用 page_limit，网站配置中的 rate_limit 可以覆盖；
+        其他主机（第三方订阅文件托管）只受 host_limits 限制，未配置时使用 default_limit
+
+        Args:
+            websites: 网站配置字典（src.config.websites.WEBSITES）
+            page_limit: 网站页面所在主机的默认限制
+            host_limits: 额外的主机限制
+            default_limit: 其他主机的限制，默认不限速
+
+        Returns:
+            调度器实例
+        """
+        limits = dict(host_limits or {})
+        for site_config in websites.values():
+            host = (urlparse(site_config.get("url", "")).hostname or "").lower()
+            if host:
+                limits[host] = {**page_limit, **site_config.get("rate_limit", {})}
+        return cls(default_limit or NO_LIMIT, limits)
+
+    def _bucket_for(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                limit = {**self.default_limit, **self.host_limits.get(host, {})}
+                bucket = TokenBucket(
+                    rate=limit.get("rate", 0),
+                    burst=int(limit.get("burst", 1)),
+                    min_interval=limit.get("min_interval", 0),
+                )
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, url: str) -> float:
+        """
+        为URL所在主机预约一次请求
+
+        Args:
+            url: 请求URL
+
+        Returns:
+            需要等待的秒数
+        """
+        host = (urlparse(url).hostname or "").lower()
+        wait = self._bucket_for(host).reserve()
+        if wait > 0:
+            with self._lock:
+                self.total_wait += wait
+            self.logger.debug(f"⏳ {host} 访问频率限制，等待 {wait:.2f} 秒")
+        return wait
+
+    def acquire(self, url: str) -> float:
+        """阻塞等待直到可以请求URL，返回实际等待秒数"""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """异步等待直到可以请求URL，返回实际等待秒数"""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+# 全局单例实例
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_politeness_scheduler() -> PolitenessScheduler:
+    """获取访问频率调度器单例实例（配置来自 src/config/websites.py）"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                from src.config.websites import DEFAULT_RATE_LIMIT, HOST_RATE_LIMITS, WEBSITES
+
+                _scheduler = PolitenessScheduler.from_websites(
+                    WEBSITES, DEFAULT_RATE_LIMIT, HOST_RATE_LIMITS
+                )
+    return _scheduler
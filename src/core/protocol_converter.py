@@ -20,6 +20,21 @@ import re
 from typing import Any, Dict, Optional
 from urllib.parse import quote
 
+from src.utils.node_scanner import get_node_scanner
+
+# 订阅内容中识别的节点协议
+URI_NODE_SCHEMES = [
+    "vmess",
+    "vless",
+    "trojan",
+    "ss",
+    "ssr",
+    "hysteria2",
+    "hysteria",
+    "socks5",
+    "reality",
+]
+
 
 class ProtocolConverter:
     """V2Ray 节点协议转换器"""
@@ -451,30 +466,7 @@ def extract_nodes_from_text(text: str, min_length: int = 20) -> list:
     Returns:
         节点 URI 列表
     """
-    patterns = [
-        r"(vmess://[^\s\n\r]+)",
-        r"(vless://[^\s\n\r]+)",
-        r"(trojan://[^\s\n\r]+)",
-        r"(ss://[^\s\n\r]+)",
-        r"(ssr://[^\s\n\r]+)",
-        r"(hysteria2://[^\s\n\r]+)",
-        r"(hysteria://[^\s\n\r]+)",
-        r"(socks5://[^\s\n\r]+)",
-        r"(reality://[^\s\n\r]+)",
-    ]
-
-    nodes = []
-    for pattern in patterns:
-        try:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                node = match.strip()
-                if len(node) >= min_length:
-                    nodes.append(node)
-        except Exception:
-            continue
-
-    return nodes
+    return get_node_scanner(URI_NODE_SCHEMES).scan(text, min_length)
 
 
 # 全局单例实例
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+结果历史归档
+把 result/YYYYMMDD 目录按天压缩为一个数据块（zstd，不可用时使用zlib），
+每天的节点列表记为相对前一天的差异（复制前一天的行区间 + 本块字符串表中新出现的URI），
+并记录按指纹计算的新增/删除节点；每隔一定天数写入一个完整快照，读取任意一天最多回放一个周期
+
+用法:
+    python -m src.core.result_archive migrate [--remove] [--keep-days N]
+    python -m src.core.result_archive list
+    python -m src.core.result_archive restore YYYYMMDD [--output DIR]
+"""
+
+import json
+import os
+import re
+import shutil
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+from src.utils.logger import get_logger
+from src.utils.node_fingerprint import node_key
+
+ARCHIVE_VERSION = 1
+DEFAULT_RESULT_DIR = "result"
+DEFAULT_ARCHIVE_DIR = os.path.join(DEFAULT_RESULT_DIR, "archive")
+DATA_FILE_NAME = "history.bin"
+INDEX_FILE_NAME = "index.json"
+TOTAL_FILE_NAME = "nodetotal.txt"
+
+# 每隔多少个数据块写入一个完整快照（读取任意一天最多解压这么多个块）
+KEYFRAME_INTERVAL = 30
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+ZSTD_LEVEL = 19
+ZLIB_LEVEL = 9
+
+# 差异操作：从前一天复制 / 从本块字符串表取
+OP_BASE = 0
+OP_STRINGS = 1
+
+DAY_PATTERN = re.compile(r"^\d{8}$")
+
+
+class ArchiveError(Exception):
+    """归档读写错误"""
+
+
+def _compress(payload: bytes) -> Tuple[str, bytes]:
+    """压缩数据块，返回 (编码方式, 压缩后的数据)"""
+    if HAS_ZSTD:
+        return CODEC_ZSTD, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    return CODEC_ZLIB, zlib.compress(payload, ZLIB_LEVEL)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    """按记录的编码方式解压数据块"""
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == CODEC_ZSTD:
+        if not HAS_ZSTD:
+            raise ArchiveError("数据块使用zstd压缩，需要安装 zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ArchiveError(f"未知的压缩方式: {codec}")
+
+
+def encode_nodes(
+    nodes: List[str], base_nodes: Optional[List[str]]
+) -> Tuple[List[str], List[List[int]]]:
+    """
+    把节点列表编码为相对前一天的差异
+
+    Args:
+        nodes: 当天的节点列表（按文件顺序）
+        base_nodes: 前一天的节点列表，为None时编码为完整快照
+
+    Returns:
+        (字符串表, 操作列表)，操作为 [OP_BASE, 起始行, 行数] 或 [OP_STRINGS, 起始下标, 个数]
+    """
+    base_index: Dict[str, int] = {}
+    for index, uri in enumerate(base_nodes or []):
+        base_index.setdefault(uri, index)
+
+    strings: List[str] = []
+    interned: Dict[str, int] = {}
+    ops: List[List[int]] = []
+    for uri in nodes:
+        if uri in base_index:
+            op, position = OP_BASE, base_index[uri]
+        else:
+            position = interned.get(uri)
+            if position is None:
+                position = interned[uri] = len(strings)
+                strings.append(uri)
+            op = OP_STRINGS
+
+        last = ops[-1] if ops else None
+        if last and last[0] == op and last[1] + last[2] == position:
+            last[2] += 1
+        else:
+            ops.append([op, position, 1])
+    return strings, ops
+
+
+def decode_nodes(
+    strings: List[str], ops: List[List[int]], base_nodes: Optional[List[str]]
+) -> List[str]:
+    """
+    按差异还原节点列表（encode_nodes 的逆操作）
+
+    Args:
+        strings: 字符串表
+        ops: 操作列表
+        base_nodes: 前一天的节点列表
+
+    Returns:
+        当天的节点列表
+    """
+    nodes: List[str] = []
+    for op, start, count in ops:
+        source = strings if op == OP_STRINGS else base_nodes
+        if source is None or start + count > len(source):
+            raise ArchiveError("差异数据与前一天的节点列表不匹配")
+        nodes.extend(source[start : start + count])
+    return nodes
+
+
+def read_day_dir(day_dir: str) -> Tuple[List[str], Dict[str, str]]:
+    """
+    读取一个日期目录
+
+    Args:
+        day_dir: 日期目录
+
+    Returns:
+        (nodetotal.txt 的各行, 其余文本文件名到内容的映射)
+    """
+    nodes: List[str] = []
+    files: Dict[str, str] = {}
+    for name in sorted(os.listdir(day_dir)):
+        path = os.path.join(day_dir, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            content = f.read()
+        if name == TOTAL_FILE_NAME:
+            nodes = content.splitlines()
+        else:
+            files[name] = content
+    return nodes, files
+
+
+class ResultArchive:
+    """结果历史归档（一个数据文件 + 一个JSON索引）"""
+
+    def __init__(
+        self, archive_dir: str = DEFAULT_ARCHIVE_DIR, keyframe_interval: int = KEYFRAME_INTERVAL
+    ):
+        """
+        初始化归档
+
+        Args:
+            archive_dir: 归档目录
+            keyframe_interval: 完整快照的间隔（数据块个数）
+        """
+        self.archive_dir = archive_dir
+        self.data_file = os.path.join(archive_dir, DATA_FILE_NAME)
+        self.index_file = os.path.join(archive_dir, INDEX_FILE_NAME)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.logger = get_logger("result_archive")
+        self._days: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        # 最近还原的一天（顺序追加和顺序读取时不必从快照重新回放）
+        self._last_nodes: Optional[Tuple[str, List[str]]] = None
+        self._load_index()
+
+    def exists(self) -> bool:
+        """归档索引是否存在"""
+        return os.path.exists(self.index_file)
+
+    def days(self) -> List[str]:
+        """已归档的日期（升序）"""
+        return [entry["date"] for entry in self._days]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """各天的索引信息（日期、节点数、新增/删除数、数据块大小等）"""
+        return [dict(entry) for entry in self._days]
+
+    def _load_index(self) -> None:
+        if not self.exists():
+            return
+        with open(self.index_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("version") != ARCHIVE_VERSION:
+            raise ArchiveError(f"不支持的归档版本: {index.get('version')}")
+        self._days = index.get("days", [])
+        self._positions = {entry["date"]: i for i, entry in enumerate(self._days)}
+
+    def _save_index(self) -> None:
+        tmp_file = f"{self.index_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": ARCHIVE_VERSION, "days": self._days}, f, indent=1)
+        os.replace(tmp_file, self.index_file)
+
+    def _entry(self, date: str) -> Dict[str, Any]:
+        position = self._positions.get(date)
+        if position is None:
+            raise KeyError(f"归档中没有 {date}")
+        return self._days[position]
+
+    def _read_block(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        with open(self.data_file, "rb") as f:
+            f.seek(entry["offset"])
+            data = f.read(entry["length"])
+        if len(data) != entry["length"]:
+            raise ArchiveError(f"{entry['date']} 的数据块不完整")
+        return json.loads(_decompress(entry["codec"], data).decode("utf-8"))
+
+    def read_nodes(self, date: str) -> List[str]:
+        """
+        读取某一天的节点列表
+
+        Args:
+            date: 日期（YYYYMMDD）
+
+        Returns:
+            节点列表（nodetotal.txt 的各行）
+        """
+        if self._last_nodes and self._last_nodes[0] == date:
+            return list(self._last_nodes[1])
+
+        # 向前找到最近的完整快照，再依次回放差异
+        chain = []
+        entry = self._entry(date)
+        while True:
+            chain.append(entry)
+            if entry["base"] is None:
+                break
+            if self._last_nodes and self._last_nodes[0] == entry["base"]:
+                break
+            entry = self._entry(entry["base"])
+
+        nodes = None
+        if chain[-1]["base"] is not None:
+            nodes = self._last_nodes[1]
+        for entry in reversed(chain):
+            block = self._read_block(entry)
+            nodes = decode_nodes(block["strings"], block["ops"], nodes)
+
+        self._last_nodes = (date, nodes)
+        return list(nodes)
+
+    def read_day(self, date: str) -> Tuple[List[str], Dict[str, str]]:
+        """
+        读取某一天的全部内容
+
+        Args:
+            date: 日期（YYYYMMDD）
+
+        Returns:
+            (节点列表, 其余文件名到内容的映射)
+        """
+        files = self._read_block(self._entry(date))["files"]
+        return self.read_nodes(date), files
+
+    def read_delta(self, date: str) -> Tuple[List[str], List[str]]:
+        """
+        读取某一天相对前一天的指纹差异（不还原节点列表）
+
+        Args:
+            date: 日期（YYYYMMDD）
+
+        Returns:
+            (新增节点的指纹, 删除节点的指纹)
+        """
+        block = self._read_block(self._entry(date))
+        return block["added"], block["removed"]
+
+    def append_day(
+        self, date: str, nodes: List[str], files: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        追加一天（与最后一天同一日期时替换最后一天）
+
+        Args:
+            date: 日期（YYYYMMDD）
+            nodes: 节点列表
+            files: 其余文件名到内容的映射
+
+        Raises:
+            ValueError: 日期格式错误或早于最后一天
+        """
+        if not DAY_PATTERN.match(date):
+            raise ValueError(f"日期格式应为YYYYMMDD: {date}")
+        if self._days and date < self._days[-1]["date"]:
+            raise ValueError(f"只能按日期顺序追加: {date} 早于 {self._days[-1]['date']}")
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        offset = os.path.getsize(self.data_file) if os.path.exists(self.data_file) else 0
+        if self._days and self._days[-1]["date"] == date:
+            # 同一天再次运行，截掉最后一个数据块后重新写入
+            offset = self._days.pop()["offset"]
+            self._positions.pop(date)
+            self._last_nodes = None
+
+        base_entry = self._days[-1] if self._days else None
+        previous_nodes = self.read_nodes(base_entry["date"]) if base_entry else []
+        chain_length = base_entry["chain"] + 1 if base_entry else 0
+        base_nodes = None
+        if base_entry and chain_length < self.keyframe_interval:
+            base_nodes = previous_nodes
+        else:
+            chain_length = 0
+
+        strings, ops = encode_nodes(nodes, base_nodes)
+        current_keys = {node_key(uri) for uri in nodes if uri}
+        previous_keys = {node_key(uri) for uri in previous_nodes if uri}
+        block = {
+            "date": date,
+            "strings": strings,
+            "ops": ops,
+            "added": sorted(current_keys - previous_keys),
+            "removed": sorted(previous_keys - current_keys),
+            "files": files or {},
+        }
+        payload = json.dumps(block, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        codec, data = _compress(payload)
+
+        with open(self.data_file, "ab") as f:
+            f.truncate(offset)
+            f.seek(offset)
+            f.write(data)
+
+        self._days.append(
+            {
+                "date": date,
+                "offset": offset,
+                "length": len(data),
+                "codec": codec,
+                "base": base_entry["date"] if base_nodes is not None else None,
+                "chain": chain_length,
+                "nodes": len(nodes),
+                "added": len(block["added"]),
+                "removed": len(block["removed"]),
+            }
+        )
+        self._positions[date] = len(self._days) - 1
+        self._save_index()
+        self._last_nodes = (date, list(nodes))
+
+    def archive_dir_of_day(self, date: str, day_dir: str) -> None:
+        """
+        归档一个日期目录
+
+        Args:
+            date: 日期（YYYYMMDD）
+            day_dir: 日期目录
+        """
+        nodes, files = read_day_dir(day_dir)
+        self.append_day(date, nodes, files)
+
+    def restore_day(self, date: str, output_dir: str) -> None:
+        """
+        把某一天还原为目录（nodetotal.txt 和其余文件）
+
+        Args:
+            date: 日期（YYYYMMDD）
+            output_dir: 输出目录
+        """
+        nodes, files = self.read_day(date)
+        os.makedirs(output_dir, exist_ok=True)
+        if nodes:
+            total_file = os.path.join(output_dir, TOTAL_FILE_NAME)
+            with open(total_file, "w", encoding="utf-8", newline="") as f:
+                f.write("".join(f"{node}\n" for node in nodes))
+        for name, content in files.items():
+            with open(os.path.join(output_dir, name), "w", encoding="utf-8", newline="") as f:
+                f.write(content)
+
+
+def migrate_result_dirs(
+    result_dir: str = DEFAULT_RESULT_DIR,
+    archive: Optional[ResultArchive] = None,
+    remove: bool = False,
+    keep_days: int = 1,
+) -> int:
+    """
+    把 result 下的日期目录迁移到归档
+
+    已归档的日期会跳过；remove 为 True 时，校验还原结果与目录内容一致后删除目录
+    （保留最近 keep_days 天的目录）
+
+    Args:
+        result_dir: 结果目录
+        archive: 归档，为None时使用 result_dir/archive
+        remove: 是否删除已迁移的目录
+        keep_days: 删除时保留的最近天数
+
+    Returns:
+        新归档的天数
+    """
+    archive = archive or ResultArchive(os.path.join(result_dir, "archive"))
+    logger = archive.logger
+    day_names = sorted(
+        name
+        for name in os.listdir(result_dir)
+        if DAY_PATTERN.match(name) and os.path.isdir(os.path.join(result_dir, name))
+    )
+    archived = set(archive.days())
+    last_day = archive.days()[-1] if archive.days() else ""
+
+    migrated = 0
+    for name in day_names:
+        if name in archived:
+            continue
+        if name < last_day:
+            logger.warning(f"⚠️ {name} 早于归档中的最后一天 {last_day}，跳过")
+            continue
+        archive.archive_dir_of_day(name, os.path.join(result_dir, name))
+        archived.add(name)
+        migrated += 1
+        logger.info(f"📦 已归档 {name}")
+
+    if remove:
+        keep = set(day_names[-keep_days:]) if keep_days > 0 else set()
+        for name in day_names:
+            if name in keep or name not in archived:
+                continue
+            day_dir = os.path.join(result_dir, name)
+            if archive.read_day(name) != read_day_dir(day_dir):
+                logger.error(f"❌ {name} 还原结果与目录不一致，保留目录")
+                continue
+            shutil.rmtree(day_dir)
+            logger.info(f"🗑️ 已删除 {day_dir}")
+
+    return migrated
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """命令行接口"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="result 历史归档")
+    parser.add_argument("--result-dir", default=DEFAULT_RESULT_DIR, help="结果目录")
+    parser.add_argument("--archive-dir", help="归档目录（默认 <result-dir>/archive）")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="把日期目录迁移到归档")
+    migrate_parser.add_argument("--remove", action="store_true", help="校验后删除已迁移的目录")
+    migrate_parser.add_argument("--keep-days", type=int, default=1, help="删除时保留的最近天数")
+
+    subparsers.add_parser("list", help="列出已归档的日期")
+
+    restore_parser = subparsers.add_parser("restore", help="还原某一天")
+    restore_parser.add_argument("date", help="日期（YYYYMMDD）")
+    restore_parser.add_argument("--output", help="输出目录（默认 <result-dir>/<date>）")
+
+    args = parser.parse_args(argv)
+    archive = ResultArchive(args.archive_dir or os.path.join(args.result_dir, "archive"))
+
+    if args.command == "migrate":
+        migrated = migrate_result_dirs(args.result_dir, archive, args.remove, args.keep_days)
+        print(f"新归档 {migrated} 天，共 {len(archive.days())} 天")
+    elif args.command == "list":
+        for entry in archive.entries():
+            print(
+                f"{entry['date']}  节点 {entry['nodes']:>6}  新增 {entry['added']:>5}  "
+                f"删除 {entry['removed']:>5}  {entry['length']:>9} 字节 ({entry['codec']})"
+            )
+    elif args.command == "restore":
+        output_dir = args.output or os.path.join(args.result_dir, args.date)
+        archive.restore_day(args.date, output_dir)
+        print(f"已还原 {args.date} 到 {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,56 @@
 负责保存收集结果和更新GitHub仓库
 """
 
+import hashlib
 import os
 import re
 import time
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple, Union
+from urllib.parse import quote, unquote
 
+from src.core.node_store import NodeStore
+from src.core.result_archive import ResultArchive
 from src.utils.logger import get_logger
 from src.utils.file_handler import FileHandler
+from src.utils.node import Node, as_node
+from src.utils.node_fingerprint import dedupe_nodes, node_key, stable_order
 from src.config.settings import *
 
+# 输出文件
+TOTAL_FILE_NAME = "nodetotal.txt"  # 全部节点
+INDEX_FILE_NAME = "nodetotal.idx"  # 全部节点的指纹索引（与 nodetotal.txt 逐行对应）
+ADDED_FILE_NAME = "added.txt"  # 本次新增的节点
+REMOVED_FILE_NAME = "removed.txt"  # 本次删除的节点
+INDEX_HEADER_PREFIX = "# nodetotal "
+
+# 节点名称清理规则（预编译，每个节点都要执行）
+BRACKET_PATTERN = re.compile(r'\([^)]*\)')
+PIPE_SUFFIX_PATTERN = re.compile(r'\|.*')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 常见的广告关键词和网站名称
+AD_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r'\s*free-nodes',
+        r'\s*free\.nodes',
+        r'\s*v2clash\.blog',
+        r'\s*mibei77\.com',
+        r'\s*clashnode\.cc',
+        r'\s*clashnodev2ray',
+        r'\s*freeclashnode',
+        r'\s*freev2raynode',
+        r'\s*持续更新',
+        r'\s*202\d-\d{1,2}-\d{1,2}',
+        r'\s*@[\w.-]+',
+        # 移除通用的网站域名广告（包括中文描述前的整个广告文本）
+        r'[^：|]+：\s*[\w-]+\.(com|net|org|cn|io|top|xyz|cc|me|tv|us|uk|jp|kr|sg|hk|tw|de|fr|ru|ca|au|in|br|es|it|nl|se|no|fi|dk|pl|cz|hu|ro|bg|gr|pt|ie|at|ch|be|lu|cy|mt|si|sk|hr|ba|mk|al|rs|me|ad|li|mc|sm|va|is|fo|gl|ax|ee|lv|lt|by|ua|md|ge|am|az|kz|uz|tj|kg|tm|mn|af|pk|in|np|bt|bd|lk|mm|th|kh|la|vn|my|sg|id|ph|bn|tw|hk|mo|jp|kr|cn|kp)',
+        # 移除任意位置的网站域名广告（如 www.85la.com）
+        r'(?:www\.)?[\w-]+\.(com|net|org|cn|io|top|xyz|cc|me|tv|us|uk|jp|kr|sg|hk|tw|de|fr|ru|ca|au|in|br|es|it|nl|se|no|fi|dk|pl|cz|hu|ro|bg|gr|pt|ie|at|ch|be|lu|cy|mt|si|sk|hr|ba|mk|al|rs|me|ad|li|mc|sm|va|is|fo|gl|ax|ee|lv|lt|by|ua|md|ge|am|az|kz|uz|tj|kg|tm|mn|af|pk|in|np|bt|bd|lk|mm|th|kh|la|vn|my|sg|id|ph|bn|tw|hk|mo|jp|kr|cn|kp)',
+    ]
+]
+
 
 class ResultManager:
     """结果管理器 - 处理结果保存和GitHub更新"""
@@ -23,54 +63,41 @@ class ResultManager:
         self.logger = get_logger("result_manager")
         self.file_handler = FileHandler()
 
-    def _clean_node_name(self, node: str) -> str:
+    def _clean_node_name(self, node: Union[str, Node]) -> str:
         """
         清理节点名称中的广告信息
 
         Args:
-            node: 节点字符串
+            node: 节点字符串或 Node
 
         Returns:
             清理后的节点字符串
         """
-        # 分离节点协议和名称部分
-        if '#' in node:
-            protocol_part, name_part = node.rsplit('#', 1)
-            # URL解码名称部分
-            from urllib.parse import unquote
-            decoded_name = unquote(name_part)
+        parsed = as_node(node)
+        uri = parsed.uri if parsed else node
+
+        # 分离节点协议和名称部分（与解析器一致，名称是第一个 # 之后的全部内容）
+        if '#' in uri:
+            protocol_part, _, name_part = uri.partition('#')
+            # URL格式节点的名称已在解析时解码（vmess/ssr 的名称在编码内容中，# 后是附加名称）
+            if parsed and parsed.scheme not in ("vmess", "ssr"):
+                decoded_name = parsed.name
+            else:
+                decoded_name = unquote(name_part)
             
             # 清理广告信息
             # 1. 移除括号内的内容（包括括号）
-            cleaned_name = re.sub(r'\([^)]*\)', '', decoded_name)
+            cleaned_name = BRACKET_PATTERN.sub('', decoded_name)
             
             # 2. 移除 | 后面的内容
-            cleaned_name = re.sub(r'\|.*', '', cleaned_name)
+            cleaned_name = PIPE_SUFFIX_PATTERN.sub('', cleaned_name)
             
             # 3. 移除常见的广告关键词和网站名称
-            ad_patterns = [
-                r'\s*free-nodes',
-                r'\s*free\.nodes',
-                r'\s*v2clash\.blog',
-                r'\s*mibei77\.com',
-                r'\s*clashnode\.cc',
-                r'\s*clashnodev2ray',
-                r'\s*freeclashnode',
-                r'\s*freev2raynode',
-                r'\s*持续更新',
-                r'\s*202\d-\d{1,2}-\d{1,2}',
-                r'\s*@[\w.-]+',
-                # 移除通用的网站域名广告（包括中文描述前的整个广告文本）
-                r'[^：|]+：\s*[\w-]+\.(com|net|org|cn|io|top|xyz|cc|me|tv|us|uk|jp|kr|sg|hk|tw|de|fr|ru|ca|au|in|br|es|it|nl|se|no|fi|dk|pl|cz|hu|ro|bg|gr|pt|ie|at|ch|be|lu|cy|mt|si|sk|hr|ba|mk|al|rs|me|ad|li|mc|sm|va|is|fo|gl|ax|ee|lv|lt|by|ua|md|ge|am|az|kz|uz|tj|kg|tm|mn|af|pk|in|np|bt|bd|lk|mm|th|kh|la|vn|my|sg|id|ph|bn|tw|hk|mo|jp|kr|cn|kp)',
-                # 移除任意位置的网站域名广告（如 www.85la.com）
-                r'(?:www\.)?[\w-]+\.(com|net|org|cn|io|top|xyz|cc|me|tv|us|uk|jp|kr|sg|hk|tw|de|fr|ru|ca|au|in|br|es|it|nl|se|no|fi|dk|pl|cz|hu|ro|bg|gr|pt|ie|at|ch|be|lu|cy|mt|si|sk|hr|ba|mk|al|rs|me|ad|li|mc|sm|va|is|fo|gl|ax|ee|lv|lt|by|ua|md|ge|am|az|kz|uz|tj|kg|tm|mn|af|pk|in|np|bt|bd|lk|mm|th|kh|la|vn|my|sg|id|ph|bn|tw|hk|mo|jp|kr|cn|kp)',
-            ]
-            
-            for pattern in ad_patterns:
-                cleaned_name = re.sub(pattern, '', cleaned_name, flags=re.IGNORECASE)
+            for pattern in AD_PATTERNS:
+                cleaned_name = pattern.sub('', cleaned_name)
             
             # 4. 清理多余空格和特殊符号
-            cleaned_name = re.sub(r'\s+', ' ', cleaned_name)
+            cleaned_name = WHITESPACE_PATTERN.sub(' ', cleaned_name)
             cleaned_name = cleaned_name.strip(' -|')
             
             # 如果清理后名称为空或太短，使用默认名称
@@ -78,12 +105,11 @@ class ResultManager:
                 cleaned_name = "Node"
             
             # 重新编码名称部分
-            from urllib.parse import quote
             encoded_name = quote(cleaned_name)
             
             return f"{protocol_part}#{encoded_name}"
         
-        return node
+        return uri
 
     def save_results(self, results: Dict[str, Any]) -> bool:
         """
@@ -119,26 +145,55 @@ class ResultManager:
 
             # 去重并保存总节点文件
             if all_nodes:
-                unique_nodes = list(set(all_nodes))
+                unique_nodes = dedupe_nodes(all_nodes, keep_unparsed=True)
 
                 # 清理节点名称中的广告信息
                 cleaned_nodes = [self._clean_node_name(node) for node in unique_nodes]
 
-                # 保存到日期目录
-                total_file = os.path.join(result_dir, "nodetotal.txt")
-                with open(total_file, "w", encoding="utf-8") as f:
-                    for node in cleaned_nodes:
-                        f.write(f"{node}\n")
-
-                # 同时保存到根目录的result文件夹
+                # 按上一次的输出顺序排列，保持两次输出的差异最小
                 root_result_dir = "result"
                 os.makedirs(root_result_dir, exist_ok=True)
-                root_total_file = os.path.join(root_result_dir, "nodetotal.txt")
+                root_total_file = os.path.join(root_result_dir, TOTAL_FILE_NAME)
+                index_file = os.path.join(root_result_dir, INDEX_FILE_NAME)
+                previous_nodes, previous_keys = self._load_previous_snapshot(
+                    root_total_file, index_file
+                )
+                cleaned_nodes = stable_order(cleaned_nodes, previous_keys)
+
+                # 与上一次比较得到新增和删除的节点
+                current_keys = [node_key(node) for node in cleaned_nodes]
+                previous_key_set = set(previous_keys)
+                current_key_set = set(current_keys)
+                added_nodes = [
+                    node
+                    for node, key in zip(cleaned_nodes, current_keys)
+                    if key not in previous_key_set
+                ]
+                removed_nodes = [
+                    node
+                    for node, key in zip(previous_nodes, previous_keys)
+                    if key not in current_key_set
+                ]
 
-                with open(root_total_file, "w", encoding="utf-8") as f:
-                    for node in cleaned_nodes:
-                        f.write(f"{node}\n")
+                # 保存到日期目录
+                total_file = os.path.join(result_dir, TOTAL_FILE_NAME)
+                self._write_lines(total_file, cleaned_nodes)
+                self._write_lines(os.path.join(result_dir, ADDED_FILE_NAME), added_nodes)
+                self._write_lines(os.path.join(result_dir, REMOVED_FILE_NAME), removed_nodes)
 
+                # 同时保存到根目录的result文件夹
+                content = self._write_lines(root_total_file, cleaned_nodes)
+                self._write_lines(os.path.join(root_result_dir, ADDED_FILE_NAME), added_nodes)
+                self._write_lines(
+                    os.path.join(root_result_dir, REMOVED_FILE_NAME), removed_nodes
+                )
+                self._save_index(index_file, content, current_keys)
+                self._archive_day(date_str, result_dir)
+                self._record_node_store(results, cleaned_nodes)
+
+                self.logger.info(
+                    f"📊 与上一次相比新增 {len(added_nodes)} 个节点，删除 {len(removed_nodes)} 个节点"
+                )
                 self.logger.info(
                     f"保存了 {len(cleaned_nodes)} 个去重节点到 {total_file}"
                 )
@@ -152,6 +207,123 @@ class ResultManager:
             self.logger.error(f"保存结果失败: {str(e)}")
             return False
 
+    @staticmethod
+    def _content_digest(content: str) -> str:
+        """总节点文件内容的摘要（用于判断指纹索引是否与文件一致）"""
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _write_lines(self, file_path: str, lines: List[str]) -> str:
+        """
+        按行写入节点文件
+
+        Args:
+            file_path: 文件路径
+            lines: 节点列表
+
+        Returns:
+            写入的文件内容
+        """
+        content = "".join(f"{line}\n" for line in lines)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return content
+
+    def _save_index(self, index_file: str, content: str, keys: List[str]) -> None:
+        """
+        保存总节点文件的指纹索引
+
+        第一行记录总节点文件内容的摘要，之后每行是对应节点的比较键
+
+        Args:
+            index_file: 索引文件路径
+            content: 总节点文件内容
+            keys: 与总节点文件逐行对应的比较键
+        """
+        try:
+            with open(index_file, "w", encoding="utf-8") as f:
+                f.write(f"{INDEX_HEADER_PREFIX}{self._content_digest(content)}\n")
+                for key in keys:
+                    f.write(f"{key}\n")
+        except OSError as e:
+            self.logger.warning(f"保存指纹索引失败: {str(e)}")
+
+    def _load_previous_snapshot(
+        self, total_file: str, index_file: str
+    ) -> Tuple[List[str], List[str]]:
+        """
+        读取上一次保存的总节点文件及其比较键
+
+        索引与文件内容一致时直接使用索引中的比较键，否则（索引缺失或文件被修改）重新计算指纹
+
+        Args:
+            total_file: 总节点文件路径
+            index_file: 指纹索引文件路径
+
+        Returns:
+            (节点列表, 逐行对应的比较键)，文件不存在或读取失败时返回两个空列表
+        """
+        if not os.path.exists(total_file):
+            return [], []
+        try:
+            with open(total_file, "r", encoding="utf-8") as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(f"读取上一次的节点文件失败，按新顺序保存: {str(e)}")
+            return [], []
+        nodes = [line.strip() for line in content.splitlines() if line.strip()]
+
+        try:
+            with open(index_file, "r", encoding="utf-8") as f:
+                header = f.readline().strip()
+                keys = [line.strip() for line in f if line.strip()]
+            if header == f"{INDEX_HEADER_PREFIX}{self._content_digest(content)}" and len(
+                keys
+            ) == len(nodes):
+                return nodes, keys
+            self.logger.info("指纹索引与节点文件不一致，重新计算指纹")
+        except (OSError, UnicodeDecodeError):
+            self.logger.info("指纹索引不存在，重新计算指纹")
+
+        return nodes, [node_key(node) for node in nodes]
+
+    def _archive_day(self, date_str: str, result_dir: str) -> None:
+        """
+        已经迁移到归档（result/archive）时，把当天的目录追加到归档
+
+        Args:
+            date_str: 日期（YYYYMMDD）
+            result_dir: 当天的结果目录
+        """
+        try:
+            archive = ResultArchive(os.path.join("result", "archive"))
+            if not archive.exists():
+                return
+            archive.archive_dir_of_day(date_str, result_dir)
+            self.logger.info(f"📦 已追加 {date_str} 到结果归档")
+        except Exception as e:
+            self.logger.warning(f"追加结果归档失败: {str(e)}")
+
+    def _record_node_store(self, results: Dict[str, Any], nodes: List[str]) -> None:
+        """
+        把本次的节点和各网站的出现记录写入节点数据库（DATABASE_URL）
+
+        Args:
+            results: 收集结果字典
+            nodes: 本次输出的节点
+        """
+        try:
+            sightings = [
+                (node, site_key, site_results.get("node_sources", {}).get(node))
+                for site_key, site_results in results.items()
+                if site_results
+                for node in site_results.get("nodes") or []
+            ]
+            with NodeStore(DATABASE_URL) as store:
+                count = store.record_run(nodes, sightings)
+            self.logger.info(f"🗄️ 已写入 {count} 个节点到节点数据库")
+        except Exception as e:
+            self.logger.warning(f"写入节点数据库失败: {str(e)}")
+
     def _save_site_info(
         self, result_dir: str, site_key: str, site_results: Dict[str, Any]
     ) -> None:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+请求合并（singleflight）
+同一个键的并发调用只执行一次，其余调用等待并共享同一结果
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """一次进行中或已完成的调用"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """按键合并重复调用"""
+
+    def __init__(self, memoize: bool = False):
+        """
+        初始化请求合并器
+
+        Args:
+            memoize: 为True时保留已完成的结果，之后的同键调用直接复用；
+                     为False时只合并同时进行中的调用
+        """
+        self.memoize = memoize
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        执行或加入同键调用
+
+        Args:
+            key: 合并键
+            fn: 实际执行的函数
+
+        Returns:
+            fn 的返回值（所有同键调用共享同一个对象）
+
+        Raises:
+            fn 抛出的异常会传递给所有同键调用方
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+            else:
+                self.shared += 1
+
+        if leader:
+            try:
+                call.result = fn()
+            except BaseException as e:
+                call.error = e
+            finally:
+                call.done.set()
+                if not self.memoize:
+                    with self._lock:
+                        self._calls.pop(key, None)
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Clash 配置的代理列表读取
+只截取顶层 proxies 段交给 YAML 解析（rules、proxy-groups 等大段内容不解析），
+LibYAML 可用时使用 CSafeLoader；截取的片段无法单独解析时再解析整个文档
+"""
+
+import re
+from typing import Any, List, Optional
+
+try:
+    import yaml
+
+    HAS_YAML = True
+    # LibYAML 实现比纯 Python 实现快一个数量级
+    SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    HAS_YAML = False
+    yaml = None
+    SafeLoader = None
+
+# 代理列表的键（Proxy 为旧版 Clash 的写法）
+PROXIES_KEYS = ("proxies", "Proxy")
+
+# 顶层 proxies 键所在行
+PROXIES_KEY_PATTERN = re.compile(r"^(?:proxies|Proxy)[ \t]*:", re.MULTILINE)
+
+# proxies 段结束的位置：下一个顶层键或文档分隔符（顶层列表项以 "-" 开头，仍属于 proxies 段）
+SECTION_END_PATTERN = re.compile(r"^(?:[^\s#\-]|---|\.\.\.)", re.MULTILINE)
+
+
+def proxies_of(data: Any) -> Optional[List[Any]]:
+    """
+    取出 Clash 配置中的代理列表（完整配置的 proxies 或纯代理列表）
+
+    Args:
+        data: 解析后的配置
+
+    Returns:
+        代理列表，不是 Clash 配置时返回None
+    """
+    if isinstance(data, dict):
+        for key in PROXIES_KEYS:
+            proxies = data.get(key)
+            if isinstance(proxies, list):
+                return proxies
+        return None
+    if isinstance(data, list):
+        return data
+    return None
+
+
+def extract_proxies_section(text: str) -> Optional[str]:
+    """
+    截取顶层 proxies 段
+
+    Args:
+        text: YAML文本
+
+    Returns:
+        从 proxies 键到下一个顶层键之前的文本，没有顶层 proxies 键时返回None
+    """
+    match = PROXIES_KEY_PATTERN.search(text)
+    if not match:
+        return None
+    end = SECTION_END_PATTERN.search(text, match.end())
+    return text[match.start() : end.start() if end else len(text)]
+
+
+def load_clash_proxies(text: str) -> Optional[List[Any]]:
+    """
+    读取 Clash YAML 配置中的代理列表
+
+    Args:
+        text: YAML文本
+
+    Returns:
+        代理列表，不是 Clash 配置时返回None
+
+    Raises:
+        yaml.YAMLError: 整个文档都无法解析时
+    """
+    if not HAS_YAML:
+        return None
+
+    section = extract_proxies_section(text)
+    if section is not None:
+        try:
+            proxies = proxies_of(yaml.load(section, Loader=SafeLoader))
+        except yaml.YAMLError:
+            # 片段引用了前面定义的锚点等情况，改为解析整个文档
+            proxies = None
+        if proxies is not None:
+            return proxies
+
+    return proxies_of(yaml.load(text, Loader=SafeLoader))
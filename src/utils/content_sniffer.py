@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+订阅内容格式嗅探
+只读取内容开头的几KB判断格式（Clash YAML/JSON、Base64、URL编码、纯URI行），
+解析时先使用对应的解码器，没有结果时才依次尝试其余解码器。
+内容可以是原始字节，此时只解码用于判断的开头部分
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# 内容格式
+FORMAT_URI = "uri"  # 每行一个节点URI（或包含节点URI的普通文本）
+FORMAT_BASE64 = "base64"  # Base64编码的订阅
+FORMAT_URL_ENCODED = "url_encoded"  # URL编码的节点列表
+FORMAT_STRUCTURED = "structured"  # Clash YAML配置或JSON
+FORMAT_UNKNOWN = "unknown"
+
+# 嗅探失败或对应解码器没有结果时的尝试顺序（与原先的解析顺序一致）
+FALLBACK_ORDER = (FORMAT_URI, FORMAT_BASE64, FORMAT_URL_ENCODED, FORMAT_STRUCTURED)
+
+SNIFF_SIZE = 4096
+
+URI_LINE_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://")
+YAML_KEY_PATTERN = re.compile(r"^[\w-]+\s*:(?:\s|$)", re.MULTILINE)
+PROXIES_KEY_PATTERN = re.compile(r"^(?:proxies|Proxy)\s*:", re.MULTILINE)
+PERCENT_ESCAPE_PATTERN = re.compile(r"%[0-9A-Fa-f]{2}")
+ENCODED_SCHEME_PATTERN = re.compile(r"[A-Za-z0-9]%3A%2F%2F", re.IGNORECASE)
+BASE64_ALPHABET = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=-_")
+
+
+def sniff_content_format(content: Union[str, bytes], sample_size: int = SNIFF_SIZE) -> str:
+    """
+    根据内容开头判断订阅格式
+
+    Args:
+        content: 订阅内容（文本或原始字节）
+        sample_size: 读取的字符数（字节内容为字节数）
+
+    Returns:
+        FORMAT_* 之一
+    """
+    sample = content[:sample_size]
+    if isinstance(sample, bytes):
+        sample = sample.decode("utf-8", errors="ignore")
+    sample = sample.lstrip("\ufeff").strip()
+    if not sample:
+        return FORMAT_UNKNOWN
+
+    lines = [line.strip() for line in sample.splitlines() if line.strip()]
+    uri_lines = sum(1 for line in lines if URI_LINE_PATTERN.match(line))
+    if uri_lines * 2 >= len(lines):
+        return FORMAT_URI
+
+    if sample[0] in "{[" or PROXIES_KEY_PATTERN.search(sample):
+        return FORMAT_STRUCTURED
+    if len(YAML_KEY_PATTERN.findall(sample)) * 2 >= len(lines) and len(lines) >= 2:
+        return FORMAT_STRUCTURED
+
+    if ENCODED_SCHEME_PATTERN.search(sample):
+        escapes = len(PERCENT_ESCAPE_PATTERN.findall(sample))
+        if escapes * 3 * 20 >= len(sample):  # 转义字符占比不低于5%
+            return FORMAT_URL_ENCODED
+
+    compact = "".join(sample.split())
+    valid = sum(1 for char in compact if char in BASE64_ALPHABET)
+    if valid >= len(compact) * 0.98:
+        return FORMAT_BASE64
+
+    if uri_lines or "://" in sample:
+        return FORMAT_URI
+    return FORMAT_UNKNOWN
+
+
+def decode_by_format(
+    content: Union[str, bytes], decoders: Dict[str, Callable[[Union[str, bytes]], List[str]]]
+) -> Tuple[Optional[str], List[str]]:
+    """
+    先用嗅探出的格式对应的解码器，没有结果时按 FALLBACK_ORDER 尝试其余解码器
+
+    Args:
+        content: 订阅内容（原样传给解码函数）
+        decoders: 格式到解码函数的映射
+
+    Returns:
+        (产生结果的格式, 节点列表)，都没有结果时返回 (None, [])
+    """
+    detected = sniff_content_format(content)
+    order = [detected] if detected in decoders else []
+    order.extend(fmt for fmt in FALLBACK_ORDER if fmt in decoders and fmt != detected)
+
+    for fmt in order:
+        nodes = decoders[fmt](content)
+        if nodes:
+            return fmt, nodes
+    return None, []
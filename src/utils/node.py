@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+节点模型
+把节点URI解析为协议、主机、端口、凭据、参数和名称，每个URI只解析一次（带缓存），
+去重、地区识别、名称清理和输出都使用同一个解析结果，不再各自拆分字符串
+"""
+
+import base64
+import binascii
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+# 解析缓存大小（一次运行的节点数通常在几千到几万之间）
+NODE_CACHE_SIZE = 65536
+
+# vmess JSON 中已经映射到 Node 字段的键
+VMESS_FIELDS = {"v", "add", "port", "id", "ps"}
+
+
+class Node:
+    """
+    解析后的节点（不可变）
+
+    parse_node 带缓存，同一URI的调用方共享同一个实例，
+    因此创建后不能修改属性，params 也是只读映射
+    """
+
+    __slots__ = ("uri", "scheme", "host", "port", "credential", "params", "name")
+
+    def __init__(
+        self,
+        uri: str,
+        scheme: str,
+        host: str,
+        port: Optional[int],
+        credential: str = "",
+        params: Optional[Mapping[str, str]] = None,
+        name: str = "",
+    ):
+        """
+        初始化节点
+
+        Args:
+            uri: 原始节点URI
+            scheme: 小写协议名
+            host: 小写服务器地址（IPv6不带方括号）
+            port: 端口，无法解析时为None
+            credential: 凭据（uuid、密码或 ss 的 method:password）
+            params: 协议参数（查询参数或 vmess JSON 的其余字段）
+            name: 节点名称（已解码）
+        """
+        set_field = super().__setattr__
+        set_field("uri", uri)
+        set_field("scheme", scheme)
+        set_field("host", host)
+        set_field("port", port)
+        set_field("credential", credential)
+        set_field("params", MappingProxyType(dict(params or {})))
+        set_field("name", name)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"Node 不可修改: {key}")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"Node 不可修改: {key}")
+
+    @property
+    def server(self) -> str:
+        """host:port 形式的服务器地址"""
+        return f"{self.host}:{self.port}"
+
+    @property
+    def has_fragment_name(self) -> bool:
+        """名称是否在URI的 # 片段中（vmess/ssr 的名称在编码内容里）"""
+        return "#" in self.uri
+
+    def __repr__(self) -> str:
+        return f"Node({self.scheme}://{self.server}#{self.name})"
+
+
+def _b64decode_text(data: str) -> Optional[str]:
+    """解码标准或URL安全的Base64（可缺少padding），不是合法的UTF-8文本时返回None"""
+    data = data.strip()
+    if not data:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(
+            data.replace("+", "-").replace("/", "_") + "=" * (-len(data) % 4)
+        )
+        return raw.decode("utf-8")
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _parse_port(value: Any) -> Optional[int]:
+    try:
+        port = int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return port if 0 < port < 65536 else None
+
+
+def _parse_url_node(uri: str, scheme: str) -> Optional[Node]:
+    """解析 user@host:port?query#name 形式的节点（vless、trojan、hysteria 等）"""
+    parts = urlsplit(uri)
+    host = parts.hostname
+    if not host:
+        return None
+    try:
+        port = parts.port
+    except ValueError:
+        # 多端口（如 hysteria2 的 443,5000-6000）等非标准端口
+        port = _parse_port(parts.netloc.rpartition(":")[2].split(",")[0])
+
+    credential = unquote(parts.username or "")
+    if parts.password is not None:
+        credential = f"{credential}:{unquote(parts.password)}"
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    return Node(uri, scheme, host, port, credential, params, unquote(parts.fragment))
+
+
+def _parse_vmess(uri: str) -> Optional[Node]:
+    """解析 vmess://Base64(JSON)，不是JSON格式时按URL格式解析"""
+    body = uri[len("vmess://") :].split("#", 1)[0]
+    text = _b64decode_text(body)
+    if text is None:
+        return _parse_url_node(uri, "vmess")
+    try:
+        config = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(config, dict) or not config.get("add"):
+        return None
+
+    params = {
+        str(key): str(value) for key, value in config.items() if key not in VMESS_FIELDS
+    }
+    return Node(
+        uri,
+        "vmess",
+        str(config["add"]).strip().strip("[]").lower(),
+        _parse_port(config.get("port")),
+        str(config.get("id", "")),
+        params,
+        str(config.get("ps", "")),
+    )
+
+
+def _parse_ss(uri: str) -> Optional[Node]:
+    """解析 ss://（SIP002 的 Base64(method:password)@host:port 和旧版整体Base64）"""
+    body, _, fragment = uri[len("ss://") :].partition("#")
+    if "@" not in body:
+        # 旧版格式：ss://Base64(method:password@host:port)
+        decoded = _b64decode_text(body.split("?", 1)[0])
+        if decoded is None or "@" not in decoded:
+            return None
+        body = decoded
+
+    userinfo, _, rest = body.rpartition("@")
+    node = _parse_url_node(f"ss://placeholder@{rest}#{fragment}", "ss")
+    if node is None:
+        return None
+
+    userinfo = unquote(userinfo)
+    credential = userinfo if ":" in userinfo else (_b64decode_text(userinfo) or userinfo)
+    return Node(uri, "ss", node.host, node.port, credential, node.params, node.name)
+
+
+def _parse_ssr(uri: str) -> Optional[Node]:
+    """解析 ssr://Base64(host:port:protocol:method:obfs:Base64(password)/?params)"""
+    decoded = _b64decode_text(uri[len("ssr://") :].split("#", 1)[0])
+    if decoded is None:
+        return None
+    main, _, query = decoded.partition("/?")
+    fields = main.rsplit(":", 5)
+    if len(fields) != 6:
+        return None
+    host, port, protocol, method, obfs, password = fields
+
+    params = {"protocol": protocol, "obfs": obfs}
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        params[key] = _b64decode_text(value) or value
+    name = params.pop("remarks", "")
+    credential = f"{method}:{_b64decode_text(password) or password}"
+    return Node(uri, "ssr", host.strip("[]").lower(), _parse_port(port), credential, params, name)
+
+
+_PARSERS = {"vmess": _parse_vmess, "ss": _parse_ss, "ssr": _parse_ssr}
+
+
+@lru_cache(maxsize=NODE_CACHE_SIZE)
+def parse_node(uri: str) -> Optional[Node]:
+    """
+    解析节点URI（相同URI只解析一次）
+
+    Args:
+        uri: 节点URI
+
+    Returns:
+        节点，无法解析出服务器地址时返回None
+    """
+    scheme, sep, _ = uri.partition("://")
+    if not sep:
+        return None
+    scheme = scheme.lower()
+    parser = _PARSERS.get(scheme)
+    try:
+        return parser(uri) if parser else _parse_url_node(uri, scheme)
+    except (ValueError, UnicodeError):
+        return None
+
+
+def as_node(node: Union[str, Node]) -> Optional[Node]:
+    """
+    统一获取 Node（已经是 Node 时直接返回）
+
+    Args:
+        node: 节点URI或 Node
+
+    Returns:
+        节点，无法解析时返回None
+    """
+    return node if isinstance(node, Node) else parse_node(node)
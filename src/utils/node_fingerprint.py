@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+节点指纹
+把节点解码为与名称、参数顺序、大小写和默认值无关的规范身份元组
+（协议、主机、端口、凭据、有效参数）并计算哈希，去重只需一次集合遍历
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from .node import NODE_CACHE_SIZE, Node, parse_node
+
+# 协议别名
+SCHEME_ALIASES = {"hy2": "hysteria2", "shadowsocks": "ss", "socks": "socks5"}
+
+# 凭据不区分大小写的协议（凭据为UUID）
+UUID_SCHEMES = {"vmess", "vless"}
+
+# 不影响连接的参数（名称、分组等）
+COSMETIC_PARAMS = {"name", "remarks", "ps", "group", "tag", "v"}
+
+# 与省略等价的默认参数值
+DEFAULT_PARAMS = {
+    ("type", "tcp"),
+    ("type", "none"),
+    ("net", "tcp"),
+    ("security", "none"),
+    ("encryption", "none"),
+    ("headertype", "none"),
+    ("tls", "none"),
+    ("aid", "0"),
+    ("scy", "auto"),
+}
+
+Identity = Tuple[str, str, Optional[int], str, Tuple[Tuple[str, str], ...]]
+
+
+def node_identity(node: Node) -> Identity:
+    """
+    计算节点的规范身份元组
+
+    Args:
+        node: 解析后的节点
+
+    Returns:
+        (协议, 主机, 端口, 凭据, 排序后的有效参数)
+    """
+    scheme = SCHEME_ALIASES.get(node.scheme, node.scheme)
+    credential = node.credential.lower() if scheme in UUID_SCHEMES else node.credential
+
+    params = []
+    for key, value in node.params.items():
+        key, value = key.lower(), str(value).strip()
+        if not value or key in COSMETIC_PARAMS or (key, value.lower()) in DEFAULT_PARAMS:
+            continue
+        params.append((key, value))
+    params.sort()
+
+    return scheme, node.host.rstrip("."), node.port, credential, tuple(params)
+
+
+@lru_cache(maxsize=NODE_CACHE_SIZE)
+def node_fingerprint(uri: str) -> Optional[str]:
+    """
+    计算节点指纹（名称不同、参数顺序不同的同一节点指纹相同）
+
+    Args:
+        uri: 节点URI
+
+    Returns:
+        十六进制指纹，无法解析的节点返回None
+    """
+    node = parse_node(uri)
+    if node is None:
+        return None
+    return hashlib.blake2b(
+        repr(node_identity(node)).encode("utf-8", errors="surrogatepass"), digest_size=12
+    ).hexdigest()
+
+
+def dedupe_nodes(nodes: Iterable[str], keep_unparsed: bool = False) -> List[str]:
+    """
+    按指纹去重（保留每个指纹第一次出现的节点）
+
+    Args:
+        nodes: 节点URI列表
+        keep_unparsed: 是否保留无法解析的节点（按原始字符串去重）
+
+    Returns:
+        去重后的节点列表
+    """
+    seen = set()
+    unique_nodes = []
+    for uri in nodes:
+        key = node_fingerprint(uri)
+        if key is None:
+            if not keep_unparsed:
+                continue
+            key = uri
+        if key not in seen:
+            seen.add(key)
+            unique_nodes.append(uri)
+    return unique_nodes
+
+
+def node_key(uri: str) -> str:
+    """
+    节点的比较键（指纹，无法解析的节点使用原始字符串）
+
+    Args:
+        uri: 节点URI
+
+    Returns:
+        比较键
+    """
+    return node_fingerprint(uri) or uri
+
+
+def stable_order(nodes: Iterable[str], previous_keys: Iterable[str]) -> List[str]:
+    """
+    按上一次输出的顺序排列节点，使前后两次输出的差异最小
+
+    上一次已有的节点（按指纹匹配，名称变化也算同一节点）保持原来的相对位置，
+    新节点按指纹排序追加在末尾，结果与集合遍历顺序和哈希随机化无关
+
+    Args:
+        nodes: 本次的节点列表（已去重）
+        previous_keys: 上一次输出的节点比较键（见 node_key），按输出顺序
+
+    Returns:
+        排列后的节点列表
+    """
+    rank = {}
+    for index, key in enumerate(previous_keys):
+        rank.setdefault(key, index)
+
+    kept, added = [], []
+    for uri in nodes:
+        key = node_key(uri)
+        if key in rank:
+            kept.append((rank[key], uri))
+        else:
+            added.append((key, uri))
+    kept.sort()
+    added.sort()
+    return [uri for _, uri in kept] + [uri for _, uri in added]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+节点URI扫描器
+用一个预编译的多协议正则一次扫描整段文本，找出所有 scheme:// 节点，
+每个节点只来自一次匹配（hysteria2:// 不会再被 hysteria:// 或 ss:// 重复匹配）
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
+
+
+class NodeScanner:
+    """多协议节点URI扫描器"""
+
+    def __init__(self, schemes: Iterable[str], stop_chars: str = ""):
+        """
+        初始化扫描器
+
+        Args:
+            schemes: 需要识别的协议名（如 vmess、vless）
+            stop_chars: 除空白外，节点URI遇到即结束的字符（如 '<>"'）
+        """
+        self.schemes = tuple(dict.fromkeys(scheme.lower() for scheme in schemes))
+        # 长协议名在前，保证 hysteria2 / ssr 优先于 hysteria / ss
+        alternation = "|".join(
+            re.escape(scheme) for scheme in sorted(self.schemes, key=len, reverse=True)
+        )
+        stop = "".join(re.escape(char) for char in stop_chars)
+        # 协议名前不能紧跟协议名字符，避免把 vmess:// 中的 ss:// 当作节点
+        self.pattern = re.compile(
+            rf"(?<![A-Za-z0-9+.\-])(?P<scheme>{alternation})://[^\s{stop}]+",
+            re.IGNORECASE,
+        )
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, str]]:
+        """
+        按出现顺序遍历文本中的节点
+
+        Args:
+            text: 源文本
+
+        Yields:
+            (小写协议名, 节点URI)
+        """
+        for match in self.pattern.finditer(text):
+            yield match.group("scheme").lower(), match.group(0)
+
+    def scan(self, text: str, min_length: int = 0) -> List[str]:
+        """
+        提取文本中的节点
+
+        Args:
+            text: 源文本
+            min_length: 节点最小长度
+
+        Returns:
+            节点URI列表（按出现顺序，不去重）
+        """
+        return [
+            match.group(0)
+            for match in self.pattern.finditer(text)
+            if match.end() - match.start() >= min_length
+        ]
+
+
+@lru_cache(maxsize=None)
+def _build_scanner(schemes: Tuple[str, ...], stop_chars: str) -> NodeScanner:
+    return NodeScanner(schemes, stop_chars)
+
+
+def get_node_scanner(schemes: Iterable[str], stop_chars: str = "") -> NodeScanner:
+    """
+    获取扫描器（相同参数共享同一个预编译实例）
+
+    Args:
+        schemes: 需要识别的协议名
+        stop_chars: 除空白外结束节点URI的字符
+
+    Returns:
+        扫描器实例
+    """
+    return _build_scanner(tuple(schemes), stop_chars)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+URL处理工具
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 不影响返回内容的跟踪参数
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "msclkid",
+    "spm",
+    "from",
+    "source",
+    "share_from",
+    "_t",
+}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    规范化URL，用于判断两个链接是否指向同一资源
+
+    规则：协议和主机名小写、去掉默认端口、去掉片段和跟踪参数、
+    剩余查询参数按名称排序、空路径补为 "/"
+
+    Args:
+        url: 原始URL
+
+    Returns:
+        规范化后的URL，无法解析时返回去除首尾空白的原始URL
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if not scheme or not host:
+        return url
+
+    netloc = host
+    if port and DEFAULT_PORTS.get(scheme) != port:
+        netloc = f"{host}:{port}"
+    if parts.username:
+        userinfo = parts.username
+        if parts.password:
+            userinfo = f"{userinfo}:{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    ]
+    query.sort(key=lambda item: item[0])
+
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
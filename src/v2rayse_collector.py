@@ -6,10 +6,12 @@ V2RaySE网站节点收集器
 """
 
 import asyncio
+import json
 import os
 import sys
 import subprocess
 from pathlib import Path
+from typing import Any, Iterator, List, Optional
 
 # Check and install playwright if not available
 try:
@@ -33,7 +35,151 @@ except ImportError:
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.core.config_manager import get_config
+from src.core.debug_artifacts import get_debug_artifacts
+from src.core.decode_engine import SubscriptionDecoder
+from src.core.protocol_converter import get_converter
 from src.utils.logger import get_logger
+from src.utils.node_scanner import get_node_scanner
+
+# 需要检查的响应类型（页面表格数据由接口加载）
+API_RESOURCE_TYPES = ("xhr", "fetch")
+
+# 首次捕获到节点后继续等待更大响应的静默时间（秒），
+# 避免在填充表格的接口响应到达之前就返回了其他接口中的少量节点
+API_SETTLE_SECONDS = 1.5
+
+
+def _iter_payload_items(data: Any) -> Iterator[Any]:
+    """遍历JSON数据中的字符串和类似Clash代理配置的字典"""
+    if isinstance(data, dict):
+        if {"type", "server", "port"} <= data.keys():
+            yield data
+        for value in data.values():
+            yield from _iter_payload_items(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from _iter_payload_items(value)
+    elif isinstance(data, str):
+        yield data
+
+
+def extract_nodes_from_payload(
+    payload: str, min_length: int = 20, decoder: Optional[SubscriptionDecoder] = None
+) -> List[str]:
+    """
+    从接口响应中提取节点（支持JSON、纯文本和Base64订阅格式）
+
+    Args:
+        payload: 响应文本
+        min_length: 节点最小长度
+        decoder: 复用的订阅解码器，为None时新建
+
+    Returns:
+        去重后的节点列表（保持出现顺序）
+    """
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        data = payload
+
+    # 字符串字段（明文、Base64、URL编码、Clash配置）交给统一的订阅解码器
+    decoder = decoder or SubscriptionDecoder(get_converter(), min_length)
+    nodes = []
+    for item in _iter_payload_items(data):
+        if isinstance(item, dict):
+            node = decoder.converter.convert(item)
+            if node:
+                nodes.append(node)
+        else:
+            nodes.extend(decoder.decode(item))
+
+    return [node for node in dict.fromkeys(node.strip() for node in nodes) if len(node) >= min_length]
+
+
+class ApiNodeCapture:
+    """监听页面的 XHR/fetch 响应，直接从填充节点表格的接口数据中获取节点"""
+
+    def __init__(self, logger, settle: float = API_SETTLE_SECONDS):
+        """
+        初始化接口响应捕获器
+
+        Args:
+            logger: 日志记录器
+            settle: 首次捕获到节点后等待更大响应的静默时间（秒）
+        """
+        self.logger = logger
+        self.settle = settle
+        self.nodes: List[str] = []
+        self.source_url = None
+        self.decoder = SubscriptionDecoder(get_converter(), logger=logger)
+        self._found = asyncio.Event()
+        self._updated = asyncio.Event()
+        self._tasks = set()
+
+    def attach(self, page) -> None:
+        """开始监听页面响应（需在打开页面之前调用）"""
+        page.on("response", self._on_response)
+
+    def _on_response(self, response) -> None:
+        if response.request.resource_type not in API_RESOURCE_TYPES:
+            return
+        task = asyncio.ensure_future(self._inspect(response))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _inspect(self, response) -> None:
+        """检查一个接口响应，包含节点时记录并通知等待方"""
+        try:
+            if not response.ok:
+                return
+            payload = await response.text()
+        except Exception as e:
+            self.logger.debug(f"读取接口响应失败: {response.url} - {e}")
+            return
+
+        nodes = extract_nodes_from_payload(payload, decoder=self.decoder)
+        # 多个接口都包含节点时保留节点最多的一个
+        if len(nodes) > len(self.nodes):
+            self.nodes = nodes
+            self.source_url = response.url
+            self.logger.info(f"📡 从接口响应获取到 {len(nodes)} 个节点: {response.url}")
+            self._found.set()
+            self._updated.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        等待包含节点的接口响应
+
+        捕获到节点后继续等待，直到 settle 秒内没有更大的响应、
+        正在检查的响应都已处理完（总时间不超过 timeout）
+
+        Args:
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            是否已获取到节点
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            await asyncio.wait_for(self._found.wait(), timeout)
+        except asyncio.TimeoutError:
+            return bool(self.nodes)
+
+        while True:
+            self._updated.clear()
+            remaining = min(self.settle, deadline - loop.time())
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._updated.wait(), remaining)
+            except asyncio.TimeoutError:
+                pending = [task for task in self._tasks if not task.done()]
+                if not pending:
+                    break
+                await asyncio.wait(pending, timeout=max(0.0, deadline - loop.time()))
+        return bool(self.nodes)
 
 
 class V2RaySECollector:
@@ -44,8 +190,10 @@ class V2RaySECollector:
         self.url = "https://www.v2rayse.com/free-node"
         self.result_dir = project_root / "result"
         self.result_file = self.result_dir / "v2rayse.txt"
-        self.debug_dir = project_root / "data" / "debug"
-        self.debug_dir.mkdir(exist_ok=True)
+        self.artifacts = get_debug_artifacts()
+        config = get_config().base
+        self.capture_mode = config.V2RAYSE_CAPTURE_MODE
+        self.api_timeout = config.V2RAYSE_API_TIMEOUT
 
     async def collect_nodes(self):
         """收集节点的主函数"""
@@ -54,6 +202,12 @@ class V2RaySECollector:
                 browser = await p.chromium.launch(headless=True)
                 page = await browser.new_page()
 
+                # 在打开页面之前开始监听接口响应
+                capture = None
+                if self.capture_mode == "api":
+                    capture = ApiNodeCapture(self.logger)
+                    capture.attach(page)
+
                 # Set user agent to avoid blocking
                 await page.set_extra_http_headers(
                     {
@@ -72,410 +226,450 @@ class V2RaySECollector:
                         self.url, wait_until="domcontentloaded", timeout=60000
                     )
 
-                # 保存初始页面截图用于调试
-                await page.screenshot(path=str(self.debug_dir / "debug_initial.png"))
-                self.logger.info("保存初始页面截图: debug_initial.png")
+                v2ray_content = ""
+                if capture is not None:
+                    self.logger.info(f"等待节点接口响应（最多 {self.api_timeout} 秒）...")
+                    if await capture.wait(self.api_timeout):
+                        v2ray_content = "\n".join(capture.nodes)
+                    else:
+                        self.logger.warning("未捕获到节点接口响应，改用页面操作方式")
 
-                # 处理可能的广告弹窗
-                try:
-                    # Wait for popups to load then try to close them
-                    await page.wait_for_timeout(2000)
-
-                    # Try to close various popup types
-                    popup_selectors = [
-                        ".popup-close",
-                        ".modal-close",
-                        ".ad-close",
-                        '[data-dismiss="modal"]',
-                        ".close-button",
-                        "#popup-close",
-                    ]
+                if not v2ray_content:
+                    v2ray_content = await self._collect_via_ui(page, capture)
 
-                    for selector in popup_selectors:
-                        try:
-                            close_button = page.locator(selector).first
-                            if await close_button.is_visible():
-                                await close_button.click()
-                                self.logger.info(f"关闭弹窗: {selector}")
-                                break
-                        except:
-                            continue
+                # 关闭浏览器
+                await browser.close()
 
-                except Exception as e:
-                    self.logger.warning(f"处理弹窗时出错: {e}")
+                if v2ray_content:
+                    # 确保结果目录存在
+                    self.result_dir.mkdir(exist_ok=True)
 
-                # 等待页面加载
-                self.logger.info("等待页面加载...")
-                await page.wait_for_timeout(10000)  # 直接等待10秒让页面加载
+                    # 保存到文件
+                    with open(self.result_file, "w", encoding="utf-8") as f:
+                        f.write(v2ray_content.strip())
 
-                # 尝试触发任何可能的按钮来加载节点
-                try:
-                    # 查找可能的加载按钮
-                    load_buttons = page.locator(
-                        'button:has-text("加载"), button:has-text("刷新"), button:has-text("获取"), button:has-text("开始")'
+                    self.logger.info(
+                        f"成功保存 {len(v2ray_content.splitlines())} 个节点到 {self.result_file}"
                     )
-                    count = await load_buttons.count()
-                    if count > 0:
-                        await load_buttons.first.click()
-                        self.logger.info("点击了加载按钮")
-                        await page.wait_for_timeout(5000)
+                    return True
+                else:
+                    self.logger.error("未获取到任何节点内容")
+                    return False
 
-                except Exception as e:
-                    self.logger.warning(f"尝试点击加载按钮失败: {e}")
+        except Exception as e:
+            self.logger.error(f"收集过程出错: {e}")
+            import traceback
 
-                # 等待15秒让节点加载
-                self.logger.info("等待15秒让节点加载...")
-                await page.wait_for_timeout(15000)
+            traceback.print_exc()
+            return False
 
-                # 保存等待后的页面截图
-                await page.screenshot(path=str(self.debug_dir / "debug_after_wait.png"))
-                self.logger.info("保存等待后页面截图: debug_after_wait.png")
+    async def _collect_via_ui(self, page, capture=None) -> str:
+        """
+        通过页面操作获取节点（勾选全部节点后复制，或从页面内容中解析）
 
-                # 保存页面HTML内容用于分析
-                page_html = await page.content()
-                with open(self.debug_dir / "debug_page.html", "w", encoding="utf-8") as f:
-                    f.write(page_html)
-                self.logger.info("保存页面HTML: debug_page.html")
+        Args:
+            page: 已打开的页面
+            capture: 接口响应捕获器，操作过程中捕获到节点时直接使用
 
-                # 也保存页面文本内容
-                page_text = await page.inner_text("body")
-                with open(self.debug_dir / "debug_page_text.txt", "w", encoding="utf-8") as f:
-                    f.write(page_text)
-                self.logger.info("保存页面文本: debug_page_text.txt")
+        Returns:
+            节点内容文本
+        """
+        # 保存初始页面截图用于调试
+        await self._save_screenshot(page, "initial")
 
-                # 查找表头的全选复选框
+        # 处理可能的广告弹窗
+        try:
+            # Wait for popups to load then try to close them
+            await page.wait_for_timeout(2000)
+
+            # Try to close various popup types
+            popup_selectors = [
+                ".popup-close",
+                ".modal-close",
+                ".ad-close",
+                '[data-dismiss="modal"]',
+                ".close-button",
+                "#popup-close",
+            ]
+
+            for selector in popup_selectors:
                 try:
-                    # 表头的全选复选框通常在th元素中
-                    # 注意：V2RaySE使用的是自定义复选框（button[role="checkbox"]），不是标准的input[type="checkbox"]
-                    select_all_selectors = [
-                        'th button[role="checkbox"]',
-                        'thead button[role="checkbox"]',
-                        '.table-header button[role="checkbox"]',
-                        '#table-header button[role="checkbox"]',
-                        'button[role="checkbox"][aria-label*="全选"]',
-                        'button[role="checkbox"][aria-label*="select"]',
-                    ]
+                    close_button = page.locator(selector).first
+                    if await close_button.is_visible():
+                        await close_button.click()
+                        self.logger.info(f"关闭弹窗: {selector}")
+                        break
+                except:
+                    continue
 
-                    select_all_clicked = False
-                    for selector in select_all_selectors:
-                        try:
-                            element = page.locator(selector).first
-                            if await element.is_visible():
-                                await element.click()
-                                self.logger.info(f"点击表头全选复选框: {selector}")
-                                select_all_clicked = True
-                                await page.wait_for_timeout(1000)  # 等待选择完成
-                                break
-                        except Exception as e:
-                            self.logger.debug(f"尝试 {selector} 失败: {e}")
-                            continue
-
-                    if not select_all_clicked:
-                        # 如果没找到表头复选框，尝试查找页面中的所有复选框并全部勾选
-                        all_checkboxes = page.locator('button[role="checkbox"]')
-                        count = await all_checkboxes.count()
-                        if count > 0:
-                            self.logger.info(f"找到 {count} 个自定义复选框，尝试全部勾选")
-                            try:
-                                # 勾选所有复选框
-                                checked_count = 0
-                                for i in range(count):
-                                    try:
-                                        checkbox = all_checkboxes.nth(i)
-                                        # 检查是否已勾选，避免重复点击
-                                        aria_checked = await checkbox.get_attribute("aria-checked")
-                                        if aria_checked == "false":
-                                            await checkbox.click()
-                                            checked_count += 1
-                                            self.logger.debug(f"勾选第 {i} 个复选框")
-                                    except Exception as e:
-                                        self.logger.debug(f"勾选第 {i} 个复选框失败: {e}")
-                                        continue
-                                select_all_clicked = True
-                                self.logger.info(f"成功勾选 {checked_count} 个复选框（共{count}个）")
-                                
-                                # 保存勾选后的截图
-                                await page.screenshot(path=str(self.debug_dir / "debug_after_check.png"))
-                                self.logger.info("保存勾选后页面截图: debug_after_check.png")
-                            except Exception as e:
-                                self.logger.warning(f"勾选复选框失败: {e}")
-                        else:
-                            self.logger.warning("未找到任何复选框")
+        except Exception as e:
+            self.logger.warning(f"处理弹窗时出错: {e}")
 
-                except Exception as e:
-                    self.logger.error(f"选择节点时出错: {e}")
+        # 等待页面加载（表格出现即继续，最多10秒）
+        self.logger.info("等待页面加载...")
+        await self._wait_for_table(page, 10000)
+
+        # 尝试触发任何可能的按钮来加载节点
+        try:
+            # 查找可能的加载按钮
+            load_buttons = page.locator(
+                'button:has-text("加载"), button:has-text("刷新"), button:has-text("获取"), button:has-text("开始")'
+            )
+            count = await load_buttons.count()
+            if count > 0:
+                await load_buttons.first.click()
+                self.logger.info("点击了加载按钮")
+                # 点击后接口返回了节点数据则直接使用
+                if capture is not None and await capture.wait(5):
+                    return "\n".join(capture.nodes)
+
+        except Exception as e:
+            self.logger.warning(f"尝试点击加载按钮失败: {e}")
+
+        # 等待节点加载（出现节点复选框即继续，最多15秒）
+        self.logger.info("等待节点加载...")
+        await self._wait_for_table(page, 15000, 'button[role="checkbox"]')
+        if capture is not None and capture.nodes:
+            return "\n".join(capture.nodes)
+
+        # 保存等待后的页面截图、HTML和文本内容用于分析
+        await self._save_screenshot(page, "after_wait")
+        if self.artifacts.enabled("html"):
+            self.artifacts.save("html", "v2rayse_page.html", await page.content())
+            self.artifacts.save("text", "v2rayse_page_text.txt", await page.inner_text("body"))
 
-                # 在勾选所有复选框后，点击节点操作按钮
+        # 查找表头的全选复选框
+        try:
+            # 表头的全选复选框通常在th元素中
+            # 注意：V2RaySE使用的是自定义复选框（button[role="checkbox"]），不是标准的input[type="checkbox"]
+            select_all_selectors = [
+                'th button[role="checkbox"]',
+                'thead button[role="checkbox"]',
+                '.table-header button[role="checkbox"]',
+                '#table-header button[role="checkbox"]',
+                'button[role="checkbox"][aria-label*="全选"]',
+                'button[role="checkbox"][aria-label*="select"]',
+            ]
+
+            select_all_clicked = False
+            for selector in select_all_selectors:
                 try:
-                    # 点击"节点操作"按钮
-                    node_operation_btn = page.locator('button:has-text("节点操作")').first
-                    if await node_operation_btn.is_visible():
-                        await node_operation_btn.click()
-                        self.logger.info("点击节点操作按钮")
-                        await page.wait_for_timeout(1000)  # 等待菜单显示
-                        
-                        # 查找"选中操作"按钮
-                        select_operation_selectors = [
-                            'button:has-text("选中操作")',
-                            'a:has-text("选中操作")',
-                        ]
-                        
-                        select_operation_found = False
-                        for selector in select_operation_selectors:
+                    element = page.locator(selector).first
+                    if await element.is_visible():
+                        await element.click()
+                        self.logger.info(f"点击表头全选复选框: {selector}")
+                        select_all_clicked = True
+                        await page.wait_for_timeout(1000)  # 等待选择完成
+                        break
+                except Exception as e:
+                    self.logger.debug(f"尝试 {selector} 失败: {e}")
+                    continue
+
+            if not select_all_clicked:
+                # 如果没找到表头复选框，尝试查找页面中的所有复选框并全部勾选
+                all_checkboxes = page.locator('button[role="checkbox"]')
+                count = await all_checkboxes.count()
+                if count > 0:
+                    self.logger.info(f"找到 {count} 个自定义复选框，尝试全部勾选")
+                    try:
+                        # 勾选所有复选框
+                        checked_count = 0
+                        for i in range(count):
                             try:
-                                select_operation_btn = page.locator(selector).first
-                                if await select_operation_btn.is_visible():
-                                    # 悬浮到"选中操作"按钮
-                                    await select_operation_btn.hover()
-                                    self.logger.info(f"悬浮到选中操作按钮: {selector}")
-                                    await page.wait_for_timeout(1000)  # 等待子菜单显示
-                                    
-                                    # 查找并点击"复制"按钮
-                                    copy_selectors = [
-                                        'button:has-text("复制")',
-                                        'a:has-text("复制")',
-                                    ]
-                                    
-                                    copy_found = False
-                                    for copy_selector in copy_selectors:
-                                        try:
-                                            copy_btn = page.locator(copy_selector).first
-                                            if await copy_btn.is_visible():
-                                                await copy_btn.click()
-                                                self.logger.info(f"点击复制按钮: {copy_selector}")
-                                                copy_found = True
-                                                await page.wait_for_timeout(2000)  # 等待复制完成
-                                                break
-                                        except Exception as e:
-                                            self.logger.debug(f"尝试 {copy_selector} 失败: {e}")
-                                            continue
-                                    
-                                    if copy_found:
-                                        self.logger.info("已成功点击复制按钮")
-                                        # 保存点击后的截图
-                                        await page.screenshot(path=str(self.debug_dir / "debug_after_copy.png"))
-                                        self.logger.info("保存复制后页面截图: debug_after_copy.png")
-                                        select_operation_found = True
-                                        break
-                                    else:
-                                        self.logger.warning("未找到复制按钮")
+                                checkbox = all_checkboxes.nth(i)
+                                # 检查是否已勾选，避免重复点击
+                                aria_checked = await checkbox.get_attribute("aria-checked")
+                                if aria_checked == "false":
+                                    await checkbox.click()
+                                    checked_count += 1
+                                    self.logger.debug(f"勾选第 {i} 个复选框")
                             except Exception as e:
-                                self.logger.debug(f"尝试 {selector} 失败: {e}")
+                                self.logger.debug(f"勾选第 {i} 个复选框失败: {e}")
                                 continue
+                        select_all_clicked = True
+                        self.logger.info(f"成功勾选 {checked_count} 个复选框（共{count}个）")
                         
-                        if not select_operation_found:
-                            self.logger.warning("未找到选中操作按钮")
-                    else:
-                        self.logger.warning("未找到节点操作按钮")
+                        # 保存勾选后的截图
+                        await self._save_screenshot(page, "after_check")
+                    except Exception as e:
+                        self.logger.warning(f"勾选复选框失败: {e}")
+                else:
+                    self.logger.warning("未找到任何复选框")
 
-                except Exception as e:
-                    self.logger.warning(f"查找节点操作按钮时出错: {e}")
+        except Exception as e:
+            self.logger.error(f"选择节点时出错: {e}")
 
-                # 等待复制完成
-                await page.wait_for_timeout(3000)
+        # 在勾选所有复选框后，点击节点操作按钮
+        try:
+            # 点击"节点操作"按钮
+            node_operation_btn = page.locator('button:has-text("节点操作")').first
+            if await node_operation_btn.is_visible():
+                await node_operation_btn.click()
+                self.logger.info("点击节点操作按钮")
+                await page.wait_for_timeout(1000)  # 等待菜单显示
+                
+                # 查找"选中操作"按钮
+                select_operation_selectors = [
+                    'button:has-text("选中操作")',
+                    'a:has-text("选中操作")',
+                ]
+                
+                select_operation_found = False
+                for selector in select_operation_selectors:
+                    try:
+                        select_operation_btn = page.locator(selector).first
+                        if await select_operation_btn.is_visible():
+                            # 悬浮到"选中操作"按钮
+                            await select_operation_btn.hover()
+                            self.logger.info(f"悬浮到选中操作按钮: {selector}")
+                            await page.wait_for_timeout(1000)  # 等待子菜单显示
+                            
+                            # 查找并点击"复制"按钮
+                            copy_selectors = [
+                                'button:has-text("复制")',
+                                'a:has-text("复制")',
+                            ]
+                            
+                            copy_found = False
+                            for copy_selector in copy_selectors:
+                                try:
+                                    copy_btn = page.locator(copy_selector).first
+                                    if await copy_btn.is_visible():
+                                        await copy_btn.click()
+                                        self.logger.info(f"点击复制按钮: {copy_selector}")
+                                        copy_found = True
+                                        await page.wait_for_timeout(2000)  # 等待复制完成
+                                        break
+                                except Exception as e:
+                                    self.logger.debug(f"尝试 {copy_selector} 失败: {e}")
+                                    continue
+                            
+                            if copy_found:
+                                self.logger.info("已成功点击复制按钮")
+                                # 保存点击后的截图
+                                await self._save_screenshot(page, "after_copy")
+                                select_operation_found = True
+                                break
+                            else:
+                                self.logger.warning("未找到复制按钮")
+                    except Exception as e:
+                        self.logger.debug(f"尝试 {selector} 失败: {e}")
+                        continue
+                
+                if not select_operation_found:
+                    self.logger.warning("未找到选中操作按钮")
+            else:
+                self.logger.warning("未找到节点操作按钮")
 
-                # 提取V2RAY节点数据
-                v2ray_content = ""
+        except Exception as e:
+            self.logger.warning(f"查找节点操作按钮时出错: {e}")
 
-                try:
-                    # 首先尝试从文本区域或结果区域提取
-                    content_selectors = [
-                        "textarea",
-                        "#result",
-                        ".result",
-                        "#v2ray-content",
-                        ".v2ray-content",
-                        "pre",
-                        ".node-content",
-                        "#node-content",
-                    ]
+        # 等待复制完成
+        await page.wait_for_timeout(3000)
 
-                    for selector in content_selectors:
-                        try:
-                            content_element = page.locator(selector).first
-                            if await content_element.is_visible():
-                                v2ray_content = await content_element.text_content()
-                                if v2ray_content:
-                                    self.logger.info(
-                                        f"从 {selector} 提取到内容: '{v2ray_content[:100]}...'"
-                                    )
-                                    if v2ray_content.strip():
-                                        break
-                                else:
-                                    self.logger.info(f"从 {selector} 提取到空内容")
-                        except:
-                            continue
-
-                    if not v2ray_content:
-                        # 如果没找到特定区域，尝试从页面源码中提取节点配置
-                        page_content = await page.content()
-                        self.logger.info("从页面源码提取节点配置")
-
-                        # 查找可能的节点配置模式
-                        import re
-
-                        # 提取各种类型的节点链接
-                        node_patterns = [
-                            r'vmess://[^\s"<]+',
-                            r'vless://[^\s"<]+',
-                            r'trojan://[^\s"<]+',
-                            r'ss://[^\s"<]+',
-                            r'ssr://[^\s"<]+',
-                            r'hysteria://[^\s"<]+',
-                        ]
-
-                        all_links = []
-                        for pattern in node_patterns:
-                            links = re.findall(pattern, page_content)
-                            all_links.extend(links)
-
-                        if all_links:
-                            v2ray_content = "\n".join(all_links)
+        # 提取V2RAY节点数据
+        v2ray_content = ""
+
+        try:
+            # 首先尝试从文本区域或结果区域提取
+            content_selectors = [
+                "textarea",
+                "#result",
+                ".result",
+                "#v2ray-content",
+                ".v2ray-content",
+                "pre",
+                ".node-content",
+                "#node-content",
+            ]
+
+            for selector in content_selectors:
+                try:
+                    content_element = page.locator(selector).first
+                    if await content_element.is_visible():
+                        v2ray_content = await content_element.text_content()
+                        if v2ray_content:
                             self.logger.info(
-                                f"从源码提取到 {len(all_links)} 个节点链接"
+                                f"从 {selector} 提取到内容: '{v2ray_content[:100]}...'"
                             )
+                            if v2ray_content.strip():
+                                break
                         else:
-                            # 如果还是没找到，尝试解析表格数据生成配置
-                            self.logger.info("尝试解析表格数据生成节点配置")
-
-                            # 从页面文本中提取节点信息
-                            page_text = await page.inner_text("body")
-
-                            # 解析节点表格 - 改进的解析逻辑
-                            # 从页面文本中提取节点信息
-                            lines = [
-                                line.strip()
-                                for line in page_text.split("\n")
-                                if line.strip()
-                            ]
-
-                            # 查找节点数据的模式
-                            # 典型的格式：🇺🇸_US_美国 vless v2.dabache.top 443 操作
-                            nodes = []
-                            i = 0
-                            while i < len(lines):
-                                line = lines[i]
-
-                                # 查找以国旗开头的行（节点名称）
-                                if (
-                                    line.startswith("🇺🇸")
-                                    or line.startswith("🇩🇪")
-                                    or line.startswith("🇬🇧")
-                                    or line.startswith("🇷🇺")
-                                    or line.startswith("🇮🇹")
-                                    or line.startswith("🇮🇶")
-                                    or line.startswith("🇳🇱")
-                                    or line.startswith("🇪🇸")
-                                    or line.startswith("🇨🇦")
-                                    or line.startswith("🇩🇰")
-                                    or line.startswith("🇯🇵")
-                                    or line.startswith("🇰🇷")
-                                    or line.startswith("🇦🇺")
-                                    or line.startswith("🇸🇬")
-                                    or line.startswith("🇭🇰")
-                                ):
-                                    # 这是一个节点名称，接下来应该有类型、服务器、端口
-                                    node_name = line
-
-                                    # 查找下一行
-                                    if i + 1 < len(lines):
-                                        next_line = lines[i + 1]
-                                        if next_line in [
-                                            "vless",
-                                            "vmess",
-                                            "trojan",
-                                            "ss",
-                                            "ssr",
-                                            "hysteria",
-                                        ]:
-                                            node_type = next_line
-
-                                            # 查找服务器（通常是下一行）
-                                            if i + 2 < len(lines):
-                                                server_line = lines[i + 2]
-                                                if (
-                                                    "." in server_line
-                                                    or ":" in server_line
-                                                ):
-                                                    server = server_line
-
-                                                    # 查找端口（通常是下一行）
-                                                    if i + 3 < len(lines):
-                                                        port_line = lines[i + 3]
-                                                        if port_line.isdigit():
-                                                            port = port_line
-
-                                                            nodes.append(
-                                                                {
-                                                                    "name": node_name,
-                                                                    "type": node_type,
-                                                                    "server": server,
-                                                                    "port": port,
-                                                                }
-                                                            )
-
-                                                            self.logger.info(
-                                                                f"解析到节点: {node_name} {node_type} {server}:{port}"
-                                                            )
-                                                            i += 4  # 跳过已处理的行
-                                                            continue
-
-                                i += 1
-
-                            # 生成V2RAY格式配置
-                            if nodes:
-                                v2ray_configs = []
-                                for node in nodes:
-                                    if (
-                                        node.get("type")
-                                        and node.get("server")
-                                        and node.get("port")
-                                    ):
-                                        if node["type"] == "vless":
-                                            config = f"vless://{node['server']}:{node['port']}?type=tcp&security=none#{node.get('name', 'Unknown')}"
-                                        elif node["type"] == "vmess":
-                                            # vmess需要更多参数，这里简化
-                                            config = f"vmess://{node['server']}:{node['port']}#{node.get('name', 'Unknown')}"
-                                        elif node["type"] == "ss":
-                                            config = f"ss://{node['server']}:{node['port']}#{node.get('name', 'Unknown')}"
-                                        else:
-                                            config = f"{node['type']}://{node['server']}:{node['port']}#{node.get('name', 'Unknown')}"
-
-                                        v2ray_configs.append(config)
-
-                                if v2ray_configs:
-                                    v2ray_content = "\n".join(v2ray_configs)
-                                    self.logger.info(
-                                        f"从表格解析生成 {len(v2ray_configs)} 个节点配置"
-                                    )
-
-                except Exception as e:
-                    self.logger.error(f"提取内容时出错: {e}")
-
-                # 关闭浏览器
-                await browser.close()
+                            self.logger.info(f"从 {selector} 提取到空内容")
+                except:
+                    continue
 
-                if v2ray_content:
-                    # 确保结果目录存在
-                    self.result_dir.mkdir(exist_ok=True)
+            if not v2ray_content:
+                # 如果没找到特定区域，尝试从页面源码中提取节点配置
+                page_content = await page.content()
+                self.logger.info("从页面源码提取节点配置")
 
-                    # 保存到文件
-                    with open(self.result_file, "w", encoding="utf-8") as f:
-                        f.write(v2ray_content.strip())
+                # 查找可能的节点配置模式
+                # 提取各种类型的节点链接
+                all_links = get_node_scanner(
+                    ["vmess", "vless", "trojan", "ss", "ssr", "hysteria"], '"<'
+                ).scan(page_content)
 
+                if all_links:
+                    v2ray_content = "\n".join(all_links)
                     self.logger.info(
-                        f"成功保存 {len(v2ray_content.splitlines())} 个节点到 {self.result_file}"
+                        f"从源码提取到 {len(all_links)} 个节点链接"
                     )
-                    return True
                 else:
-                    self.logger.error("未获取到任何节点内容")
-                    return False
+                    # 如果还是没找到，尝试解析表格数据生成配置
+                    self.logger.info("尝试解析表格数据生成节点配置")
+
+                    # 从页面文本中提取节点信息
+                    page_text = await page.inner_text("body")
+
+                    # 解析节点表格 - 改进的解析逻辑
+                    # 从页面文本中提取节点信息
+                    lines = [
+                        line.strip()
+                        for line in page_text.split("\n")
+                        if line.strip()
+                    ]
+
+                    # 查找节点数据的模式
+                    # 典型的格式：🇺🇸_US_美国 vless v2.dabache.top 443 操作
+                    nodes = []
+                    i = 0
+                    while i < len(lines):
+                        line = lines[i]
+
+                        # 查找以国旗开头的行（节点名称）
+                        if (
+                            line.startswith("🇺🇸")
+                            or line.startswith("🇩🇪")
+                            or line.startswith("🇬🇧")
+                            or line.startswith("🇷🇺")
+                            or line.startswith("🇮🇹")
+                            or line.startswith("🇮🇶")
+                            or line.startswith("🇳🇱")
+                            or line.startswith("🇪🇸")
+                            or line.startswith("🇨🇦")
+                            or line.startswith("🇩🇰")
+                            or line.startswith("🇯🇵")
+                            or line.startswith("🇰🇷")
+                            or line.startswith("🇦🇺")
+                            or line.startswith("🇸🇬")
+                            or line.startswith("🇭🇰")
+                        ):
+                            # 这是一个节点名称，接下来应该有类型、服务器、端口
+                            node_name = line
+
+                            # 查找下一行
+                            if i + 1 < len(lines):
+                                next_line = lines[i + 1]
+                                if next_line in [
+                                    "vless",
+                                    "vmess",
+                                    "trojan",
+                                    "ss",
+                                    "ssr",
+                                    "hysteria",
+                                ]:
+                                    node_type = next_line
+
+                                    # 查找服务器（通常是下一行）
+                                    if i + 2 < len(lines):
+                                        server_line = lines[i + 2]
+                                        if (
+                                            "." in server_line
+                                            or ":" in server_line
+                                        ):
+                                            server = server_line
+
+                                            # 查找端口（通常是下一行）
+                                            if i + 3 < len(lines):
+                                                port_line = lines[i + 3]
+                                                if port_line.isdigit():
+                                                    port = port_line
+
+                                                    nodes.append(
+                                                        {
+                                                            "name": node_name,
+                                                            "type": node_type,
+                                                            "server": server,
+                                                            "port": port,
+                                                        }
+                                                    )
+
+                                                    self.logger.info(
+                                                        f"解析到节点: {node_name} {node_type} {server}:{port}"
+                                                    )
+                                                    i += 4  # 跳过已处理的行
+                                                    continue
+
+                        i += 1
+
+                    # 生成V2RAY格式配置
+                    if nodes:
+                        v2ray_configs = []
+                        for node in nodes:
+                            if (
+                                node.get("type")
+                                and node.get("server")
+                                and node.get("port")
+                            ):
+                                if node["type"] == "vless":
+                                    config = f"vless://{node['server']}:{node['port']}?type=tcp&security=none#{node.get('name', 'Unknown')}"
+                                elif node["type"] == "vmess":
+                                    # vmess需要更多参数，这里简化
+                                    config = f"vmess://{node['server']}:{node['port']}#{node.get('name', 'Unknown')}"
+                                elif node["type"] == "ss":
+                                    config = f"ss://{node['server']}:{node['port']}#{node.get('name', 'Unknown')}"
+                                else:
+                                    config = f"{node['type']}://{node['server']}:{node['port']}#{node.get('name', 'Unknown')}"
+
+                                v2ray_configs.append(config)
+
+                        if v2ray_configs:
+                            v2ray_content = "\n".join(v2ray_configs)
+                            self.logger.info(
+                                f"从表格解析生成 {len(v2ray_configs)} 个节点配置"
+                            )
 
         except Exception as e:
-            self.logger.error(f"收集过程出错: {e}")
-            import traceback
+            self.logger.error(f"提取内容时出错: {e}")
 
-            traceback.print_exc()
+        return v2ray_content
+
+
+    async def _save_screenshot(self, page, name: str) -> None:
+        """
+        保存页面截图（仅 DEBUG_ARTIFACTS=full 时截图，后台写入）
+
+        Args:
+            page: 页面
+            name: 截图名称
+        """
+        if not self.artifacts.enabled("screenshot"):
+            return
+        try:
+            self.artifacts.save("screenshot", f"v2rayse_{name}.png", await page.screenshot())
+        except Exception as e:
+            self.logger.warning(f"保存截图失败: {e}")
+
+    async def _wait_for_table(
+        self, page, timeout_ms: int, selector: str = 'table, button[role="checkbox"]'
+    ) -> bool:
+        """
+        等待节点表格出现
+
+        Args:
+            page: 页面
+            timeout_ms: 最长等待时间（毫秒）
+            selector: 表格就绪选择器
+
+        Returns:
+            表格是否已出现（超时返回False，继续后续流程）
+        """
+        try:
+            await page.wait_for_selector(selector, state="attached", timeout=timeout_ms)
+            return True
+        except Exception as e:
+            self.logger.debug(f"等待节点表格超时: {e}")
             return False
 
 
@@ -483,6 +677,7 @@ async def main():
     """主函数"""
     collector = V2RaySECollector()
     success = await collector.collect_nodes()
+    collector.artifacts.flush()
 
     if success:
         print("✅ V2RaySE节点收集完成")
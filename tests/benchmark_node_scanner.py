@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基准测试：节点URI扫描
+比较按协议逐个 re.findall（旧实现）与单次扫描（NodeScanner）在多MB订阅内容上的吞吐量
+
+运行方式：python tests/benchmark_node_scanner.py [MB数]
+"""
+
+import base64
+import json
+import random
+import re
+import sys
+import os
+import time
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.config.websites import NODE_PATTERNS, NODE_SCHEMES
+from src.utils.node_scanner import get_node_scanner
+
+
+def build_payload(size_mb: float) -> str:
+    """生成包含各协议节点和普通文本的订阅内容"""
+    rng = random.Random(42)
+    vmess = "vmess://" + base64.b64encode(
+        json.dumps({"v": "2", "add": "example.com", "port": "443", "id": "a" * 36}).encode()
+    ).decode()
+    samples = [
+        vmess,
+        "vless://12345678-1234-1234-1234-123456789abc@example.com:443?security=reality&sni=example.com#VLESS",
+        "trojan://password@example.org:443?sni=example.org#Trojan",
+        "hysteria2://password@example.net:443?sni=example.net#HY2",
+        "ss://Y2lwaGVyOnRlc3RAZXhhbXBsZS5jb206ODM4OA==#SS",
+        "ssr://ZXhhbXBsZS5jb206ODM4ODpvcmlnaW46YWVzLTI1Ni1jZmI6cGxhaW46cGFzcw",
+        "# 免费节点分享，每日更新 https://example.com/free-nodes/2026/01/",
+    ]
+    lines = []
+    size = 0
+    target = int(size_mb * 1024 * 1024)
+    while size < target:
+        line = rng.choice(samples)
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def legacy_scan(text: str):
+    """旧实现：每个协议一次不区分大小写的 findall"""
+    nodes = []
+    for pattern in NODE_PATTERNS:
+        nodes.extend(match.strip() for match in re.findall(pattern, text, re.IGNORECASE))
+    return nodes
+
+
+def bench(name, fn, text, rounds):
+    best = float("inf")
+    result = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn(text)
+        best = min(best, time.perf_counter() - start)
+    mb = len(text) / (1024 * 1024)
+    print(f"{name:<12} {best * 1000:8.1f} ms  {mb / best:8.1f} MB/s  {len(result):>8} 个节点")
+    return result
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 8
+    text = build_payload(size_mb)
+    scanner = get_node_scanner(NODE_SCHEMES)
+
+    print(f"订阅内容: {len(text) / (1024 * 1024):.1f} MB")
+    legacy = bench("逐协议扫描", legacy_scan, text, rounds=3)
+    single = bench("单次扫描", scanner.scan, text, rounds=3)
+    # 旧实现会把每个 vmess:// 节点再匹配出一个 ss:// 片段
+    print(f"旧实现多出的重复匹配: {len(legacy) - len(single)}")
+
+
+if __name__ == "__main__":
+    main()
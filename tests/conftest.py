@@ -8,11 +8,31 @@ Pytest配置文件
 import pytest
 import sys
 import os
+import tempfile
 
 # 添加项目根目录到Python路径
 PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..")
 sys.path.insert(0, PROJECT_ROOT)
 
+# 日志写入临时目录，测试不在仓库的 data/logs 中留下文件
+# （必须在导入 src.utils.logger 之前修改，它在导入时就创建文件处理器）
+from src.config import settings  # noqa: E402
+
+settings.LOGS_DIR = tempfile.mkdtemp(prefix="v2raynode-test-logs-")
+settings.LOG_FILE = os.path.join(settings.LOGS_DIR, os.path.basename(settings.LOG_FILE))
+
+
+@pytest.fixture(autouse=True)
+def no_politeness_wait(monkeypatch):
+    """测试中不做按主机限速等待（模拟请求都指向同一个 example.com）"""
+    from src.core import politeness
+
+    monkeypatch.setattr(
+        politeness,
+        "_scheduler",
+        politeness.PolitenessScheduler({"rate": 0, "burst": 1, "min_interval": 0}),
+    )
+
 
 @pytest.fixture(scope="session")
 def project_root_dir():
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：handlers.async_request_handler
+测试异步请求处理器的请求、重试和会话管理
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from aiohttp import web
+
+from src.core.exceptions import NetworkError
+from src.core.handlers.async_request_handler import AsyncRequestHandler
+from src.core.http_client import HttpClientRegistry
+
+
+async def _with_server(routes, body):
+    """启动本地测试服务器并执行 body(base_url)"""
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        return await body(f"http://127.0.0.1:{port}")
+    finally:
+        await runner.cleanup()
+
+
+class TestAsyncRequestHandler:
+    """异步请求处理器测试"""
+
+    @pytest.fixture
+    def handler(self):
+        """创建异步请求处理器实例"""
+        return AsyncRequestHandler(
+            HttpClientRegistry(), timeout=5, retry_count=2, logger=Mock(),
+            headers={"User-Agent": "test-agent"},
+        )
+
+    def test_fetch_text_sends_headers(self, handler):
+        """测试获取文本并携带默认请求头"""
+
+        async def index(request):
+            return web.Response(text=request.headers.get("User-Agent", ""))
+
+        async def body(base_url):
+            try:
+                return await handler.fetch_text(f"{base_url}/")
+            finally:
+                await handler.close()
+
+        assert asyncio.run(_with_server([web.get("/", index)], body)) == "test-agent"
+
+    def test_retries_on_server_error(self, handler):
+        """测试服务器错误时重试"""
+        hits = {"count": 0}
+
+        async def flaky(request):
+            hits["count"] += 1
+            if hits["count"] == 1:
+                return web.Response(status=503)
+            return web.Response(text="ok")
+
+        async def body(base_url):
+            try:
+                return await handler.fetch_text(f"{base_url}/flaky")
+            finally:
+                await handler.close()
+
+        assert asyncio.run(_with_server([web.get("/flaky", flaky)], body)) == "ok"
+        assert hits["count"] == 2
+
+    def test_session_recreated_after_close(self, handler):
+        """测试会话关闭后在新事件循环中重新创建"""
+
+        async def open_session():
+            session = handler._get_session()
+            await handler.close()
+            return session
+
+        first = asyncio.run(open_session())
+        second = asyncio.run(open_session())
+
+        assert first is not second
+
+    def test_proxy_failure_only_affects_current_request(self, handler):
+        """测试代理失败后本次请求改为直连，但不修改处理器的代理设置"""
+        handler.proxy = "http://127.0.0.1:1"
+
+        async def index(request):
+            return web.Response(text="direct")
+
+        async def body(base_url):
+            try:
+                return await handler.fetch_text(f"{base_url}/")
+            finally:
+                await handler.close()
+
+        assert asyncio.run(_with_server([web.get("/", index)], body)) == "direct"
+        assert handler.proxy == "http://127.0.0.1:1"
+
+    def test_no_attempts_raises_network_error(self, handler):
+        """测试没有可用的请求次数时抛出 NetworkError 而不是 raise None"""
+        handler.retry_count = -1
+
+        with pytest.raises(NetworkError):
+            asyncio.run(handler.fetch_text("http://127.0.0.1:1/"))
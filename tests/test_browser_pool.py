@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：browser_pool
+使用模拟浏览器测试共享浏览器池的复用、隔离和并发上限
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.browser_pool import LOAD_PROFILES, BrowserPool
+from src.core.browser_state import BrowserStateStore
+
+
+class FakeTimeoutError(Exception):
+    """模拟 Playwright 超时异常"""
+
+
+class FakeRequest:
+    """模拟网络请求"""
+
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    """模拟路由"""
+
+    def __init__(self, request, outcomes):
+        self.request = request
+        self.outcomes = outcomes
+
+    async def abort(self):
+        self.outcomes.append(("abort", self.request.url))
+
+    async def continue_(self):
+        self.outcomes.append(("continue", self.request.url))
+
+
+class FakePage:
+    """模拟页面"""
+
+    # 页面加载时发出的子资源请求
+    SUBRESOURCES = [
+        ("https://a.example.com/style.css", "stylesheet"),
+        ("https://a.example.com/app.js", "script"),
+        ("https://a.example.com/logo.png", "image"),
+        ("https://a.example.com/font.woff2", "font"),
+        ("https://www.googletagmanager.com/gtag/js", "script"),
+    ]
+
+    def __init__(self, browser, context):
+        self.browser = browser
+        self.context = context
+        self.url = None
+        self.waits = []
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.url = url
+        if self.context.route_handler is not None:
+            for request_url, resource_type in self.SUBRESOURCES:
+                route = FakeRoute(FakeRequest(request_url, resource_type), self.context.outcomes)
+                await self.context.route_handler(route)
+        with self.browser.lock:
+            self.browser.active += 1
+            self.browser.peak = max(self.browser.peak, self.browser.active)
+        await asyncio.sleep(0.1)
+        with self.browser.lock:
+            self.browser.active -= 1
+
+    async def wait_for_timeout(self, ms):
+        self.waits.append(("timeout", ms))
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        self.waits.append(("selector", selector))
+        if "missing" in selector:
+            raise FakeTimeoutError(f"Timeout {timeout}ms exceeded")
+
+    async def content(self):
+        # 使用过期的Cookie访问时仍停留在验证页面
+        if self.context.options.get("storage_state", {}).get("stale"):
+            return "<html><title>Just a moment...</title></html>"
+        return f"<html>{self.url}</html>"
+
+
+class FakeContext:
+    """模拟浏览器上下文"""
+
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+        self.route_handler = None
+        self.outcomes = []
+        self.pages = []
+
+    async def storage_state(self):
+        return {"cookies": [{"name": "cf_clearance", "value": "ok"}], "origins": []}
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def new_page(self):
+        page = FakePage(self.browser, self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    """模拟浏览器"""
+
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class TestBrowserPool:
+    """浏览器池测试"""
+
+    @pytest.fixture
+    def browsers(self):
+        """记录创建的模拟浏览器"""
+        return []
+
+    @pytest.fixture
+    def pool(self, browsers):
+        """创建使用模拟浏览器的浏览器池"""
+
+        async def factory():
+            browser = FakeBrowser()
+            browsers.append(browser)
+            return browser
+
+        pool = BrowserPool(max_pages=2, browser_factory=factory)
+        yield pool
+        pool.close()
+
+    def test_single_browser_isolated_contexts(self, pool, browsers):
+        """测试多个网站共用一个浏览器，每次加载使用独立上下文"""
+        first = pool.fetch_content("https://a.example.com/", settle_ms=0)
+        second = pool.fetch_content("https://b.example.com/", settle_ms=0)
+
+        assert first == "<html>https://a.example.com/</html>"
+        assert second == "<html>https://b.example.com/</html>"
+        assert len(browsers) == 1
+        assert len(browsers[0].contexts) == 2
+        assert all(context.closed for context in browsers[0].contexts)
+
+    def test_concurrent_loads_respect_limit(self, pool, browsers):
+        """测试多线程并发加载页面且不超过页面上限"""
+        urls = [f"https://site{i}.example.com/" for i in range(6)]
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(lambda url: pool.fetch_content(url, settle_ms=0), urls))
+
+        assert results == [f"<html>{url}</html>" for url in urls]
+        assert len(browsers) == 1
+        assert browsers[0].peak == 2
+
+    def test_relaunch_after_disconnect(self, pool, browsers):
+        """测试浏览器断开后自动重新启动"""
+        pool.fetch_content("https://a.example.com/", settle_ms=0)
+        browsers[0].connected = False
+        pool.fetch_content("https://a.example.com/", settle_ms=0)
+
+        assert len(browsers) == 2
+        assert pool.launch_count == 2
+
+    def test_close_and_restart(self, pool, browsers):
+        """测试关闭后再次使用会重新启动"""
+        pool.fetch_content("https://a.example.com/", settle_ms=0)
+        pool.close()
+        assert browsers[0].connected is False
+
+        pool.fetch_content("https://b.example.com/", settle_ms=0)
+        assert len(browsers) == 2
+
+    def test_lean_profile_blocks_non_essential_requests(self, pool, browsers):
+        """测试精简方案中止图片、字体和统计脚本，保留样式和页面脚本"""
+        pool.fetch_content("https://a.example.com/", settle_ms=0, profile=LOAD_PROFILES["lean"])
+
+        context = browsers[0].contexts[0]
+        assert context.options["viewport"] == LOAD_PROFILES["lean"].viewport
+        assert dict((url, outcome) for outcome, url in context.outcomes) == {
+            "https://a.example.com/style.css": "continue",
+            "https://a.example.com/app.js": "continue",
+            "https://a.example.com/logo.png": "abort",
+            "https://a.example.com/font.woff2": "abort",
+            "https://www.googletagmanager.com/gtag/js": "abort",
+        }
+        assert pool.blocked_count == 3
+
+    def test_full_profile_loads_everything(self, pool, browsers):
+        """测试完整方案不拦截请求并使用固定等待"""
+        pool.fetch_content(
+            "https://a.example.com/",
+            settle_ms=3000,
+            ready_selectors=["article"],
+            profile=LOAD_PROFILES["full"],
+        )
+
+        context = browsers[0].contexts[0]
+        assert context.route_handler is None
+        assert context.options["viewport"] == {"width": 1920, "height": 1080}
+        assert context.pages[0].waits == [("timeout", 3000)]
+
+    def test_ready_selector_replaces_fixed_wait(self, pool, browsers):
+        """测试就绪选择器出现后直接读取，不再固定等待"""
+        pool.fetch_content(
+            "https://a.example.com/",
+            settle_ms=5000,
+            ready_selectors=["article", ".entry-content"],
+            profile=LOAD_PROFILES["lean"],
+        )
+
+        page = browsers[0].contexts[0].pages[0]
+        assert page.waits == [("selector", "article, .entry-content")]
+
+    def test_ready_selector_timeout_returns_current_content(self, pool, browsers):
+        """测试就绪元素等待超时后仍返回当前页面内容"""
+        content = pool.fetch_content(
+            "https://a.example.com/",
+            settle_ms=5000,
+            ready_selectors=[".missing"],
+            profile=LOAD_PROFILES["lean"],
+        )
+
+        assert content == "<html>https://a.example.com/</html>"
+        assert browsers[0].contexts[0].pages[0].waits == [("selector", ".missing")]
+
+
+class TestBrowserStateReuse:
+    """浏览器存储状态复用测试"""
+
+    @pytest.fixture
+    def browsers(self):
+        return []
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return BrowserStateStore(tmp_path / "browser_state", ttl=3600)
+
+    @pytest.fixture
+    def pool(self, browsers, store):
+        async def factory():
+            browser = FakeBrowser()
+            browsers.append(browser)
+            return browser
+
+        pool = BrowserPool(max_pages=2, browser_factory=factory, state_store=store)
+        yield pool
+        pool.close()
+
+    def test_state_saved_and_reused(self, pool, browsers, store):
+        """测试加载成功后保存状态，下次访问同一网站时复用"""
+        pool.fetch_content("https://la.example.com/", settle_ms=0, state_key="la")
+        assert "storage_state" not in browsers[0].contexts[0].options
+        assert store.load("la")["cookies"][0]["name"] == "cf_clearance"
+
+        pool.fetch_content("https://la.example.com/", settle_ms=0, state_key="la")
+        assert browsers[0].contexts[-1].options["storage_state"]["cookies"][0]["value"] == "ok"
+
+    def test_stale_state_falls_back_to_clean_context(self, pool, browsers, store):
+        """测试保存的状态不能通过验证时删除状态并使用全新上下文"""
+        store.save("la", {"stale": True, "cookies": []})
+
+        content = pool.fetch_content("https://la.example.com/", settle_ms=0, state_key="la")
+
+        assert content == "<html>https://la.example.com/</html>"
+        contexts = browsers[0].contexts
+        assert len(contexts) == 2
+        assert contexts[0].options["storage_state"]["stale"] is True
+        assert "storage_state" not in contexts[1].options
+        assert store.get_stats()["invalidated"] == 1
+        # 全新上下文通过后保存新的状态
+        assert "stale" not in store.load("la")
+
+    def test_no_state_key_keeps_clean_context(self, pool, browsers, store):
+        """测试未指定网站键时不读取也不保存状态"""
+        pool.fetch_content("https://a.example.com/", settle_ms=0)
+
+        assert "storage_state" not in browsers[0].contexts[0].options
+        assert store.get_stats()["saved"] == 0
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：browser_state
+测试浏览器存储状态的保存、过期和失效
+"""
+
+import json
+import pytest
+import sys
+import os
+import time
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.browser_state import BrowserStateStore, is_challenge_page, state_key_for
+
+STATE = {"cookies": [{"name": "cf_clearance", "value": "token", "domain": ".example.com"}], "origins": []}
+
+
+class TestBrowserStateStore:
+    """浏览器存储状态缓存测试"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return BrowserStateStore(tmp_path / "browser_state", ttl=3600)
+
+    def test_save_and_load(self, store):
+        """测试保存后可以读取"""
+        assert store.load("la") is None
+
+        store.save("la", STATE)
+
+        assert store.load("la") == STATE
+        assert store.get_stats()["saved"] == 1
+        assert store.get_stats()["reused"] == 1
+
+    def test_expired_state_removed(self, store):
+        """测试过期状态不再使用并被删除"""
+        store.save("la", STATE)
+        path = store._path("la")
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        saved["saved_at"] = time.time() - 7200
+        path.write_text(json.dumps(saved), encoding="utf-8")
+
+        assert store.load("la") is None
+        assert not path.exists()
+        assert store.get_stats()["expired"] == 1
+
+    def test_invalidate(self, store):
+        """测试失效后删除状态"""
+        store.save("xinye", STATE)
+        store.invalidate("xinye")
+
+        assert store.load("xinye") is None
+
+    def test_key_sanitized(self, store):
+        """测试网站键中的特殊字符不会跳出状态目录"""
+        store.save("../evil site", STATE)
+
+        assert store._path("../evil site").parent == store.state_dir
+        assert store.load("../evil site") == STATE
+
+    def test_corrupted_file_ignored(self, store):
+        """测试损坏的状态文件被忽略"""
+        store.state_dir.mkdir(parents=True)
+        store._path("la").write_text("{not json", encoding="utf-8")
+
+        assert store.load("la") is None
+
+
+class TestHelpers:
+    """辅助函数测试"""
+
+    def test_is_challenge_page(self):
+        """测试识别 Cloudflare 验证页面"""
+        assert is_challenge_page("<html><head><title>Just a moment...</title></head></html>")
+        assert is_challenge_page('<script src="/cdn-cgi/challenge-platform/h/b/orchestrate"></script>')
+        assert not is_challenge_page("<html><article>节点分享</article></html>")
+
+    def test_state_key_for(self):
+        """测试网站键优先使用收集器关键字"""
+        assert state_key_for({"name": "La", "collector_key": "la"}) == "la"
+        assert state_key_for({"name": "Xinye"}) == "Xinye"
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：clash_yaml
+测试只截取 proxies 段解析 Clash 配置
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import yaml
+
+from src.utils import clash_yaml
+from src.utils.clash_yaml import extract_proxies_section, load_clash_proxies
+
+CONFIG = """port: 7890
+mode: rule
+proxies:
+- {name: a, type: ss, server: a.example.com, port: 443}
+# 注释
+- name: b
+  type: trojan
+  server: b.example.com
+  port: 443
+proxy-groups:
+  - name: auto
+    type: select
+    proxies: [a, b]
+rules:
+  - MATCH,DIRECT
+"""
+
+
+class TestClashYaml:
+    """Clash 代理列表读取测试"""
+
+    def test_extract_section_stops_at_next_top_level_key(self):
+        """测试截取的片段不包含 proxy-groups 和 rules"""
+        section = extract_proxies_section(CONFIG)
+
+        assert section.startswith("proxies:")
+        assert "b.example.com" in section
+        assert "proxy-groups" not in section and "MATCH" not in section
+
+    def test_load_parses_only_proxies_section(self):
+        """测试只把 proxies 段交给YAML解析"""
+        with patch.object(clash_yaml.yaml, "load", wraps=yaml.load) as load:
+            proxies = load_clash_proxies(CONFIG)
+
+        assert [proxy["name"] for proxy in proxies] == ["a", "b"]
+        assert load.call_count == 1
+        assert "rules" not in load.call_args[0][0]
+
+    def test_rules_are_not_parsed(self):
+        """测试 rules 中的非法内容不影响读取代理"""
+        broken = CONFIG + "  - [unclosed\n"
+
+        assert len(load_clash_proxies(broken)) == 2
+
+    def test_falls_back_to_full_document(self):
+        """测试片段引用前面的锚点时解析整个文档"""
+        content = (
+            "base: &base {type: ss, port: 443}\n"
+            "proxies:\n"
+            "  - {<<: *base, name: a, server: a.example.com}\n"
+        )
+
+        proxies = load_clash_proxies(content)
+
+        assert proxies == [{"type": "ss", "port": 443, "name": "a", "server": "a.example.com"}]
+
+    def test_plain_list_and_legacy_key(self):
+        """测试纯代理列表和旧版 Proxy 键"""
+        assert load_clash_proxies("- {name: a, type: ss}\n") == [{"name": "a", "type": "ss"}]
+        assert load_clash_proxies("Proxy:\n  - {name: a}\n") == [{"name": "a"}]
+
+    def test_not_clash_config(self):
+        """测试不是 Clash 配置的YAML"""
+        assert load_clash_proxies("port: 7890\nmode: rule\n") is None
+        assert load_clash_proxies("just text") is None
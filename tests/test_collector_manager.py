@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：collector_manager
+测试收集器管理器的链接收集和订阅解析流程
+"""
+
+import pytest
+import sys
+import os
+import time
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.collector_manager import CollectorManager
+
+
+class Rendezvous:
+    """
+    同步/异步通用的集合点：所有参与者都到达后才放行，
+    超时说明它们没有同时运行（用于断言并发，而不是比较耗时）
+    """
+
+    def __init__(self, parties, timeout=5.0):
+        self.parties = parties
+        self.timeout = timeout
+        self.arrived = 0
+        self.cond = threading.Condition()
+
+    def _arrive(self):
+        with self.cond:
+            self.arrived += 1
+            self.cond.notify_all()
+
+    def wait(self):
+        """在线程中等待"""
+        self._arrive()
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.arrived >= self.parties, self.timeout):
+                raise RuntimeError("其他收集器没有同时运行")
+
+    async def wait_async(self):
+        """在事件循环中等待（不阻塞其他协程）"""
+        self._arrive()
+        deadline = time.monotonic() + self.timeout
+        while self.arrived < self.parties:
+            if time.monotonic() > deadline:
+                raise RuntimeError("其他收集器没有同时运行")
+            await asyncio.sleep(0.01)
+
+
+class FakeCollector:
+    """模拟收集器"""
+
+    def __init__(self, site_name, links=None, delay=0.0, fail_times=0, rendezvous=None):
+        self.site_name = site_name
+        self.links = links or []
+        self.delay = delay
+        self.fail_times = fail_times
+        self.rendezvous = rendezvous
+        self.calls = 0
+        self.threads = set()
+
+    def collect_links(self):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        if self.rendezvous:
+            self.rendezvous.wait()
+        time.sleep(self.delay)
+        if self.calls <= self.fail_times:
+            raise RuntimeError("模拟失败")
+        return {
+            "article_url": f"https://{self.site_name}.example.com/post",
+            "subscription_links": list(self.links),
+            "raw_data": "",
+        }
+
+
+class TestCollectAllLinks:
+    """阶段1链接收集测试"""
+
+    @pytest.fixture
+    def manager(self):
+        """创建收集器管理器实例"""
+        manager = CollectorManager()
+        manager.collectors = {
+            "a": FakeCollector("a", ["https://a.example.com/sub.txt"], delay=0.3),
+            "b": FakeCollector("b", [], delay=0.3),
+            "c": FakeCollector("c", ["https://c.example.com/sub.txt"], delay=0.3),
+        }
+        return manager
+
+    def test_concurrent_keeps_result_shape_and_order(self, manager):
+        """测试并发模式保持结果结构和顺序"""
+        serial = manager.collect_all_links(concurrent=False)
+        for collector in manager.collectors.values():
+            collector.calls = 0
+        concurrent = manager.collect_all_links(concurrent=True)
+
+        assert list(concurrent.keys()) == ["a", "b", "c"]
+        assert concurrent == serial
+        assert concurrent["a"]["subscription_links"] == ["https://a.example.com/sub.txt"]
+        assert concurrent["b"]["success"] is True
+
+    def test_concurrent_runs_sites_in_parallel(self, manager):
+        """测试并发模式下网站并行执行（三个网站必须同时到达集合点）"""
+        rendezvous = Rendezvous(3)
+        for collector in manager.collectors.values():
+            collector.rendezvous = rendezvous
+
+        results = manager.collect_all_links(concurrent=True)
+
+        assert all(result["success"] for result in results.values())
+        assert [c.calls for c in manager.collectors.values()] == [1, 1, 1]
+
+    def test_retry_is_per_site(self, manager):
+        """测试重试只作用于失败的网站"""
+        manager.collectors["b"] = FakeCollector("b", ["https://b.example.com/sub.txt"], fail_times=1)
+
+        with patch("src.core.collector_manager.time.sleep") as mock_sleep:
+            results = manager.collect_all_links(concurrent=True)
+
+        assert results["b"]["success"] is True
+        assert manager.collectors["b"].calls == 2
+        assert manager.collectors["a"].calls == 1
+        # time.sleep 被全局替换，模拟收集器的延迟也会计入调用
+        retry_sleeps = [c for c in mock_sleep.call_args_list if c.args == (2,)]
+        assert len(retry_sleeps) == 1
+
+    def test_final_failure_recorded(self, manager):
+        """测试重试耗尽后记录失败"""
+        manager.collectors["c"] = FakeCollector("c", fail_times=5)
+
+        with patch("src.core.collector_manager.time.sleep"):
+            results = manager.collect_all_links(concurrent=True)
+
+        assert results["c"]["success"] is False
+        assert "模拟失败" in results["c"]["error"]
+        assert manager.collectors["c"].calls == 3
+
+
+class TestParseAllSubscriptions:
+    """阶段2订阅解析测试"""
+
+    @pytest.fixture
+    def manager(self):
+        """创建收集器管理器实例"""
+        return CollectorManager()
+
+    @pytest.fixture
+    def links_results(self):
+        """阶段1链接收集结果"""
+        return {
+            "a": {
+                "name": "A",
+                "success": True,
+                "subscription_links": [
+                    "https://slow.example.com/a1.txt",
+                    "https://fast.example.com/a2.txt",
+                ],
+            },
+            "b": {
+                "name": "B",
+                "success": True,
+                "subscription_links": ["https://fast.example.com/b1.txt"],
+            },
+        }
+
+    def test_parallel_merge_keeps_link_order(self, manager, links_results):
+        """测试并行解析后按链接顺序合并"""
+        nodes_by_url = {
+            "https://slow.example.com/a1.txt": ["trojan://p@1.1.1.1:443#a1"],
+            "https://fast.example.com/a2.txt": ["trojan://p@2.2.2.2:443#a2"],
+            "https://fast.example.com/b1.txt": ["trojan://p@3.3.3.3:443#b1"],
+        }
+
+        def fake_parse(url):
+            if "slow" in url:
+                time.sleep(0.2)
+            return nodes_by_url[url]
+
+        with patch.object(manager, "_parse_single_subscription_with_retry", side_effect=fake_parse):
+            results = manager.parse_all_subscriptions(links_results)
+
+        assert results["a"]["nodes"] == [
+            "trojan://p@1.1.1.1:443#a1",
+            "trojan://p@2.2.2.2:443#a2",
+        ]
+        assert results["b"]["nodes"] == ["trojan://p@3.3.3.3:443#b1"]
+        assert results["a"]["node_sources"] == {
+            "trojan://p@1.1.1.1:443#a1": "https://slow.example.com/a1.txt",
+            "trojan://p@2.2.2.2:443#a2": "https://fast.example.com/a2.txt",
+        }
+
+    def test_per_host_limit(self, manager):
+        """测试单主机并发上限"""
+        manager.config_manager.base.SUBSCRIPTION_PER_HOST_LIMIT = 1
+        links = [
+            {"site_key": "a", "site_name": "A", "link": f"https://same.example.com/{i}.txt"}
+            for i in range(4)
+        ]
+        active = {"current": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def fake_parse(url):
+            with lock:
+                active["current"] += 1
+                active["peak"] = max(active["peak"], active["current"])
+            time.sleep(0.05)
+            with lock:
+                active["current"] -= 1
+            return []
+
+        try:
+            with patch.object(manager, "_parse_single_subscription_with_retry", side_effect=fake_parse):
+                outcomes = manager._parse_subscription_links(links)
+        finally:
+            manager.config_manager.base.SUBSCRIPTION_PER_HOST_LIMIT = 2
+
+        assert active["peak"] == 1
+        assert outcomes == [([], None)] * 4
+
+    def test_failure_is_isolated(self, manager, links_results):
+        """测试单个链接失败不影响其他链接"""
+
+        def fake_parse(url):
+            if "a1" in url:
+                raise RuntimeError("boom")
+            return ["trojan://p@9.9.9.9:443#ok"]
+
+        with patch.object(manager, "_parse_single_subscription_with_retry", side_effect=fake_parse):
+            results = manager.parse_all_subscriptions(links_results)
+
+        assert results["a"]["nodes"] == ["trojan://p@9.9.9.9:443#ok"]
+        assert results["b"]["success"] is True
+
+
+class TestPipeline:
+    """阶段1/阶段2流水线测试"""
+
+    def test_pipeline_matches_two_phase_and_overlaps(self):
+        """测试流水线结果与两阶段一致，且快速网站的订阅在慢速网站完成前开始解析"""
+        fast_parse_started = threading.Event()
+        overlapped = []
+
+        class SlowCollector(FakeCollector):
+            def collect_links(self):
+                # 慢速网站在快速网站的订阅开始解析之后才返回
+                overlapped.append(fast_parse_started.wait(timeout=5))
+                return super().collect_links()
+
+        manager = CollectorManager()
+        manager.collectors = {
+            "slow": SlowCollector("slow", ["https://slow.example.com/s.txt"]),
+            "fast": FakeCollector("fast", ["https://fast.example.com/f.txt"]),
+        }
+
+        def fake_parse(url):
+            if "fast" in url:
+                fast_parse_started.set()
+            host = url.split("/")[2].split(".")[0]
+            return [f"trojan://p@{host}.example.com:443#{host}"]
+
+        with patch.object(manager, "_parse_single_subscription_with_retry", side_effect=fake_parse):
+            pipelined = manager.collect_and_parse_pipelined()
+            two_phase = manager.parse_all_subscriptions(manager.collect_all_links(concurrent=False))
+
+        assert pipelined == two_phase
+        assert list(pipelined.keys()) == ["slow", "fast"]
+        assert overlapped[0] is True
+
+
+class FakeAsyncCollector(FakeCollector):
+    """模拟异步收集器"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loops = set()
+
+    async def collect_links(self):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        self.loops.add(id(asyncio.get_running_loop()))
+        if self.rendezvous:
+            await self.rendezvous.wait_async()
+        await asyncio.sleep(self.delay)
+        if self.calls <= self.fail_times:
+            raise RuntimeError("模拟失败")
+        return {
+            "article_url": f"https://{self.site_name}.example.com/post",
+            "subscription_links": list(self.links),
+            "raw_data": "",
+        }
+
+
+class TestMixedCollectors:
+    """异步与同步收集器混合调度测试"""
+
+    @pytest.fixture
+    def manager(self):
+        """创建混合收集器管理器实例"""
+        manager = CollectorManager()
+        manager.collectors = {
+            "sync": FakeCollector("sync", ["https://sync.example.com/s.txt"], delay=0.3),
+            "async1": FakeAsyncCollector("async1", ["https://a1.example.com/s.txt"], delay=0.3),
+            "async2": FakeAsyncCollector("async2", [], delay=0.3),
+        }
+        return manager
+
+    def test_mixed_run_on_one_loop(self, manager):
+        """测试异步收集器在事件循环线程运行，同步收集器在线程池运行，三者同时进行"""
+        rendezvous = Rendezvous(3)
+        for collector in manager.collectors.values():
+            collector.rendezvous = rendezvous
+
+        results = manager.collect_all_links(concurrent=True)
+
+        assert list(results.keys()) == ["sync", "async1", "async2"]
+        assert results["async1"]["subscription_links"] == ["https://a1.example.com/s.txt"]
+        assert all(result["success"] for result in results.values())
+        assert [c.calls for c in manager.collectors.values()] == [1, 1, 1]
+        main_thread = threading.current_thread().name
+        assert manager.collectors["async1"].threads == {main_thread}
+        assert manager.collectors["sync"].threads != {main_thread}
+
+    def test_pipeline_runs_async_collectors_on_one_loop(self, manager):
+        """测试流水线模式下所有异步收集器共用一个事件循环，同步收集器在线程池运行"""
+        with patch.object(
+            manager, "_parse_single_subscription_with_retry",
+            side_effect=lambda url: [f"trojan://p@{url.split('/')[2]}:443#Node01"],
+        ):
+            results = manager.collect_and_parse_pipelined()
+
+        assert list(results.keys()) == ["sync", "async1", "async2"]
+        assert results["async1"]["subscription_links"] == ["https://a1.example.com/s.txt"]
+        assert results["sync"]["nodes"] == ["trojan://p@sync.example.com:443#Node01"]
+        async_loops = manager.collectors["async1"].loops | manager.collectors["async2"].loops
+        assert len(async_loops) == 1
+        main_thread = threading.current_thread().name
+        assert manager.collectors["async1"].threads == {main_thread}
+        assert manager.collectors["sync"].threads != {main_thread}
+
+    def test_serial_path_runs_async_collector(self, manager):
+        """测试串行模式也能运行异步收集器"""
+        results = manager.collect_all_links(concurrent=False)
+
+        assert results["async1"]["success"] is True
+        assert manager.collectors["async1"].calls == 1
+
+    def test_async_retry_and_failure(self, manager):
+        """测试异步收集器的重试和最终失败"""
+        manager.collectors["async1"] = FakeAsyncCollector("async1", ["https://a1.example.com/s.txt"], fail_times=1)
+        manager.collectors["async2"] = FakeAsyncCollector("async2", fail_times=5)
+
+        async def no_sleep(_):
+            return None
+
+        with patch("src.core.collector_manager.asyncio.sleep", side_effect=no_sleep):
+            results = manager.collect_all_links(concurrent=True)
+
+        assert results["async1"]["success"] is True
+        assert manager.collectors["async1"].calls == 2
+        assert results["async2"]["success"] is False
+        assert manager.collectors["async2"].calls == 3
+
+
+class TestCrossSiteDedup:
+    """跨网站订阅链接去重测试"""
+
+    def test_shared_link_parsed_once_and_attributed(self):
+        """测试相同订阅链接只解析一次，结果归属每个引用的网站"""
+        manager = CollectorManager()
+        links_results = {
+            "a": {
+                "name": "A",
+                "success": True,
+                "subscription_links": ["https://Shared.example.com/sub.txt?utm_source=a"],
+            },
+            "b": {
+                "name": "B",
+                "success": True,
+                "subscription_links": ["https://shared.example.com/sub.txt#top"],
+            },
+        }
+        calls = []
+
+        def fake_parse(url):
+            calls.append(url)
+            return ["trojan://p@1.1.1.1:443#shared"]
+
+        with patch.object(manager, "_parse_single_subscription_with_retry", side_effect=fake_parse):
+            results = manager.parse_all_subscriptions(links_results)
+
+        assert len(calls) == 1
+        assert results["a"]["nodes"] == ["trojan://p@1.1.1.1:443#shared"]
+        assert results["b"]["nodes"] == ["trojan://p@1.1.1.1:443#shared"]
+
+    def test_pipeline_coalesces_concurrent_fetches(self):
+        """测试流水线中并发的相同链接共享一次进行中的请求"""
+        manager = CollectorManager()
+        manager.collectors = {
+            "a": FakeCollector("a", ["https://shared.example.com/sub.txt"]),
+            "b": FakeCollector("b", ["https://shared.example.com/sub.txt?utm_medium=x"]),
+        }
+        calls = []
+
+        def fake_parse(url):
+            calls.append(url)
+            time.sleep(0.2)
+            return ["ss://shared@2.2.2.2:8388#s"]
+
+        with patch.object(manager, "_parse_single_subscription_with_retry", side_effect=fake_parse):
+            results = manager.collect_and_parse_pipelined()
+
+        assert len(calls) == 1
+        assert results["a"]["nodes"] == results["b"]["nodes"] == ["ss://shared@2.2.2.2:8388#s"]
+
+
+class TestNodeDedup:
+    """基于节点指纹的去重测试"""
+
+    def test_dedup_keeps_encoded_nodes(self):
+        """测试 vmess 等编码节点按解码后的内容去重，无法解析的节点保留并按原始字符串去重"""
+        import base64
+        import json
+
+        def vmess(name):
+            config = {"v": "2", "ps": name, "add": "v.example.com", "port": "443", "id": "uuid"}
+            return "vmess://" + base64.b64encode(json.dumps(config).encode()).decode()
+
+        nodes = [
+            vmess("a"),
+            vmess("b"),
+            "trojan://pw@t.example.com:443#x",
+            "trojan://pw@T.example.com:443#y",
+            "hy3://unknown-protocol-node",
+            "hy3://unknown-protocol-node",
+        ]
+
+        assert CollectorManager()._deduplicate_nodes(nodes) == [nodes[0], nodes[2], nodes[4]]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：content_sniffer
+测试订阅内容格式嗅探和按格式选择解码器
+"""
+
+import base64
+import json
+import pytest
+import sys
+import os
+from urllib.parse import quote
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.utils.content_sniffer import (
+    FORMAT_BASE64,
+    FORMAT_STRUCTURED,
+    FORMAT_UNKNOWN,
+    FORMAT_URI,
+    FORMAT_URL_ENCODED,
+    decode_by_format,
+    sniff_content_format,
+)
+
+NODES = [
+    "vless://12345678-1234-1234-1234-123456789abc@example.com:443?path=%2Fws#US",
+    "trojan://password@example.org:443?sni=example.org#JP",
+]
+
+
+class TestSniffContentFormat:
+    """格式嗅探测试"""
+
+    def test_uri_lines(self):
+        """测试每行一个节点的纯文本订阅"""
+        assert sniff_content_format("\n".join(NODES)) == FORMAT_URI
+
+    def test_base64(self):
+        """测试Base64订阅（包括按76字符换行的编码）"""
+        encoded = base64.b64encode("\n".join(NODES * 20).encode()).decode()
+        wrapped = "\n".join(encoded[i : i + 76] for i in range(0, len(encoded), 76))
+
+        assert sniff_content_format(encoded) == FORMAT_BASE64
+        assert sniff_content_format(wrapped) == FORMAT_BASE64
+
+    def test_url_encoded(self):
+        """测试URL编码的节点列表"""
+        assert sniff_content_format(quote("\n".join(NODES), safe="")) == FORMAT_URL_ENCODED
+
+    def test_structured(self):
+        """测试Clash YAML和JSON"""
+        clash = "port: 7890\nmode: rule\nproxies:\n  - {name: a, type: ss, server: example.com}\n"
+
+        assert sniff_content_format(clash) == FORMAT_STRUCTURED
+        assert sniff_content_format(json.dumps({"proxies": []})) == FORMAT_STRUCTURED
+        assert sniff_content_format("mixed-port: 7890\nallow-lan: true\n") == FORMAT_STRUCTURED
+
+    def test_only_reads_sample(self):
+        """测试只根据开头部分判断格式"""
+        content = "\n".join(NODES * 10) + "\n" + "proxies:\n" * 10000
+
+        assert sniff_content_format(content, sample_size=500) == FORMAT_URI
+        assert sniff_content_format(content) == FORMAT_STRUCTURED
+
+    def test_bytes(self):
+        """测试直接嗅探原始字节（只解码开头部分，忽略BOM）"""
+        encoded = base64.b64encode("\n".join(NODES).encode())
+
+        assert sniff_content_format(encoded) == FORMAT_BASE64
+        assert sniff_content_format(b"\xef\xbb\xbf" + "\n".join(NODES).encode()) == FORMAT_URI
+        assert sniff_content_format(b"\xef\xbb\xbf{\"proxies\": []}") == FORMAT_STRUCTURED
+
+    def test_unknown(self):
+        """测试无法识别的内容"""
+        assert sniff_content_format("") == FORMAT_UNKNOWN
+        assert sniff_content_format("这不是订阅内容，只是一段说明文字。") == FORMAT_UNKNOWN
+
+
+class TestDecodeByFormat:
+    """按格式选择解码器测试"""
+
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def decoders(self, calls):
+        def make(fmt, result):
+            def decode(content):
+                calls.append(fmt)
+                return list(result)
+
+            return decode
+
+        return {
+            FORMAT_URI: make(FORMAT_URI, NODES),
+            FORMAT_BASE64: make(FORMAT_BASE64, []),
+            FORMAT_URL_ENCODED: make(FORMAT_URL_ENCODED, []),
+            FORMAT_STRUCTURED: make(FORMAT_STRUCTURED, ["ss://from-yaml"]),
+        }
+
+    def test_only_detected_decoder_runs(self, decoders, calls):
+        """测试嗅探出的解码器有结果时不再尝试其他解码器"""
+        fmt, nodes = decode_by_format("\n".join(NODES), decoders)
+
+        assert (fmt, nodes) == (FORMAT_URI, NODES)
+        assert calls == [FORMAT_URI]
+
+    def test_fallback_when_detected_decoder_empty(self, decoders, calls):
+        """测试对应解码器没有结果时按顺序尝试其余解码器"""
+        content = base64.b64encode(b"no nodes here at all").decode()
+
+        fmt, nodes = decode_by_format(content, decoders)
+
+        assert fmt == FORMAT_URI
+        assert calls == [FORMAT_BASE64, FORMAT_URI]
+
+    def test_nothing_found(self, calls):
+        """测试所有解码器都没有结果"""
+        assert decode_by_format("abc", {FORMAT_URI: lambda content: []}) == (None, [])
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：debug_artifacts
+测试调试文件的级别控制、后台写入和保留最近几次运行
+"""
+
+import pytest
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.debug_artifacts import DebugArtifacts
+
+
+class TestDebugArtifacts:
+    """调试文件保存器测试"""
+
+    def test_off_saves_nothing(self, tmp_path):
+        """测试默认级别不保存任何文件"""
+        artifacts = DebugArtifacts(tmp_path, "off")
+
+        assert artifacts.enabled("html") is False
+        assert artifacts.save("html", "site.html", "<html></html>") is None
+        artifacts.flush()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_html_level_skips_screenshots(self, tmp_path):
+        """测试 html 级别保存HTML但不保存截图"""
+        artifacts = DebugArtifacts(tmp_path, "html")
+
+        path = artifacts.save("html", "site.html", "<html>内容</html>")
+        assert artifacts.save("screenshot", "site.png", b"png") is None
+        artifacts.flush()
+
+        assert path.read_text(encoding="utf-8") == "<html>内容</html>"
+        assert path.parent.parent == tmp_path
+        assert artifacts.enabled("screenshot") is False
+
+    def test_full_level_saves_bytes_and_deduplicates_names(self, tmp_path):
+        """测试 full 级别保存截图，同名文件自动添加序号"""
+        artifacts = DebugArtifacts(tmp_path, "full")
+
+        first = artifacts.save("screenshot", "v2rayse initial.png", b"\x89PNG1")
+        second = artifacts.save("screenshot", "v2rayse initial.png", b"\x89PNG2")
+        artifacts.flush()
+
+        assert first.name == "v2rayse_initial.png"
+        assert second.name == "v2rayse_initial_2.png"
+        assert second.read_bytes() == b"\x89PNG2"
+
+    def test_keeps_only_recent_runs(self, tmp_path):
+        """测试只保留最近几次运行的调试目录"""
+        for run in ("20260101_000000_1", "20260102_000000_1", "20260103_000000_1"):
+            (tmp_path / run).mkdir()
+            (tmp_path / run / "old.html").write_text("old", encoding="utf-8")
+
+        artifacts = DebugArtifacts(tmp_path, "html", max_runs=2)
+        artifacts.run_id = "20260104_000000_1"
+        artifacts.save("html", "new.html", "new")
+        artifacts.flush()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "20260103_000000_1",
+            "20260104_000000_1",
+        ]
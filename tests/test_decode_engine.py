@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：decode_engine
+测试统一订阅解码引擎的解码顺序、去重规则、钩子和阶段统计
+"""
+
+import base64
+import json
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+from urllib.parse import quote
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.decode_engine import DecodeHooks, DecodeStats, SubscriptionDecoder
+from src.core.protocol_converter import ProtocolConverter
+from src.utils.content_sniffer import FORMAT_BASE64, FORMAT_STRUCTURED, FORMAT_URI
+
+VLESS = "vless://12345678-1234-1234-1234-123456789abc@example.com:443?security=tls#US"
+TROJAN = "trojan://password@example.org:443?sni=example.org#JP"
+
+CLASH_YAML = """
+port: 7890
+proxies:
+  - name: "测试节点"
+    type: trojan
+    server: example.net
+    port: 443
+    password: secret-password
+rules:
+  - MATCH,DIRECT
+"""
+
+
+def b64(text: str) -> str:
+    return base64.b64encode(text.encode()).decode()
+
+
+class TestSubscriptionDecoder:
+    """订阅解码器测试"""
+
+    @pytest.fixture
+    def stats(self):
+        return DecodeStats()
+
+    @pytest.fixture
+    def decoder(self, stats):
+        return SubscriptionDecoder(ProtocolConverter(), 20, Mock(), stats=stats)
+
+    def test_plain_uri_lines_dedup_in_order(self, decoder):
+        """测试纯文本订阅按首次出现顺序去重并过滤过短节点"""
+        content = f"{TROJAN}\n{VLESS}\n{TROJAN}\nss://short\n"
+
+        assert decoder.decode_with_format(content) == (FORMAT_URI, [TROJAN, VLESS])
+
+    def test_base64_body(self, decoder):
+        """测试整体Base64、按行折断的Base64和双重Base64"""
+        encoded = b64(f"{VLESS}\n{TROJAN}")
+        wrapped = "\n".join(encoded[i : i + 20] for i in range(0, len(encoded), 20))
+
+        assert decoder.decode_with_format(encoded) == (FORMAT_BASE64, [VLESS, TROJAN])
+        assert decoder.decode(wrapped) == [VLESS, TROJAN]
+        assert decoder.decode(b64(encoded)) == [VLESS, TROJAN]
+
+    def test_base64_per_line(self, decoder):
+        """测试每行单独Base64编码的订阅"""
+        assert decoder.decode(f"{b64(VLESS)}\n{b64(TROJAN)}") == [VLESS, TROJAN]
+
+    def test_accepts_bytes(self, decoder):
+        """测试直接解码原始字节"""
+        assert decoder.decode(b64(VLESS).encode()) == [VLESS]
+        assert decoder.decode(quote(f"{VLESS}\n{TROJAN}", safe="").encode()) == [VLESS, TROJAN]
+
+    def test_bytes_text_policy(self, decoder):
+        """测试字节按UTF-8解码：去掉BOM，丢弃非法字节"""
+        content = b"\xef\xbb\xbf" + VLESS.encode() + b"\n\xff\xfe" + TROJAN.encode()
+
+        assert decoder.decode(content) == [VLESS, TROJAN]
+        assert decoder.decode(base64.b64encode(b"\xef\xbb\xbf" + TROJAN.encode())) == [TROJAN]
+
+    def test_clash_yaml_and_json(self, decoder):
+        """测试Clash YAML配置和JSON代理列表"""
+        proxy = {"name": "n", "type": "trojan", "server": "example.net", "port": 443, "password": "pw-1234567"}
+
+        fmt, nodes = decoder.decode_with_format(CLASH_YAML)
+        assert fmt == FORMAT_STRUCTURED
+        assert len(nodes) == 1 and nodes[0].startswith("trojan://secret-password@example.net:443")
+        assert decoder.decode(json.dumps([proxy]))[0].startswith("trojan://pw-1234567@example.net:443")
+
+    def test_inline_json_fallback(self, decoder):
+        """测试YAML整体解析失败时提取行内JSON代理"""
+        content = (
+            "proxies:\n"
+            '  - {"name": "n", "type": "trojan", "server": "example.net", "port": 443, "password": "pw-1234567"}\n'
+            "  bad: [unclosed\n"
+        )
+
+        nodes = decoder.decode(content)
+
+        assert len(nodes) == 1 and nodes[0].startswith("trojan://pw-1234567@")
+
+    def test_nothing_found(self, decoder):
+        """测试无法解析的内容"""
+        assert decoder.decode_with_format("这是一些无效的订阅内容") == (None, [])
+
+    def test_stage_stats(self, decoder, stats):
+        """测试各阶段记录调用、命中和耗时"""
+        decoder.decode(b64(VLESS))
+        decoder.decode("这是一些无效的订阅内容")
+
+        result = stats.get_stats()
+        assert result[FORMAT_BASE64]["hits"] == 1
+        assert result[FORMAT_BASE64]["nodes"] == 1
+        assert result[FORMAT_BASE64]["calls"] == 2
+        assert result[FORMAT_URI]["calls"] == 1
+        assert all(entry["seconds"] >= 0 for entry in result.values())
+
+
+class TestDecodeHooks:
+    """收集器解码钩子测试"""
+
+    def test_extract_text_hook_used_for_decoded_content(self):
+        """测试文本提取钩子同时用于明文和Base64解码后的内容"""
+        seen = []
+
+        def extract(text):
+            seen.append(text)
+            return [line for line in text.splitlines() if line.startswith("vless://")]
+
+        decoder = SubscriptionDecoder(
+            ProtocolConverter(), 20, Mock(), hooks=DecodeHooks(extract_text=extract), stats=DecodeStats()
+        )
+
+        assert decoder.decode(b64(f"{VLESS}\n{TROJAN}")) == [VLESS]
+        assert f"{VLESS}\n{TROJAN}" in seen
+
+    def test_decoder_override_and_post_process(self):
+        """测试替换单个解码阶段并对结果做最后处理"""
+        hooks = DecodeHooks(
+            decoders={FORMAT_URI: lambda text: [TROJAN, VLESS]},
+            post_process=lambda nodes: sorted(nodes),
+        )
+        decoder = SubscriptionDecoder(ProtocolConverter(), 20, Mock(), hooks=hooks, stats=DecodeStats())
+
+        assert decoder.decode(f"{VLESS}\n") == sorted([TROJAN, VLESS])
+
+    def test_convert_proxy_hook(self):
+        """测试Clash代理转换钩子"""
+        hooks = DecodeHooks(convert_proxy=lambda proxy: f"trojan://custom-{proxy['name']}@host:443")
+        decoder = SubscriptionDecoder(ProtocolConverter(), 20, Mock(), hooks=hooks, stats=DecodeStats())
+
+        assert decoder.decode(CLASH_YAML) == ["trojan://custom-测试节点@host:443"]
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：http_cache
+测试HTTP条件请求缓存的存储、新鲜期和304复用
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+
+import requests
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.http_cache import HttpCache
+from src.core.handlers.request_handler import RequestHandler
+
+
+def make_response(status_code=200, body=b"", headers=None):
+    """构造 requests.Response"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+class TestHttpCache:
+    """HTTP缓存测试"""
+
+    URL = "https://example.com/sub.txt"
+
+    @pytest.fixture
+    def session(self):
+        """创建模拟会话"""
+        return Mock()
+
+    def test_miss_then_fresh_hit(self, tmp_path, session):
+        """测试未命中后存储，新鲜期内不再请求网络"""
+        cache = HttpCache(tmp_path, ttl=3600)
+        session.get.return_value = make_response(body=b"vmess://abc", headers={"ETag": '"v1"'})
+
+        first = cache.request(session, "GET", self.URL, timeout=5)
+        cache.store(self.URL, first)
+        second = cache.request(session, "GET", self.URL, timeout=5)
+
+        assert session.get.call_count == 1
+        assert second.text == "vmess://abc"
+        assert second.from_cache is True
+        assert cache.get_stats()["fresh_hits"] == 1
+
+    def test_conditional_request_and_304(self, tmp_path, session):
+        """测试过期后发送条件请求，304时使用磁盘内容"""
+        cache = HttpCache(tmp_path, ttl=0)
+        session.get.return_value = make_response(
+            body=b"trojan://p@1.1.1.1:443",
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+        cache.store(self.URL, cache.request(session, "GET", self.URL))
+
+        session.get.return_value = make_response(status_code=304)
+        response = cache.request(session, "GET", self.URL, headers={"X-Test": "1"})
+
+        sent_headers = session.get.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"v1"'
+        assert sent_headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert sent_headers["X-Test"] == "1"
+        assert response.status_code == 200
+        assert response.text == "trojan://p@1.1.1.1:443"
+        assert cache.get_stats()["revalidated"] == 1
+
+    def test_changed_content_replaces_entry(self, tmp_path, session):
+        """测试内容变化时更新缓存"""
+        cache = HttpCache(tmp_path, ttl=0)
+        session.get.return_value = make_response(body=b"old", headers={"ETag": '"v1"'})
+        cache.store(self.URL, cache.request(session, "GET", self.URL))
+
+        session.get.return_value = make_response(body=b"new", headers={"ETag": '"v2"'})
+        cache.store(self.URL, cache.request(session, "GET", self.URL))
+
+        entry = cache.lookup(self.URL)
+        assert entry.body == b"new"
+        assert entry.etag == '"v2"'
+
+    def test_error_responses_not_stored(self, tmp_path, session):
+        """测试非200响应不写入缓存"""
+        cache = HttpCache(tmp_path, ttl=3600)
+        cache.store(self.URL, make_response(status_code=500, body=b"error"))
+
+        assert cache.lookup(self.URL) is None
+
+    def test_prune_removes_old_unused_entries(self, tmp_path, session):
+        """测试清理时删除本次未使用的过期条目，保留本次使用过的和未过期的条目"""
+        import json
+        import time
+
+        old_url = "https://example.com/20200101.txt"
+        new_url = "https://example.com/today.txt"
+        writer = HttpCache(tmp_path, ttl=0)
+        for url in (old_url, new_url, self.URL):
+            writer.store(url, make_response(body=b"vmess://abc"))
+        for url in (old_url, self.URL):
+            meta_path = writer._paths(url)[0]
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta["stored_at"] = time.time() - 10 * 86400
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+        # 新的一次运行：只用到了 self.URL
+        cache = HttpCache(tmp_path, ttl=0, max_age=7 * 86400)
+        assert cache.lookup(self.URL) is not None
+
+        assert cache.prune() == 1
+        assert cache.lookup(old_url) is None
+        assert not writer._paths(old_url)[1].exists()
+        assert cache.lookup(new_url) is not None
+        assert cache.lookup(self.URL) is not None
+
+    def test_request_handler_uses_cache(self, tmp_path):
+        """测试请求处理器在新鲜期内直接返回缓存"""
+        cache = HttpCache(tmp_path, ttl=3600)
+        session = Mock()
+        session.proxies = {}
+        session.get.return_value = make_response(body=b"<html>index</html>")
+        handler = RequestHandler(session, 5, 0, Mock(), http_cache=cache)
+
+        handler.make_request("https://example.com/")
+        response = handler.make_request("https://example.com/")
+
+        assert session.get.call_count == 1
+        assert response.text == "<html>index</html>"
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：http_client
+测试共享连接池和会话变体
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.http_client import HttpClientRegistry, get_http_client
+from src.core.subscription_parser import SubscriptionParser
+
+
+class TestHttpClientRegistry:
+    """HTTP客户端注册表测试"""
+
+    def test_sessions_share_adapter(self):
+        """测试独立会话共享同一个连接池"""
+        registry = HttpClientRegistry()
+        first = registry.create_session()
+        second = registry.create_session()
+
+        assert first is not second
+        assert first.get_adapter("https://a.example.com") is second.get_adapter("https://b.example.com")
+        assert first.get_adapter("http://a.example.com").ssl_context is registry.ssl_context
+
+    def test_session_state_is_isolated(self):
+        """测试会话请求头和代理互不影响"""
+        registry = HttpClientRegistry()
+        first = registry.create_session(headers={"X-Site": "a"})
+        second = registry.create_session()
+        first.proxies = {"http": "http://127.0.0.1:1"}
+
+        assert "X-Site" not in second.headers
+        assert second.proxies == {}
+
+    def test_shared_session_variants(self):
+        """测试直连和代理变体"""
+        registry = HttpClientRegistry()
+        with patch.dict(os.environ, {"HTTPS_PROXY": "http://127.0.0.1:7890"}):
+            direct = registry.get_session("direct")
+            proxied = registry.get_session("proxy")
+
+        assert registry.get_session("direct") is direct
+        assert direct.trust_env is False and direct.proxies == {}
+        assert proxied.proxies["https"] == "http://127.0.0.1:7890"
+        assert direct.get_adapter("https://x") is proxied.get_adapter("https://x")
+
+    def test_parser_uses_singleton(self):
+        """测试订阅解析器默认复用全局注册表"""
+        assert SubscriptionParser().http_client is get_http_client()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：node
+测试节点URI解析为结构化的 Node
+"""
+
+import base64
+import json
+import pytest
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.utils.node import Node, as_node, parse_node
+
+
+def vmess_uri(**config) -> str:
+    return "vmess://" + base64.b64encode(json.dumps(config).encode()).decode()
+
+
+class TestParseNode:
+    """节点解析测试"""
+
+    def test_vless_url_form(self):
+        """测试 user@host:port?query#name 形式"""
+        node = parse_node("vless://uuid-1@Example.COM:443?security=tls&sni=a.com#US%20node")
+
+        assert (node.scheme, node.host, node.port) == ("vless", "example.com", 443)
+        assert node.credential == "uuid-1"
+        assert node.params == {"security": "tls", "sni": "a.com"}
+        assert node.name == "US node"
+        assert node.server == "example.com:443"
+
+    def test_vmess_json(self):
+        """测试 vmess Base64 JSON（缺少padding也能解析）"""
+        uri = vmess_uri(v="2", ps="香港 01", add="hk.example.com", port="8443", id="uuid-2", net="ws")
+
+        node = parse_node(uri.rstrip("="))
+
+        assert (node.host, node.port, node.credential, node.name) == ("hk.example.com", 8443, "uuid-2", "香港 01")
+        assert node.params == {"net": "ws"}
+
+    def test_ss_sip002_and_legacy(self):
+        """测试 SIP002 和旧版整体Base64的 ss 节点"""
+        userinfo = base64.urlsafe_b64encode(b"aes-256-gcm:secret").decode().rstrip("=")
+        legacy = base64.b64encode(b"aes-256-gcm:secret@1.2.3.4:8388").decode()
+
+        sip002 = parse_node(f"ss://{userinfo}@1.2.3.4:8388#a")
+        old = parse_node(f"ss://{legacy}#b")
+
+        assert (sip002.server, sip002.credential, sip002.name) == ("1.2.3.4:8388", "aes-256-gcm:secret", "a")
+        assert (old.server, old.credential, old.name) == ("1.2.3.4:8388", "aes-256-gcm:secret", "b")
+
+    def test_ssr(self):
+        """测试 ssr 冒号格式"""
+        password = base64.urlsafe_b64encode(b"pw").decode()
+        remarks = base64.urlsafe_b64encode("节点".encode()).decode()
+        body = f"1.2.3.4:443:origin:aes-256-cfb:plain:{password}/?remarks={remarks}"
+
+        node = parse_node("ssr://" + base64.urlsafe_b64encode(body.encode()).decode())
+
+        assert (node.server, node.credential, node.name) == ("1.2.3.4:443", "aes-256-cfb:pw", "节点")
+        assert node.params == {"protocol": "origin", "obfs": "plain"}
+
+    def test_ipv6_and_multi_port(self):
+        """测试IPv6地址和 hysteria2 多端口"""
+        assert parse_node("trojan://pw@[2001:db8::1]:443#v6").host == "2001:db8::1"
+        assert parse_node("hysteria2://pw@h.example.com:443,5000-6000/?sni=x#hy").port == 443
+
+    def test_invalid(self):
+        """测试无法解析的节点"""
+        assert parse_node("not a node") is None
+        assert parse_node("ss://bad") is None
+        assert parse_node("vmess://" + base64.b64encode(b"{}").decode()) is None
+
+    def test_parsed_once(self):
+        """测试相同URI返回同一个解析结果"""
+        uri = "trojan://pw@cache.example.com:443#x"
+
+        assert parse_node(uri) is parse_node(uri)
+        assert as_node(parse_node(uri)) is parse_node(uri)
+
+    def test_slots(self):
+        """测试 Node 不带 __dict__"""
+        node = parse_node("trojan://pw@example.com:443#x")
+
+        assert isinstance(node, Node)
+        assert not hasattr(node, "__dict__")
+
+    def test_immutable(self):
+        """测试缓存共享的 Node 不能被修改（属性和 params 都是只读的）"""
+        node = parse_node("vless://uuid@immutable.example.com:443?security=tls#x")
+
+        with pytest.raises(AttributeError):
+            node.host = "other.example.com"
+        with pytest.raises(AttributeError):
+            del node.name
+        with pytest.raises(TypeError):
+            node.params["security"] = "none"
+        assert parse_node("vless://uuid@immutable.example.com:443?security=tls#x").params == {
+            "security": "tls"
+        }
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：node_fingerprint
+测试协议感知的节点指纹和去重
+"""
+
+import base64
+import json
+import pytest
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.utils.node_fingerprint import (
+    dedupe_nodes,
+    node_fingerprint,
+    node_key,
+    stable_order,
+)
+
+
+def vmess_uri(**config) -> str:
+    return "vmess://" + base64.b64encode(json.dumps(config).encode()).decode()
+
+
+class TestNodeFingerprint:
+    """节点指纹测试"""
+
+    def test_ignores_name_param_order_and_case(self):
+        """测试名称、参数顺序、主机大小写和UUID大小写不影响指纹"""
+        a = "vless://ABCD-1234@Example.com:443?security=tls&sni=a.com&type=ws#香港"
+        b = "vless://abcd-1234@example.com:443?type=ws&sni=a.com&security=tls#US%20node"
+
+        assert node_fingerprint(a) == node_fingerprint(b)
+
+    def test_default_params_equal_to_omitted(self):
+        """测试默认参数值与省略等价"""
+        assert node_fingerprint("vless://u@h.example.com:443?encryption=none&type=tcp#a") == node_fingerprint(
+            "vless://u@h.example.com:443#b"
+        )
+
+    def test_significant_fields_differ(self):
+        """测试凭据、传输参数和端口不同的节点指纹不同"""
+        base = "trojan://pw@t.example.com:443?sni=a.com#x"
+
+        assert node_fingerprint(base) != node_fingerprint("trojan://pw2@t.example.com:443?sni=a.com#x")
+        assert node_fingerprint(base) != node_fingerprint("trojan://pw@t.example.com:443?sni=b.com#x")
+        assert node_fingerprint(base) != node_fingerprint("trojan://pw@t.example.com:8443?sni=a.com#x")
+
+    def test_vmess_json_order_and_name(self):
+        """测试 vmess JSON 字段顺序和 ps 不影响指纹"""
+        a = vmess_uri(v="2", ps="a", add="v.example.com", port="443", id="UUID", net="ws", path="/p", aid=0)
+        b = vmess_uri(path="/p", net="ws", id="uuid", port=443, add="v.example.com", ps="b")
+
+        assert node_fingerprint(a) == node_fingerprint(b)
+
+    def test_ss_sip002_equals_legacy(self):
+        """测试同一 ss 节点的 SIP002 和旧版写法指纹相同"""
+        userinfo = base64.urlsafe_b64encode(b"aes-256-gcm:secret").decode().rstrip("=")
+        legacy = base64.b64encode(b"aes-256-gcm:secret@1.2.3.4:8388").decode()
+
+        assert node_fingerprint(f"ss://{userinfo}@1.2.3.4:8388#a") == node_fingerprint(f"ss://{legacy}#b")
+
+    def test_hy2_alias(self):
+        """测试 hy2 与 hysteria2 等价"""
+        assert node_fingerprint("hy2://pw@h.example.com:443?sni=x#a") == node_fingerprint(
+            "hysteria2://pw@h.example.com:443?sni=x#b"
+        )
+
+    def test_unparsed(self):
+        """测试无法解析的节点"""
+        assert node_fingerprint("not-a-node") is None
+
+
+class TestDedupeNodes:
+    """指纹去重测试"""
+
+    def test_keeps_first_seen(self):
+        """测试保留每个指纹第一次出现的节点"""
+        nodes = [
+            "trojan://pw@t.example.com:443#first",
+            "vless://u@v.example.com:443#v",
+            "trojan://pw@T.example.com:443#second",
+        ]
+
+        assert dedupe_nodes(nodes) == nodes[:2]
+
+    def test_unparsed_nodes(self):
+        """测试无法解析的节点默认丢弃，keep_unparsed 时按原始字符串去重"""
+        nodes = ["garbage", "trojan://pw@t.example.com:443#a", "garbage"]
+
+        assert dedupe_nodes(nodes) == [nodes[1]]
+        assert dedupe_nodes(nodes, keep_unparsed=True) == nodes[:2]
+
+
+def keys(nodes) -> list:
+    return [node_key(uri) for uri in nodes]
+
+
+class TestStableOrder:
+    """稳定排序测试"""
+
+    def test_keeps_previous_positions_and_appends_new_sorted(self):
+        """测试已有节点保持原顺序，新节点按指纹排序追加在末尾"""
+        a = "trojan://pw@a.com:443#A"
+        b = "trojan://pw@b.com:443#B"
+        c = "trojan://pw@c.com:443#C"
+        d = "trojan://pw@d.com:443#D"
+        previous = [c, a, b]
+
+        result = stable_order([d, b, a, c], keys(previous))
+        assert result[:3] == [c, a, b]
+        assert result[3:] == [d]
+
+        new_nodes = ["trojan://pw@x.com:443#X", "trojan://pw@y.com:443#Y"]
+        expected_new = sorted(new_nodes, key=node_fingerprint)
+        assert stable_order(new_nodes, []) == expected_new
+        assert stable_order(list(reversed(new_nodes)), []) == expected_new
+
+    def test_renamed_node_keeps_position(self):
+        """测试名称变化的节点按指纹保持原位置，使用本次的URI"""
+        previous = ["trojan://pw@a.com:443#Old", "trojan://pw@b.com:443#B"]
+        renamed = "trojan://pw@a.com:443#New"
+        assert stable_order(["trojan://pw@b.com:443#B", renamed], keys(previous)) == [
+            renamed,
+            "trojan://pw@b.com:443#B",
+        ]
+
+    def test_removed_and_unparsed_nodes(self):
+        """测试删除的节点不再输出，无法解析的节点按原始字符串排序"""
+        previous = ["not-a-node", "trojan://pw@a.com:443#A"]
+        result = stable_order(["trojan://pw@b.com:443#B", "not-a-node"], keys(previous))
+        assert result == ["not-a-node", "trojan://pw@b.com:443#B"]
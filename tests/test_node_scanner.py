@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：node_scanner
+测试单次扫描多协议节点URI
+"""
+
+import pytest
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.config.websites import NODE_SCHEMES
+from src.utils.node_scanner import NodeScanner, get_node_scanner
+
+VMESS = "vmess://eyJ2IjoiMiIsImFkZCI6ImV4YW1wbGUuY29tIn0="
+HY2 = "hysteria2://password@example.com:443?sni=example.com#HY2"
+HY1 = "hysteria://example.com:443?protocol=udp&auth=pass#HY1"
+SS = "ss://Y2lwaGVyOnRlc3RAZXhhbXBsZS5jb206ODM4OA==#SS"
+SSR = "ssr://ZXhhbXBsZS5jb206ODM4ODpvcmlnaW46YWVzLTI1Ni1jZmI6cGxhaW46cGFzcw"
+
+
+class TestNodeScanner:
+    """节点扫描器测试"""
+
+    @pytest.fixture
+    def scanner(self):
+        return NodeScanner(NODE_SCHEMES)
+
+    def test_scan_in_document_order(self, scanner):
+        """测试所有协议一次扫描，按出现顺序返回"""
+        text = f"节点1: {SSR}\n{VMESS}\n  {HY2}\n{SS}\n{HY1}"
+
+        assert scanner.scan(text) == [SSR, VMESS, HY2, SS, HY1]
+
+    def test_each_node_matched_once(self, scanner):
+        """测试 vmess:// 不会再产生 ss:// 节点，hysteria2:// 只匹配一次"""
+        assert scanner.scan(f"{VMESS} {HY2}") == [VMESS, HY2]
+        assert [scheme for scheme, _ in scanner.finditer(f"{VMESS} {HY2} {HY1}")] == [
+            "vmess",
+            "hysteria2",
+            "hysteria",
+        ]
+
+    def test_case_insensitive_scheme(self, scanner):
+        """测试协议名不区分大小写"""
+        assert list(scanner.finditer("VLESS://uuid@example.com:443")) == [
+            ("vless", "VLESS://uuid@example.com:443")
+        ]
+
+    def test_stop_chars(self):
+        """测试遇到指定字符时节点结束"""
+        scanner = NodeScanner(["vless"], '<>"')
+        html = '<a href="vless://uuid@example.com:443">vless://uuid@example.org:443</a>'
+
+        assert scanner.scan(html) == ["vless://uuid@example.com:443", "vless://uuid@example.org:443"]
+        assert NodeScanner(["vless"]).scan(html) == ['vless://uuid@example.com:443">vless://uuid@example.org:443</a>']
+
+    def test_min_length(self, scanner):
+        """测试过滤过短的节点"""
+        assert scanner.scan("ss://a vless://uuid@example.com:443", min_length=20) == [
+            "vless://uuid@example.com:443"
+        ]
+
+    def test_unknown_scheme_ignored(self, scanner):
+        """测试未配置的协议和普通链接不会被识别"""
+        assert scanner.scan("https://example.com/sub tuic://uuid@example.com:443") == []
+
+    def test_scanner_shared(self):
+        """测试相同参数共享同一个扫描器"""
+        assert get_node_scanner(NODE_SCHEMES) is get_node_scanner(list(NODE_SCHEMES))
+        assert get_node_scanner(NODE_SCHEMES) is not get_node_scanner(NODE_SCHEMES, '<>"')
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：node_store
+测试SQLite节点存储
+"""
+
+import pytest
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.node_store import SECONDS_PER_DAY, NodeStore, sqlite_path
+from src.utils.node_fingerprint import node_fingerprint
+
+HK = "trojan://pw@hk.example.hk:443#香港01"
+US = "trojan://pw@us.example.com:443#US01"
+JP = "vless://uuid@jp.example.com:443?security=tls#JP01"
+DAY0 = 1_700_000_000
+
+
+@pytest.fixture
+def store():
+    with NodeStore("sqlite://") as node_store:
+        yield node_store
+
+
+class TestSqlitePath:
+    """DATABASE_URL 解析测试"""
+
+    def test_paths(self):
+        """测试相对路径、绝对路径和内存数据库"""
+        assert sqlite_path("sqlite:///nodes.db") == "nodes.db"
+        assert sqlite_path("sqlite:////data/nodes.db") == "/data/nodes.db"
+        assert sqlite_path("sqlite://") == ":memory:"
+        assert sqlite_path("sqlite:///:memory:") == ":memory:"
+
+    def test_rejects_other_databases(self):
+        """测试非SQLite的URL"""
+        with pytest.raises(ValueError):
+            sqlite_path("postgresql://localhost/nodes")
+
+
+class TestRecordRun:
+    """运行记录测试"""
+
+    def test_upsert_tracks_first_and_last_seen(self, store):
+        """测试同一指纹的节点只有一行，记录首次/最近出现时间和出现次数"""
+        store.record_run([HK, US], [(HK, "a", "https://a/sub"), (US, "b", None)], seen_at=DAY0)
+        renamed_hk = "trojan://pw@hk.example.hk:443#Renamed"
+        store.record_run([renamed_hk], [(renamed_hk, "a", "https://a/sub")], seen_at=DAY0 + 100)
+
+        rows = store.conn.execute(
+            "SELECT uri, protocol, region, first_seen, last_seen, seen_count FROM nodes "
+            "ORDER BY host"
+        ).fetchall()
+        assert rows == [
+            (renamed_hk, "trojan", "HK", DAY0, DAY0 + 100, 2),
+            (US, "trojan", "OTHER", DAY0, DAY0, 1),
+        ]
+        sightings = store.conn.execute(
+            "SELECT site, subscription_url, seen_at FROM sightings ORDER BY seen_at, site"
+        ).fetchall()
+        assert sightings == [
+            ("a", "https://a/sub", DAY0),
+            ("b", "", DAY0),
+            ("a", "https://a/sub", DAY0 + 100),
+        ]
+
+    def test_output_uri_wins_and_unparsed_skipped(self, store):
+        """测试节点表使用输出的URI，无法解析的节点不记录"""
+        raw = "trojan://pw@us.example.com:443#AD-free-nodes"
+        count = store.record_run([US], [(raw, "a", None), ("not-a-node", "a", None)], seen_at=DAY0)
+        assert count == 1
+        assert store.conn.execute("SELECT uri FROM nodes").fetchall() == [(US,)]
+
+    def test_indexes_exist(self, store):
+        """测试协议、地区、首次和最近出现时间上有索引"""
+        indexed = {
+            row[0]
+            for row in store.conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'nodes'"
+            )
+            if row[0]
+        }
+        for column in ("protocol", "region", "first_seen", "last_seen"):
+            assert any(f"({column})" in sql for sql in indexed)
+
+
+class TestQueries:
+    """查询测试"""
+
+    def test_surviving_nodes(self, store):
+        """测试最近一次仍然出现且存活至少N天的节点"""
+        store.record_run([HK, US], [], seen_at=DAY0)
+        store.record_run([HK, JP], [], seen_at=DAY0 + 7 * SECONDS_PER_DAY)
+
+        assert store.surviving_nodes(7) == [HK]
+        assert store.surviving_nodes(1) == [HK]
+        assert sorted(store.surviving_nodes(0)) == sorted([HK, JP])
+
+    def test_unique_nodes_by_site(self, store):
+        """测试只从一个网站出现过的节点按网站计数"""
+        store.record_run(
+            [HK, US, JP],
+            [(HK, "a", None), (HK, "b", None), (US, "a", None), (JP, "b", None)],
+            seen_at=DAY0,
+        )
+        store.record_run([JP], [(JP, "a", None)], seen_at=DAY0 + 10)
+
+        assert store.unique_nodes_by_site() == {"a": 1}
+        assert store.unique_nodes_by_site(since=DAY0 + 10) == {"a": 1}
+        assert store.unique_nodes_by_site(since=DAY0 + 11) == {}
+
+    def test_record_probes(self, store):
+        """测试记录测速结果，数据库中没有的节点忽略"""
+        store.record_run([HK, US], [], seen_at=DAY0)
+        assert store.record_probes([(HK, 120), (US, -1), (JP, 50)], "karing", DAY0) == 2
+
+        rows = store.conn.execute(
+            "SELECT fingerprint, latency_ms, success FROM probes ORDER BY success"
+        ).fetchall()
+        assert rows == [(node_fingerprint(US), None, 0), (node_fingerprint(HK), 120, 1)]
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：parse_cache
+测试订阅内容解析缓存的命中、统计和持久化
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.decode_engine import DECODER_VERSION
+from src.core.parse_cache import ParseCache, PARSE_CACHE_VERSION
+from src.core.subscription_parser import SubscriptionParser
+
+
+class TestParseCache:
+    """解析缓存测试"""
+
+    def test_hit_and_stats(self):
+        """测试命中统计和返回副本"""
+        cache = ParseCache()
+        assert cache.get("payload") is None
+
+        cache.put("payload", ["trojan://a"])
+        nodes = cache.get("payload")
+        nodes.append("mutated")
+
+        assert cache.get("payload") == ["trojan://a"]
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
+
+    def test_persist_only_used_entries(self, tmp_path):
+        """测试持久化只保留本次运行用到的条目"""
+        cache_file = tmp_path / "parse_cache.json"
+        first = ParseCache(cache_file)
+        first.put("old", ["ss://old"])
+        first.put("kept", ["ss://kept"])
+        first.save()
+
+        second = ParseCache(cache_file)
+        assert second.get("kept") == ["ss://kept"]
+        second.save()
+
+        third = ParseCache(cache_file)
+        assert third.get("kept") == ["ss://kept"]
+        assert third.get("old") is None
+
+    def test_version_mismatch_discards(self, tmp_path):
+        """测试版本变化时忽略旧缓存"""
+        cache_file = tmp_path / "parse_cache.json"
+        cache = ParseCache(cache_file)
+        cache.put("payload", ["ss://x"])
+        cache.save()
+
+        with patch("src.core.parse_cache.PARSE_CACHE_VERSION", PARSE_CACHE_VERSION + ".next"):
+            assert ParseCache(cache_file).get("payload") is None
+
+    def test_version_follows_decoder_version(self):
+        """测试缓存版本由解码器版本派生，解码器输出变化时旧缓存失效"""
+        assert PARSE_CACHE_VERSION.endswith(f".{DECODER_VERSION}")
+        assert PARSE_CACHE_VERSION != 2
+
+    def test_parser_parses_identical_content_once(self):
+        """测试订阅解析器对相同内容只执行一次完整解析"""
+        parser = SubscriptionParser(parse_cache=ParseCache())
+        content = "trojan://password@example.com:443#node1\nvless://uuid@example.com:443#node2"
+
+        with patch.object(
+            parser, "_parse_subscription_content_uncached",
+            wraps=parser._parse_subscription_content_uncached,
+        ) as uncached:
+            first = parser._parse_subscription_content(content)
+            second = parser._parse_subscription_content(content)
+
+        assert uncached.call_count == 1
+        assert first == second
+        assert parser.parse_cache.get_stats()["hits"] == 1
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：politeness
+测试按主机的令牌桶访问频率调度
+"""
+
+import sys
+import os
+import time
+import threading
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.politeness import PolitenessScheduler, TokenBucket
+
+
+class TestTokenBucket:
+    """令牌桶测试"""
+
+    def test_burst_then_rate(self):
+        """测试突发请求用完后按速率等待"""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert 0.05 < bucket.reserve() <= 0.1
+
+    def test_min_interval(self):
+        """测试最小请求间隔"""
+        bucket = TokenBucket(rate=0, burst=5, min_interval=0.5)
+
+        assert bucket.reserve() == 0
+        second = bucket.reserve()
+        third = bucket.reserve()
+        assert 0.45 < second <= 0.5
+        assert 0.95 < third <= 1.0
+
+
+class TestPolitenessScheduler:
+    """访问频率调度器测试"""
+
+    def test_hosts_are_independent(self):
+        """测试不同主机互不等待，同一主机需要等待"""
+        scheduler = PolitenessScheduler({"rate": 0, "burst": 1, "min_interval": 1.0})
+
+        assert scheduler.reserve("https://a.example.com/1") == 0
+        assert scheduler.reserve("https://b.example.com/1") == 0
+        assert scheduler.reserve("https://A.example.com/2") > 0.9
+
+    def test_site_config_overrides_default(self):
+        """测试网站配置中的 rate_limit 覆盖默认限制"""
+        websites = {
+            "slow": {"url": "https://slow.example.com/", "rate_limit": {"min_interval": 5}},
+            "plain": {"url": "https://plain.example.com/"},
+        }
+        scheduler = PolitenessScheduler.from_websites(
+            websites,
+            {"rate": 0, "burst": 1, "min_interval": 0},
+            {"cdn.example.com": {"min_interval": 2}},
+        )
+
+        scheduler.reserve("https://slow.example.com/a")
+        scheduler.reserve("https://plain.example.com/a")
+        scheduler.reserve("https://cdn.example.com/a")
+        assert scheduler.reserve("https://slow.example.com/b") > 4.9
+        assert scheduler.reserve("https://plain.example.com/b") == 0
+        assert scheduler.reserve("https://cdn.example.com/b") > 1.9
+
+    def test_default_limit_only_applies_to_site_hosts(self):
+        """测试默认限制只用于网站页面所在主机，其他订阅主机不限速"""
+        scheduler = PolitenessScheduler.from_websites(
+            {"site": {"url": "https://site.example.com/"}},
+            {"rate": 0, "burst": 1, "min_interval": 5},
+        )
+
+        scheduler.reserve("https://site.example.com/post")
+        scheduler.reserve("https://subs.example.org/a.txt")
+        assert scheduler.reserve("https://site.example.com/uploads/b.yaml") > 4.9
+        assert scheduler.reserve("https://subs.example.org/b.txt") == 0
+
+    def test_acquire_does_not_block_other_hosts(self):
+        """测试等待中的主机不阻塞其他主机"""
+        scheduler = PolitenessScheduler({"rate": 0, "burst": 1, "min_interval": 0.5})
+        scheduler.acquire("https://busy.example.com/1")
+
+        waiter = threading.Thread(target=scheduler.acquire, args=("https://busy.example.com/2",))
+        waiter.start()
+        start = time.time()
+        scheduler.acquire("https://free.example.com/1")
+        elapsed = time.time() - start
+        waiter.join()
+
+        assert elapsed < 0.1
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：result_archive
+测试结果历史归档的差异编码、随机读取和迁移
+"""
+
+import pytest
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import src.core.result_archive as result_archive_module
+from src.core.result_archive import (
+    OP_BASE,
+    OP_STRINGS,
+    ResultArchive,
+    decode_nodes,
+    encode_nodes,
+    migrate_result_dirs,
+    read_day_dir,
+)
+from src.utils.node_fingerprint import node_key
+
+
+def day_nodes(start: int, count: int) -> list:
+    return [f"trojan://pw@n{i}.com:443#Node{i:03d}" for i in range(start, start + count)]
+
+
+def write_day(result_dir, date: str, nodes: list, files: dict = None) -> None:
+    day_dir = result_dir / date
+    day_dir.mkdir(parents=True)
+    (day_dir / "nodetotal.txt").write_text("".join(f"{n}\n" for n in nodes), encoding="utf-8")
+    for name, content in (files or {}).items():
+        (day_dir / name).write_text(content, encoding="utf-8")
+
+
+class TestDeltaEncoding:
+    """差异编码测试"""
+
+    def test_round_trip_and_runs(self):
+        """测试连续的已有行合并为一个复制操作，新行进入字符串表"""
+        base = day_nodes(0, 10)
+        nodes = base[2:8] + day_nodes(100, 3) + [base[0]]
+        strings, ops = encode_nodes(nodes, base)
+
+        assert strings == day_nodes(100, 3)
+        assert ops == [[OP_BASE, 2, 6], [OP_STRINGS, 0, 3], [OP_BASE, 0, 1]]
+        assert decode_nodes(strings, ops, base) == nodes
+
+    def test_keyframe_interns_duplicates(self):
+        """测试完整快照中重复的URI只在字符串表中出现一次"""
+        nodes = day_nodes(0, 3) + day_nodes(0, 1)
+        strings, ops = encode_nodes(nodes, None)
+        assert strings == day_nodes(0, 3)
+        assert decode_nodes(strings, ops, None) == nodes
+
+
+class TestResultArchive:
+    """归档读写测试"""
+
+    def test_random_access_across_keyframes(self, tmp_path):
+        """测试任意一天都能还原，且每隔固定块数写入完整快照"""
+        archive = ResultArchive(str(tmp_path / "archive"), keyframe_interval=3)
+        history = {}
+        for day in range(7):
+            date = f"202601{day + 10:02d}"
+            history[date] = day_nodes(day * 2, 10)
+            archive.append_day(date, history[date], {"a_info.txt": f"day {day}\n"})
+
+        reopened = ResultArchive(str(tmp_path / "archive"), keyframe_interval=3)
+        assert [entry["base"] is None for entry in reopened.entries()] == [
+            True, False, False, True, False, False, True
+        ]
+        for date in reversed(list(history)):
+            assert ResultArchive(str(tmp_path / "archive")).read_nodes(date) == history[date]
+        assert reopened.read_day("20260115")[1] == {"a_info.txt": "day 5\n"}
+
+    def test_fingerprint_delta(self, tmp_path):
+        """测试数据块记录按指纹计算的新增和删除节点，改名不算变化"""
+        archive = ResultArchive(str(tmp_path / "archive"))
+        first = day_nodes(0, 3)
+        second = ["trojan://pw@n0.com:443#Renamed"] + first[1:2] + day_nodes(10, 1)
+        archive.append_day("20260110", first)
+        archive.append_day("20260111", second)
+
+        added, removed = archive.read_delta("20260111")
+        assert added == [node_key(day_nodes(10, 1)[0])]
+        assert removed == [node_key(first[2])]
+
+    def test_same_day_replaces_last_block(self, tmp_path):
+        """测试同一天再次追加时替换最后一天，数据文件不增长"""
+        archive = ResultArchive(str(tmp_path / "archive"))
+        archive.append_day("20260110", day_nodes(0, 5))
+        archive.append_day("20260111", day_nodes(0, 6))
+        size = os.path.getsize(archive.data_file)
+        archive.append_day("20260111", day_nodes(0, 6))
+
+        assert archive.days() == ["20260110", "20260111"]
+        assert os.path.getsize(archive.data_file) == size
+        assert ResultArchive(archive.archive_dir).read_nodes("20260111") == day_nodes(0, 6)
+
+    def test_rejects_out_of_order_dates(self, tmp_path):
+        """测试不能追加早于最后一天的日期"""
+        archive = ResultArchive(str(tmp_path / "archive"))
+        archive.append_day("20260111", day_nodes(0, 1))
+        with pytest.raises(ValueError):
+            archive.append_day("20260110", day_nodes(0, 1))
+
+    def test_zlib_fallback_without_zstd(self, tmp_path, monkeypatch):
+        """测试没有 zstandard 时使用zlib压缩"""
+        monkeypatch.setattr(result_archive_module, "HAS_ZSTD", False)
+        archive = ResultArchive(str(tmp_path / "archive"))
+        archive.append_day("20260110", day_nodes(0, 5))
+        assert archive.entries()[0]["codec"] == "zlib"
+        assert ResultArchive(archive.archive_dir).read_nodes("20260110") == day_nodes(0, 5)
+
+
+class TestMigration:
+    """迁移测试"""
+
+    def test_migrate_and_remove_verified_dirs(self, tmp_path):
+        """测试迁移全部日期目录，删除时保留最近的目录，重复迁移不会重复归档"""
+        result_dir = tmp_path / "result"
+        for day in range(4):
+            write_day(result_dir, f"202601{day + 10:02d}", day_nodes(day, 5), {"x_info.txt": "x\n"})
+        (result_dir / "nodetotal.txt").write_text("", encoding="utf-8")
+        expected = {
+            f"202601{day + 10:02d}": read_day_dir(str(result_dir / f"202601{day + 10:02d}"))
+            for day in range(4)
+        }
+
+        assert migrate_result_dirs(str(result_dir), remove=True, keep_days=1) == 4
+        assert sorted(p.name for p in result_dir.iterdir() if p.is_dir()) == ["20260113", "archive"]
+        assert migrate_result_dirs(str(result_dir)) == 0
+
+        archive = ResultArchive(str(result_dir / "archive"))
+        for date, content in expected.items():
+            assert archive.read_day(date) == content
+
+        archive.restore_day("20260111", str(tmp_path / "restored"))
+        assert read_day_dir(str(tmp_path / "restored")) == expected["20260111"]
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：result_manager
+测试总节点文件的保存
+"""
+
+import pytest
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import src.core.result_manager as result_manager_module
+from src.core.result_manager import ResultManager
+from src.utils.node_fingerprint import node_key
+
+
+def read_lines(path) -> list:
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ResultManager()
+
+
+def site(*nodes) -> dict:
+    return {"name": "site", "nodes": list(nodes), "subscription_links": []}
+
+
+class TestCleanNodeName:
+    """节点名称清理测试"""
+
+    def test_name_containing_hash_is_not_duplicated(self, manager):
+        """测试名称中含有 # 时按第一个 # 分割，名称不会重复"""
+        assert manager._clean_node_name("trojan://pw@h.example:443#US#1") == (
+            "trojan://pw@h.example:443#US%231"
+        )
+
+    def test_vmess_appended_name(self, manager):
+        """测试 vmess 的 # 后附加名称按原样解码清理"""
+        uri = "vmess://eyJhZGQiOiAiYS5leGFtcGxlIn0=#HK01%20(ad)"
+        assert manager._clean_node_name(uri) == "vmess://eyJhZGQiOiAiYS5leGFtcGxlIn0=#HK01"
+
+
+class TestSaveResults:
+    """保存结果测试"""
+
+    def test_output_order_is_stable_between_runs(self, manager, tmp_path):
+        """测试再次保存时已有节点保持原位置，新节点追加在末尾"""
+        a = "trojan://pw@a.com:443#HK01"
+        b = "trojan://pw@b.com:443#JP02"
+        c = "trojan://pw@c.com:443#US03"
+        assert manager.save_results({"s1": site(b, a)})
+        first = read_lines(tmp_path / "result" / "nodetotal.txt")
+
+        # 站点顺序和节点顺序变化、加入新节点、删除旧节点
+        assert manager.save_results({"s2": site(c), "s1": site(a)})
+        second = read_lines(tmp_path / "result" / "nodetotal.txt")
+
+        assert sorted(first) == [a, b]
+        assert second == [a, c]
+        dated = [p for p in (tmp_path / "result").iterdir() if p.is_dir()]
+        assert read_lines(dated[0] / "nodetotal.txt") == second
+
+    def test_same_input_produces_identical_file(self, manager, tmp_path):
+        """测试相同的节点集合以不同顺序输入时输出完全相同"""
+        nodes = [f"trojan://pw@n{i}.com:443#Node{i:02d}" for i in range(20)]
+        manager.save_results({"s": site(*nodes)})
+        first = read_lines(tmp_path / "result" / "nodetotal.txt")
+        manager.save_results({"s": site(*reversed(nodes))})
+        assert read_lines(tmp_path / "result" / "nodetotal.txt") == first
+
+
+class TestDeltaFiles:
+    """新增/删除节点文件测试"""
+
+    def test_added_and_removed_against_previous_snapshot(self, manager, tmp_path):
+        """测试新增和删除的节点写入 added.txt/removed.txt，改名的节点不算变化"""
+        a = "trojan://pw@a.com:443#HK01"
+        b = "trojan://pw@b.com:443#JP02"
+        c = "trojan://pw@c.com:443#US03"
+        manager.save_results({"s": site(a, b)})
+        result_dir = tmp_path / "result"
+        assert sorted(read_lines(result_dir / "added.txt")) == [a, b]
+        assert read_lines(result_dir / "removed.txt") == []
+
+        renamed_a = "trojan://pw@a.com:443#HK99"
+        manager.save_results({"s": site(renamed_a, c)})
+        assert read_lines(result_dir / "added.txt") == [c]
+        assert read_lines(result_dir / "removed.txt") == [b]
+        dated = [p for p in result_dir.iterdir() if p.is_dir()][0]
+        assert read_lines(dated / "added.txt") == [c]
+        assert read_lines(dated / "removed.txt") == [b]
+
+    def test_index_is_used_without_reparsing(self, manager, tmp_path, monkeypatch):
+        """测试索引与节点文件一致时不重新计算上一次的指纹"""
+        nodes = [f"trojan://pw@n{i}.com:443#Node{i:02d}" for i in range(5)]
+        manager.save_results({"s": site(*nodes)})
+        total_file = str(tmp_path / "result" / "nodetotal.txt")
+        index_file = str(tmp_path / "result" / "nodetotal.idx")
+        saved = read_lines(total_file)
+        assert read_lines(index_file)[1:] == [node_key(node) for node in saved]
+
+        def fail(uri):
+            raise AssertionError("previous snapshot was re-parsed")
+
+        monkeypatch.setattr(result_manager_module, "node_key", fail)
+        previous_nodes, previous_keys = manager._load_previous_snapshot(total_file, index_file)
+        assert previous_nodes == saved
+        assert previous_keys == [node_key(node) for node in saved]
+
+    def test_stale_index_falls_back_to_fingerprints(self, manager, tmp_path):
+        """测试节点文件被修改后不使用过期的索引"""
+        a = "trojan://pw@a.com:443#HK01"
+        b = "trojan://pw@b.com:443#JP02"
+        manager.save_results({"s": site(a)})
+        (tmp_path / "result" / "nodetotal.txt").write_text(f"{b}\n", encoding="utf-8")
+
+        manager.save_results({"s": site(a)})
+        assert read_lines(tmp_path / "result" / "added.txt") == [a]
+        assert read_lines(tmp_path / "result" / "removed.txt") == [b]
+
+
+class TestArchive:
+    """结果归档测试"""
+
+    def test_appends_day_once_archive_exists(self, manager, tmp_path):
+        """测试迁移过归档后每次保存都追加当天的目录，没有归档时不创建"""
+        from src.core.result_archive import ResultArchive
+
+        manager.save_results({"s": site("trojan://pw@a.com:443#HK01")})
+        assert not (tmp_path / "result" / "archive").exists()
+
+        ResultArchive(str(tmp_path / "result" / "archive")).append_day("20000101", [])
+        manager.save_results({"s": site("trojan://pw@b.com:443#JP02")})
+        archive = ResultArchive(str(tmp_path / "result" / "archive"))
+        assert len(archive.days()) == 2
+        assert archive.read_nodes(archive.days()[-1]) == ["trojan://pw@b.com:443#JP02"]
+
+
+class TestNodeStore:
+    """节点数据库测试"""
+
+    def test_save_records_run_with_sources(self, manager, tmp_path, monkeypatch):
+        """测试保存结果时把节点和来源写入 DATABASE_URL 指向的数据库"""
+        from src.core.node_store import NodeStore
+
+        database_url = f"sqlite:///{tmp_path / 'nodes.db'}"
+        monkeypatch.setattr(result_manager_module, "DATABASE_URL", database_url)
+        a = "trojan://pw@a.com:443#HK01"
+        results = {"s": dict(site(a), node_sources={a: "https://s/sub"})}
+        assert manager.save_results(results)
+
+        with NodeStore(database_url) as store:
+            assert store.conn.execute("SELECT uri FROM nodes").fetchall() == [(a,)]
+            assert store.conn.execute(
+                "SELECT site, subscription_url FROM sightings"
+            ).fetchall() == [("s", "https://s/sub")]
@@ -9,7 +9,7 @@ import pytest
 import sys
 import os
 import base64
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -37,7 +37,7 @@ class TestSubscriptionParser:
         # 创建模拟响应
         mock_response = Mock()
         vmess_nodes = "vmess://eyJ2IjoiMiJ9\nvless://uuid@example.com:443"
-        mock_response.text = base64.b64encode(vmess_nodes.encode()).decode()
+        mock_response.content = base64.b64encode(vmess_nodes.encode())
         mock_response.raise_for_status = Mock()
         mock_session.get.return_value = mock_response
 
@@ -61,7 +61,7 @@ proxies:
     cipher: auto
     network: tcp
 """
-        mock_response.text = yaml_content
+        mock_response.content = yaml_content.encode()
         mock_response.raise_for_status = Mock()
         mock_session.get.return_value = mock_response
 
@@ -75,7 +75,7 @@ proxies:
         """测试解析空订阅"""
         # 创建模拟响应
         mock_response = Mock()
-        mock_response.text = ""
+        mock_response.content = b""
         mock_response.raise_for_status = Mock()
         mock_session.get.return_value = mock_response
 
@@ -88,7 +88,7 @@ proxies:
         """测试解析无效订阅"""
         # 创建模拟响应
         mock_response = Mock()
-        mock_response.text = "这是一些无效的订阅内容"
+        mock_response.content = "这是一些无效的订阅内容".encode()
         mock_response.raise_for_status = Mock()
         mock_session.get.return_value = mock_response
 
@@ -141,7 +141,7 @@ proxies:
         vmess_uri = "vmess://eyJ2IjoiMiJ9"
         first_encode = base64.b64encode(vmess_uri.encode()).decode()
         second_encode = base64.b64encode(first_encode.encode()).decode()
-        mock_response.text = second_encode
+        mock_response.content = second_encode.encode()
         mock_response.raise_for_status = Mock()
         mock_session.get.return_value = mock_response
 
@@ -158,7 +158,7 @@ proxies:
         from urllib.parse import quote
         vmess_uri = "vmess://eyJ2IjoiMiJ9"
         encoded = quote(vmess_uri)
-        mock_response.text = encoded
+        mock_response.content = encoded.encode()
         mock_response.raise_for_status = Mock()
         mock_session.get.return_value = mock_response
 
@@ -177,7 +177,7 @@ proxies:
         vless://uuid@example.com:443
         trojan://password@example.com:443
         """
-        mock_response.text = mixed_content
+        mock_response.content = mixed_content.encode()
         mock_response.raise_for_status = Mock()
         mock_session.get.return_value = mock_response
 
@@ -186,6 +186,51 @@ proxies:
 
         assert len(nodes) > 0
 
+    def test_fetch_returns_raw_bytes(self, parser, mock_session):
+        """测试获取订阅内容时不访问 response.text（不做编码检测）"""
+        mock_response = Mock()
+        mock_response.content = b"  \xef\xbb\xbftrojan://password@example.com:443#node  \n"
+        type(mock_response).text = PropertyMock(side_effect=AssertionError("response.text"))
+        mock_session.get.return_value = mock_response
+
+        response = parser._fetch_subscription_response("http://example.com/sub", mock_session)
+        nodes = parser.parse_subscription_url("http://example.com/sub", mock_session)
+
+        assert response.content.strip() == b"\xef\xbb\xbftrojan://password@example.com:443#node"
+        assert nodes == ["trojan://password@example.com:443#node"]
+
+
+class TestSubscriptionHttpCache:
+    """订阅内容的HTTP缓存测试"""
+
+    @staticmethod
+    def make_response(body: bytes):
+        import requests
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers["ETag"] = '"v1"'
+        return response
+
+    def test_only_responses_with_nodes_are_cached(self, tmp_path):
+        """测试空内容和解析不出节点的内容不写入缓存，解析出节点后才写入"""
+        from src.core.http_cache import HttpCache
+
+        cache = HttpCache(tmp_path, ttl=0)
+        parser = SubscriptionParser(http_cache=cache)
+        session = Mock()
+
+        for body in (b"   ", b"<html>not a subscription</html>"):
+            session.get.return_value = self.make_response(body)
+            assert parser.parse_subscription_url("http://example.com/sub", session) == []
+            assert cache.lookup("http://example.com/sub") is None
+
+        body = b"trojan://password@example.com:443#node"
+        session.get.return_value = self.make_response(body)
+        assert parser.parse_subscription_url("http://example.com/sub", session)
+        assert cache.lookup("http://example.com/sub").body == body
+
 
 # 导入 NetworkError
 from src.core.exceptions import NetworkError
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：url_utils
+测试URL规范化
+"""
+
+import pytest
+import sys
+import os
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.utils.url_utils import canonicalize_url
+
+
+class TestCanonicalizeUrl:
+    """URL规范化测试"""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("HTTPS://Example.COM/sub.txt", "https://example.com/sub.txt"),
+            ("https://example.com:443/sub.txt", "https://example.com/sub.txt"),
+            ("http://example.com:8080/sub.txt", "http://example.com:8080/sub.txt"),
+            ("https://example.com/sub.txt#frag", "https://example.com/sub.txt"),
+            ("https://example.com", "https://example.com/"),
+            (
+                "https://example.com/sub.txt?utm_source=tg&token=abc&fbclid=1",
+                "https://example.com/sub.txt?token=abc",
+            ),
+            ("https://example.com/s?b=2&a=1", "https://example.com/s?a=1&b=2"),
+        ],
+    )
+    def test_canonicalize(self, url, expected):
+        """测试规范化规则"""
+        assert canonicalize_url(url) == expected
+
+    def test_path_case_preserved(self):
+        """测试路径大小写保持不变"""
+        assert canonicalize_url("https://example.com/Sub.TXT") == "https://example.com/Sub.TXT"
+
+    def test_unparseable_returned_as_is(self):
+        """测试无法解析的URL原样返回"""
+        assert canonicalize_url(" not a url ") == "not a url"
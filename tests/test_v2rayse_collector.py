@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试：v2rayse_collector
+测试从接口响应中提取节点和接口响应捕获
+"""
+
+import asyncio
+import base64
+import json
+import pytest
+import sys
+import os
+from urllib.parse import quote
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+pytest.importorskip("playwright")
+
+from src.v2rayse_collector import ApiNodeCapture, extract_nodes_from_payload
+from src.utils.logger import get_logger
+
+VLESS = "vless://12345678-1234-1234-1234-123456789abc@example.com:443?security=tls#US"
+TROJAN = "trojan://password@example.org:443?sni=example.org#JP"
+VMESS = "vmess://" + base64.b64encode(b'{"v":"2","add":"example.net","port":"443"}').decode()
+
+
+class TestExtractNodesFromPayload:
+    """接口数据节点提取测试"""
+
+    def test_json_string_fields(self):
+        """测试从JSON字段中提取节点链接"""
+        payload = json.dumps(
+            {"code": 0, "data": {"list": [{"name": "US", "link": VLESS}, {"name": "JP", "link": TROJAN}]}}
+        )
+
+        assert extract_nodes_from_payload(payload) == [VLESS, TROJAN]
+
+    def test_json_clash_proxies(self, sample_trojan_config):
+        """测试JSON中的Clash代理配置转换为节点"""
+        payload = json.dumps({"data": [sample_trojan_config]})
+
+        nodes = extract_nodes_from_payload(payload)
+
+        assert len(nodes) == 1
+        assert nodes[0].startswith("trojan://test_password@example.com:443")
+
+    def test_base64_subscription(self):
+        """测试Base64订阅格式"""
+        payload = base64.b64encode(f"{VLESS}\n{TROJAN}\n".encode()).decode()
+
+        assert extract_nodes_from_payload(payload) == [VLESS, TROJAN]
+
+    def test_url_encoded_field(self):
+        """测试JSON字段中的URL编码订阅内容（由统一订阅解码器处理）"""
+        payload = json.dumps({"data": quote(f"{VLESS}\n{TROJAN}\n", safe="")})
+
+        assert extract_nodes_from_payload(payload) == [VLESS, TROJAN]
+
+    def test_vmess_not_matched_as_ss_and_deduplicated(self):
+        """测试 vmess:// 不会被重复识别为 ss://，重复节点只保留一个"""
+        payload = f"{VMESS}\n{VMESS}\n"
+
+        assert extract_nodes_from_payload(payload) == [VMESS]
+
+    def test_unrelated_payload(self):
+        """测试不包含节点的接口响应"""
+        assert extract_nodes_from_payload(json.dumps({"user": "guest", "ads": []})) == []
+        assert extract_nodes_from_payload("<html>ok</html>") == []
+
+
+class FakeRequest:
+    """模拟请求"""
+
+    def __init__(self, resource_type):
+        self.resource_type = resource_type
+
+
+class FakeResponse:
+    """模拟响应"""
+
+    def __init__(self, url, body, resource_type="xhr", ok=True):
+        self.url = url
+        self.request = FakeRequest(resource_type)
+        self.ok = ok
+        self._body = body
+
+    async def text(self):
+        return self._body
+
+
+class FakePage:
+    """模拟页面"""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def emit(self, response):
+        self.handlers["response"](response)
+
+
+class TestApiNodeCapture:
+    """接口响应捕获测试"""
+
+    def test_captures_nodes_from_api_response(self):
+        """测试等待到包含节点的接口响应后立即返回"""
+
+        async def scenario():
+            page = FakePage()
+            capture = ApiNodeCapture(get_logger("test"), settle=0.1)
+            capture.attach(page)
+
+            page.emit(FakeResponse("https://www.v2rayse.com/logo.png", VLESS, resource_type="image"))
+            page.emit(FakeResponse("https://www.v2rayse.com/api/user", json.dumps({"user": "guest"})))
+            page.emit(FakeResponse("https://www.v2rayse.com/api/error", VLESS, ok=False))
+            page.emit(FakeResponse("https://www.v2rayse.com/api/nodes", json.dumps([VLESS, TROJAN])))
+
+            found = await capture.wait(5)
+            return found, capture
+
+        found, capture = asyncio.run(scenario())
+
+        assert found is True
+        assert capture.nodes == [VLESS, TROJAN]
+        assert capture.source_url == "https://www.v2rayse.com/api/nodes"
+
+    def test_waits_for_larger_table_response(self):
+        """测试首次捕获到少量节点后继续等待，返回之后到达的填充表格的更大响应"""
+
+        async def scenario():
+            page = FakePage()
+            capture = ApiNodeCapture(get_logger("test"), settle=0.5)
+            capture.attach(page)
+            page.emit(FakeResponse("https://www.v2rayse.com/api/notice", json.dumps([VLESS])))
+
+            async def table_response():
+                await asyncio.sleep(0.2)
+                page.emit(FakeResponse("https://www.v2rayse.com/api/nodes", json.dumps([VLESS, TROJAN])))
+
+            asyncio.ensure_future(table_response())
+            found = await capture.wait(5)
+            return found, capture
+
+        found, capture = asyncio.run(scenario())
+
+        assert found is True
+        assert capture.nodes == [VLESS, TROJAN]
+        assert capture.source_url == "https://www.v2rayse.com/api/nodes"
+
+    def test_wait_times_out_without_nodes(self):
+        """测试没有接口返回节点时超时返回False"""
+
+        async def scenario():
+            page = FakePage()
+            capture = ApiNodeCapture(get_logger("test"))
+            capture.attach(page)
+            page.emit(FakeResponse("https://www.v2rayse.com/api/user", "{}"))
+            return await capture.wait(0.1)
+
+        assert asyncio.run(scenario()) is False